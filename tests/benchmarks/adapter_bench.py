@@ -0,0 +1,222 @@
+"""Замер пропускной способности адаптеров на записанных сообщениях и ответах REST, без сети.
+
+Запуск:
+    python tests/benchmarks/adapter_bench.py [--exchanges binance,okx] [--adapters trades,depth]
+        [--seconds 0.5]
+
+Для каждой биржи берутся записи из `tests/fixtures/<exchange>/`:
+    - `ws_<метод>.json` — список сообщений вебсокета для метода `Adapter.<метод>`;
+    - `rest_*.json` — ответ REST для bulk-адаптера, который вызывает унифицированный клиент.
+
+Каждый адаптер вызывается по кругу на своих записях. Выводятся сообщения в секунду,
+микросекунды на сообщение и, в отдельном проходе под `tracemalloc`, число выделенных блоков
+и байт, оставшихся в результате на одно сообщение, а также пиковая временная память вызова.
+Этого достаточно, чтобы сравнить изменения в `catch_adapter_errors`, разборе чисел и
+сортировках до и после.
+"""
+
+import argparse
+import importlib
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import orjson
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from fake_exchange import FIXTURES_DIR  # noqa: E402
+
+from unicex import Exchange, get_exchange_info  # noqa: E402
+from unicex.types import TickerInfoItem  # noqa: E402
+
+REST_ADAPTERS: dict[Exchange, dict[str, tuple[str, dict[str, Any]]]] = {
+    Exchange.ASTER: {
+        "rest_futures_ticker_24hr": ("ticker_24hr", {}),
+        "rest_futures_klines": ("klines", {"symbol": "BTCUSDT"}),
+    },
+    Exchange.BINANCE: {
+        "rest_futures_ticker_24hr": ("ticker_24hr", {}),
+        "rest_futures_klines": ("klines", {"symbol": "BTCUSDT"}),
+    },
+    Exchange.BINGX: {
+        "rest_futures_ticker_24hr": ("ticker_24hr", {}),
+        "rest_futures_klines": ("klines", {}),
+    },
+    Exchange.BITGET: {
+        "rest_futures_ticker_24hr": ("ticker_24hr", {}),
+        "rest_futures_klines": ("klines", {"symbol": "BTCUSDT"}),
+    },
+    Exchange.BYBIT: {
+        "rest_futures_ticker_24hr": ("ticker_24hr", {}),
+        "rest_futures_klines": ("klines", {}),
+    },
+    Exchange.GATE: {
+        "rest_futures_ticker_24hr": ("futures_ticker_24hr", {}),
+        "rest_klines": ("klines", {"symbol": "BTC_USDT"}),
+    },
+    Exchange.HYPERLIQUID: {
+        "rest_futures_ticker_24hr": ("futures_ticker_24hr", {}),
+        "rest_futures_klines": ("futures_klines", {}),
+    },
+    Exchange.KUCOIN: {
+        "rest_futures_ticker_24hr": ("ticker_24hr", {}),
+        "rest_futures_klines": ("klines", {"symbol": "XBTUSDTM"}),
+    },
+    Exchange.MEXC: {
+        "rest_futures_ticker_24hr": ("futures_ticker_24hr", {}),
+        "rest_futures_klines": ("futures_klines", {"symbol": "BTC_USDT"}),
+    },
+    Exchange.OKX: {
+        "rest_futures_ticker_24hr": ("futures_ticker_24hr", {}),
+        "rest_futures_klines": ("klines", {"symbol": "BTC-USDT-SWAP"}),
+    },
+}
+"""Ответы REST и bulk-адаптеры, которыми их разбирает унифицированный клиент: файл -> (метод, аргументы)."""
+
+WS_KWARGS: dict[tuple[Exchange, str], dict[str, Any]] = {
+    (Exchange.HYPERLIQUID, "partial_book_depth_message"): {"limit": 20},
+}
+"""Дополнительные аргументы адаптеров сообщений, которые передает вебсокет-менеджер."""
+
+WS_FACTORIES: set[tuple[Exchange, str]] = {
+    (Exchange.BYBIT, "partial_book_depth_message"),
+}
+"""Адаптеры сообщений, которые возвращают обработчик с состоянием (например, стакан из дельт)."""
+
+CONTRACT_SIZES: dict[Exchange, dict[str, float]] = {
+    Exchange.GATE: {"BTC_USDT": 0.0001},
+    Exchange.MEXC: {"BTC_USDT": 0.0001},
+    Exchange.OKX: {"BTC-USDT-SWAP": 0.01},
+}
+"""Размеры контрактов, которые адаптеры берут из `ExchangeInfo` (без сети он не загружен)."""
+
+
+def seed_contract_sizes(exchange: Exchange) -> None:
+    """Заполняет `ExchangeInfo` биржи размерами контрактов для записанных тикеров."""
+    sizes = CONTRACT_SIZES.get(exchange)
+    if not sizes:
+        return
+    get_exchange_info(exchange)._futures_tickers_info = {  # type: ignore[attr-defined]
+        symbol: TickerInfoItem(
+            tick_precision=None,
+            tick_step=0.1,
+            size_precision=None,
+            size_step=size,
+            contract_size=size,
+        )
+        for symbol, size in sizes.items()
+    }
+
+
+def cases(exchange: Exchange) -> dict[str, tuple[Callable[[Any], Any], list[Any]]]:
+    """Возвращает замеряемые адаптеры биржи: имя -> (обработчик одного сообщения, записи)."""
+    adapter = importlib.import_module(f"unicex.{exchange.value.lower()}.adapter").Adapter
+    directory = FIXTURES_DIR / exchange.value.lower()
+    result: dict[str, tuple[Callable[[Any], Any], list[Any]]] = {}
+
+    for path in sorted(directory.glob("ws_*.json")):
+        name = path.stem.removeprefix("ws_")
+        method = getattr(adapter, name)
+        if (exchange, name) in WS_FACTORIES:
+            method = method()
+        kwargs = WS_KWARGS.get((exchange, name), {})
+        handler = (lambda m, kw: lambda msg: m(msg, **kw))(method, kwargs) if kwargs else method
+        result[name] = (handler, orjson.loads(path.read_bytes()))
+
+    for fixture, (name, kwargs) in REST_ADAPTERS[exchange].items():
+        method = getattr(adapter, name)
+        raw_data = orjson.loads((directory / f"{fixture}.json").read_bytes())
+        result[f"{name} ({fixture})"] = (
+            (lambda m, kw: lambda data: m(data, **kw))(method, kwargs),
+            [raw_data],
+        )
+    return result
+
+
+def measure_throughput(
+    handler: Callable[[Any], Any], messages: list[Any], seconds: float
+) -> tuple[float, float]:
+    """Гоняет обработчик по записям не меньше `seconds` и возвращает (сообщ/с, мкс/сообщ)."""
+    count = 0
+    started = time.perf_counter()
+    deadline = started + seconds
+    while True:
+        for message in messages:
+            handler(message)
+        count += len(messages)
+        if time.perf_counter() >= deadline:
+            break
+    elapsed = time.perf_counter() - started
+    return count / elapsed, elapsed / count * 1_000_000
+
+
+def measure_allocations(
+    handler: Callable[[Any], Any], messages: list[Any]
+) -> tuple[float, float, int]:
+    """Возвращает (блоков/сообщ, байт/сообщ) в результатах и пиковую временную память вызова."""
+    ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot().filter_traces(ignore)
+        results: list[Any] = []
+        peak = 0
+        for message in messages:
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            results.append(handler(message))
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - current)
+        after = tracemalloc.take_snapshot().filter_traces(ignore)
+    finally:
+        tracemalloc.stop()
+    diff = after.compare_to(before, "filename")
+    blocks = sum(stat.count_diff for stat in diff)
+    size = sum(stat.size_diff for stat in diff)
+    return blocks / len(messages), size / len(messages), peak
+
+
+def bench_exchange(exchange: Exchange, args: argparse.Namespace) -> None:
+    """Замеряет все адаптеры одной биржи."""
+    seed_contract_sizes(exchange)
+    for name, (handler, messages) in cases(exchange).items():
+        if args.adapters and not any(part in name for part in args.adapters.split(",")):
+            continue
+        try:
+            handler(messages[0])
+        except Exception as e:
+            print(f"{exchange.value.lower():<12}{name:<52}error: {e!r:.80}")
+            continue
+        rate, per_call = measure_throughput(handler, messages, args.seconds)
+        blocks, size, peak = measure_allocations(handler, messages)
+        print(
+            f"{exchange.value.lower():<12}{name:<52}{rate:>12.0f}{per_call:>10.2f}"
+            f"{blocks:>10.1f}{size:>12.0f}{peak:>12}"
+        )
+
+
+def main() -> None:
+    """Main entry point for the application."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--exchanges", default=",".join(e.value.lower() for e in Exchange))
+    parser.add_argument("--adapters", default="", help="Подстроки имен адаптеров через запятую")
+    parser.add_argument("--seconds", type=float, default=0.5)
+    args = parser.parse_args()
+
+    # Ошибки разбора отдельных уровней стакана логируются, а не пробрасываются
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    print(
+        f"{'exchange':<12}{'adapter':<52}{'msg/s':>12}{'µs/msg':>10}"
+        f"{'blocks':>10}{'bytes':>12}{'peak, B':>12}"
+    )
+    for name in args.exchanges.split(","):
+        bench_exchange(Exchange(name.strip().upper()), args)
+
+
+if __name__ == "__main__":
+    main()
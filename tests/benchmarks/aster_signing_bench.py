@@ -0,0 +1,123 @@
+"""Сравнение старой (encode_typed_data на каждый запрос) и новой (Eip712Signer) подписи Aster V3.
+
+Запуск:
+    python tests/benchmarks/aster_signing_bench.py
+
+Выводит время хэширования EIP-712 сообщения и количество подписей в секунду для обоих
+путей, а также максимальную задержку event loop при подписи пачки запросов в loop
+и в `ThreadPoolExecutor`. Без установленного `coincurve` время подписи определяется
+ECDSA на чистом Python (`eth_keys`), а не хэшированием.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from eth_account import Account
+from eth_account.messages import _hash_eip191_message, encode_typed_data
+
+from unicex.aster import Client
+
+ROUNDS = 300
+BATCH = 100
+MESSAGE = (
+    "symbol=BTCUSDT&side=BUY&type=LIMIT&quantity=0.001&price=61234.5&timeInForce=GTC"
+    "&signer=0x0000000000000000000000000000000000000001&nonce=1759670527594123"
+)
+
+
+def legacy_typed_data(client: Client, msg: str) -> dict:
+    """Прежняя структура typed_data, которая собиралась на каждый запрос."""
+    return {
+        "types": {
+            "EIP712Domain": [
+                {"name": "name", "type": "string"},
+                {"name": "version", "type": "string"},
+                {"name": "chainId", "type": "uint256"},
+                {"name": "verifyingContract", "type": "address"},
+            ],
+            "Message": [{"name": "msg", "type": "string"}],
+        },
+        "primaryType": "Message",
+        "domain": {
+            "name": client._SIGN_DOMAIN_NAME,
+            "version": "1",
+            "chainId": client._SIGN_CHAIN_ID,
+            "verifyingContract": "0x0000000000000000000000000000000000000000",
+        },
+        "message": {"msg": msg},
+    }
+
+
+def legacy_hash(client: Client, msg: str) -> bytes:
+    """Прежнее хэширование: полная структура typed_data кодируется заново."""
+    return _hash_eip191_message(encode_typed_data(full_message=legacy_typed_data(client, msg)))
+
+
+def new_hash(client: Client, msg: str) -> bytes:
+    """Новое хэширование: хэшируется только сообщение."""
+    return client._eip712.hash_message({"msg": msg})  # type: ignore[union-attr]
+
+
+def legacy_sign(client: Client, msg: str) -> str:
+    """Прежняя подпись: полная структура typed_data собирается и кодируется заново."""
+    encoded = encode_typed_data(full_message=legacy_typed_data(client, msg))
+    signed = client._wallet.sign_message(encoded)  # type: ignore[union-attr]
+    sig = signed.signature.hex()
+    return sig if sig.startswith("0x") else f"0x{sig}"
+
+
+def calls_per_second(func, client: Client, rounds: int = ROUNDS) -> float:
+    """Возвращает количество вызовов в секунду."""
+    started = time.perf_counter()
+    for i in range(rounds):
+        func(client, f"{MESSAGE}{i}")
+    return rounds / (time.perf_counter() - started)
+
+
+async def max_loop_lag(client: Client) -> float:
+    """Подписывает пачку запросов и возвращает максимальную задержку event loop, мс."""
+    lag = 0.0
+    done = False
+
+    async def probe() -> None:
+        nonlocal lag
+        while not done:
+            started = time.perf_counter()
+            await asyncio.sleep(0.001)
+            lag = max(lag, time.perf_counter() - started - 0.001)
+
+    task = asyncio.create_task(probe())
+    await asyncio.sleep(0.01)
+    await asyncio.gather(
+        *(client._build_signed_query_async({"symbol": "BTCUSDT", "i": i}) for i in range(BATCH))
+    )
+    done = True
+    await task
+    return lag * 1000
+
+
+async def main() -> None:
+    """Main entry point for the application."""
+    private_key = Account.create().key
+    client = Client(None, private_key=private_key)  # type: ignore[arg-type]
+    assert legacy_hash(client, MESSAGE) == new_hash(client, MESSAGE)
+    assert legacy_sign(client, MESSAGE) == client._sign(MESSAGE)
+
+    old_hash_us = 1_000_000 / calls_per_second(legacy_hash, client, ROUNDS * 20)
+    new_hash_us = 1_000_000 / calls_per_second(new_hash, client, ROUNDS * 20)
+    old_rate = calls_per_second(legacy_sign, client)
+    new_rate = calls_per_second(Client._sign, client)
+    print(f"{'path':<24}{'hash, us':>10}{'sig/s':>10}")
+    print(f"{'encode_typed_data':<24}{old_hash_us:>10.1f}{old_rate:>10.0f}")
+    print(f"{'Eip712Signer':<24}{new_hash_us:>10.1f}{new_rate:>10.0f}")
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pooled = Client(None, private_key=private_key, signing_executor=executor)  # type: ignore[arg-type]
+        print(f"\nmax loop lag while signing {BATCH} requests:")
+        print(f"{'in event loop':<24}{await max_loop_lag(client):>10.1f} ms")
+        print(f"{'in executor':<24}{await max_loop_lag(pooled):>10.1f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,182 @@
+"""Сравнение подписи действий Hyperliquid в event loop и в пуле процессов.
+
+Запуск:
+    python tests/benchmarks/hyperliquid_signing_bench.py
+
+Сначала сверяет подписи `_ActionSigner` с эталонной подписью eth_account (`encode_typed_data` +
+`sign_message`) для L1 и user-signed действий. Затем подписывает пачку одновременных
+order/cancel/modify действий тремя способами: эталонным eth_account, в event loop и через
+`ProcessPoolExecutor`. Выводит общее время, максимальную задержку event loop и задержки
+по стадиям (hash, queue, sign, total).
+"""
+
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from eth_account import Account
+from eth_account.messages import encode_typed_data
+from eth_account.signers.local import LocalAccount
+from eth_utils.conversions import to_hex
+
+from unicex.hyperliquid import Client
+from unicex.hyperliquid.client import (
+    USD_SEND_SIGN_TYPES,
+    _action_hash,
+    _construct_phantom_agent,
+)
+
+BATCH = 60
+WORKERS = 4
+
+
+EIP712_DOMAIN_TYPES = [
+    {"name": "name", "type": "string"},
+    {"name": "version", "type": "string"},
+    {"name": "chainId", "type": "uint256"},
+    {"name": "verifyingContract", "type": "address"},
+]
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+
+def reference_sign(wallet: LocalAccount, data: dict) -> dict:
+    """Подписывает EIP-712 структуру через eth_account."""
+    signed = wallet.sign_message(encode_typed_data(full_message=data))
+    return {"r": to_hex(signed["r"]), "s": to_hex(signed["s"]), "v": signed["v"]}
+
+
+def reference_l1(wallet: LocalAccount, action: dict, nonce: int) -> dict:
+    """Эталонная подпись L1-действия в mainnet."""
+    phantom_agent = _construct_phantom_agent(_action_hash(action, None, nonce, None), True)
+    data = {
+        "domain": {
+            "name": "Exchange",
+            "version": "1",
+            "chainId": 1337,
+            "verifyingContract": ZERO_ADDRESS,
+        },
+        "types": {
+            "Agent": [
+                {"name": "source", "type": "string"},
+                {"name": "connectionId", "type": "bytes32"},
+            ],
+            "EIP712Domain": EIP712_DOMAIN_TYPES,
+        },
+        "primaryType": "Agent",
+        "message": phantom_agent,
+    }
+    return reference_sign(wallet, data)
+
+
+def reference_user_signed(wallet: LocalAccount, action: dict, primary_type: str) -> dict:
+    """Эталонная подпись user-signed действия в mainnet."""
+    message = {**action, "signatureChainId": "0x66eee", "hyperliquidChain": "Mainnet"}
+    data = {
+        "domain": {
+            "name": "HyperliquidSignTransaction",
+            "version": "1",
+            "chainId": 0x66EEE,
+            "verifyingContract": ZERO_ADDRESS,
+        },
+        "types": {primary_type: USD_SEND_SIGN_TYPES, "EIP712Domain": EIP712_DOMAIN_TYPES},
+        "primaryType": primary_type,
+        "message": message,
+    }
+    return reference_sign(wallet, data)
+
+
+def actions() -> list[dict]:
+    """Возвращает пачку действий: ордера, отмены и модификации."""
+    order = {
+        "a": 0,
+        "b": True,
+        "p": "61234.5",
+        "s": "0.001",
+        "r": False,
+        "t": {"limit": {"tif": "Gtc"}},
+    }
+    result = []
+    for i in range(BATCH):
+        match i % 3:
+            case 0:
+                result.append({"type": "order", "orders": [order], "grouping": "na"})
+            case 1:
+                result.append({"type": "cancel", "cancels": [{"a": 0, "o": 1000 + i}]})
+            case _:
+                result.append({"type": "batchModify", "modifies": [{"oid": i, "order": order}]})
+    return result
+
+
+async def run(client: Client, batch: list[dict]) -> tuple[float, float]:
+    """Подписывает пачку одновременно. Возвращает общее время и максимальную задержку loop, мс."""
+    lag = 0.0
+    done = False
+
+    async def probe() -> None:
+        nonlocal lag
+        while not done:
+            started = time.perf_counter()
+            await asyncio.sleep(0.001)
+            lag = max(lag, time.perf_counter() - started - 0.001)
+
+    task = asyncio.create_task(probe())
+    await asyncio.sleep(0.01)
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(
+            client._action_signer.sign_l1_action(action, None, i, None)  # type: ignore[union-attr]
+            for i, action in enumerate(batch)
+        )
+    )
+    elapsed = time.perf_counter() - started
+    done = True
+    await task
+    return elapsed * 1000, lag * 1000
+
+
+def print_stages(client: Client) -> None:
+    """Печатает задержки по стадиям."""
+    for stage, stats in client.signing_stats().items():
+        print(f"    {stage:<8}avg {stats['avg_ms']:>8.2f} ms   max {stats['max_ms']:>8.2f} ms")
+
+
+async def main() -> None:
+    """Main entry point for the application."""
+    private_key = Account.create().key
+    batch = actions()
+
+    inline = Client(None, private_key=private_key)  # type: ignore[arg-type]
+    wallet = inline._wallet
+    signer = inline._action_signer
+    for i, action in enumerate(batch):
+        expected = reference_l1(wallet, action, i)  # type: ignore[arg-type]
+        assert await signer.sign_l1_action(action, None, i, None) == expected  # type: ignore[union-attr]
+    usd_send = {"destination": ZERO_ADDRESS, "amount": "1.5", "time": 1700000000000}
+    primary_type = "HyperliquidTransaction:UsdSend"
+    expected = reference_user_signed(wallet, usd_send, primary_type)  # type: ignore[arg-type]
+    signature = await signer.sign_user_signed_action(  # type: ignore[union-attr]
+        dict(usd_send), USD_SEND_SIGN_TYPES, primary_type, True
+    )
+    assert signature == expected
+
+    started = time.perf_counter()
+    for i, action in enumerate(batch):
+        reference_l1(wallet, action, i)  # type: ignore[arg-type]
+    print(f"{'eth_account reference':<28}total {(time.perf_counter() - started) * 1000:>8.1f} ms")
+
+    inline = Client(None, private_key=private_key)  # type: ignore[arg-type]
+    total, lag = await run(inline, batch)
+    print(f"{'event loop':<28}total {total:>8.1f} ms   loop lag {lag:>8.1f} ms")
+    print_stages(inline)
+
+    with ProcessPoolExecutor(max_workers=WORKERS) as executor:
+        pooled = Client(None, private_key=private_key, signing_executor=executor)  # type: ignore[arg-type]
+        await run(pooled, batch[:WORKERS])  # прогрев процессов и кэша ключа
+        pooled = Client(None, private_key=private_key, signing_executor=executor)  # type: ignore[arg-type]
+        total, lag = await run(pooled, batch)
+        print(f"{f'process pool x{WORKERS}':<28}total {total:>8.1f} ms   loop lag {lag:>8.1f} ms")
+        print_stages(pooled)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,151 @@
+"""Сравнение старого (text + json.loads) и нового (bytes + orjson.loads) разбора ответов BaseClient.
+
+Запуск:
+    python tests/benchmarks/response_decoding_bench.py [path/to/recorded/*.json ...]
+
+Если пути к записанным ответам не переданы, используются синтетические ответы
+в формате Binance `/fapi/v1/premiumIndex`, OKX `get_tickers(SWAP)` и Bitget tickers.
+"""
+
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+import orjson
+
+ROUNDS = 20
+
+
+def premium_index_payload(n: int = 700) -> bytes:
+    """Ответ в формате Binance /fapi/v1/premiumIndex."""
+    return orjson.dumps(
+        [
+            {
+                "symbol": f"COIN{i}USDT",
+                "markPrice": f"{random.uniform(0.001, 100000):.8f}",
+                "indexPrice": f"{random.uniform(0.001, 100000):.8f}",
+                "estimatedSettlePrice": f"{random.uniform(0.001, 100000):.8f}",
+                "lastFundingRate": f"{random.uniform(-0.001, 0.001):.8f}",
+                "interestRate": "0.00010000",
+                "nextFundingTime": 1759680000000,
+                "time": 1759670527594,
+            }
+            for i in range(n)
+        ]
+    )
+
+
+def okx_tickers_payload(n: int = 300) -> bytes:
+    """Ответ в формате OKX /api/v5/market/tickers?instType=SWAP."""
+    return orjson.dumps(
+        {
+            "code": "0",
+            "msg": "",
+            "data": [
+                {
+                    "instType": "SWAP",
+                    "instId": f"COIN{i}-USDT-SWAP",
+                    "last": f"{random.uniform(0.001, 100000):.6f}",
+                    "lastSz": "1",
+                    "askPx": f"{random.uniform(0.001, 100000):.6f}",
+                    "askSz": "12",
+                    "bidPx": f"{random.uniform(0.001, 100000):.6f}",
+                    "bidSz": "7",
+                    "open24h": f"{random.uniform(0.001, 100000):.6f}",
+                    "high24h": f"{random.uniform(0.001, 100000):.6f}",
+                    "low24h": f"{random.uniform(0.001, 100000):.6f}",
+                    "volCcy24h": f"{random.uniform(0, 1e7):.4f}",
+                    "vol24h": f"{random.uniform(0, 1e7):.0f}",
+                    "ts": "1759670527594",
+                    "sodUtc0": "1.0",
+                    "sodUtc8": "1.0",
+                }
+                for i in range(n)
+            ],
+        }
+    )
+
+
+def bitget_tickers_payload(n: int = 500) -> bytes:
+    """Ответ в формате Bitget /api/v2/mix/market/tickers."""
+    return orjson.dumps(
+        {
+            "code": "00000",
+            "msg": "success",
+            "requestTime": 1759670527594,
+            "data": [
+                {
+                    "symbol": f"COIN{i}USDT",
+                    "lastPr": f"{random.uniform(0.001, 100000):.6f}",
+                    "askPr": f"{random.uniform(0.001, 100000):.6f}",
+                    "bidPr": f"{random.uniform(0.001, 100000):.6f}",
+                    "bidSz": "1.2",
+                    "askSz": "0.4",
+                    "high24h": f"{random.uniform(0.001, 100000):.6f}",
+                    "low24h": f"{random.uniform(0.001, 100000):.6f}",
+                    "ts": "1759670527594",
+                    "change24h": "0.0123",
+                    "baseVolume": f"{random.uniform(0, 1e7):.4f}",
+                    "quoteVolume": f"{random.uniform(0, 1e7):.4f}",
+                    "usdtVolume": f"{random.uniform(0, 1e7):.4f}",
+                    "openUtc": "1.0",
+                    "changeUtc24h": "0.001",
+                    "indexPrice": f"{random.uniform(0.001, 100000):.6f}",
+                    "fundingRate": "0.0001",
+                    "holdingAmount": f"{random.uniform(0, 1e7):.4f}",
+                    "deliveryStartTime": None,
+                    "deliveryTime": None,
+                    "deliveryStatus": "",
+                    "open24h": "1.0",
+                    "markPrice": f"{random.uniform(0.001, 100000):.6f}",
+                }
+                for i in range(n)
+            ],
+        }
+    )
+
+
+def old_path(body: bytes) -> object:
+    """Старый путь: декодирование в str и разбор stdlib json."""
+    text = body.decode("utf-8")
+    return json.loads(text)
+
+
+def new_path(body: bytes) -> object:
+    """Новый путь: разбор сырых байт через orjson."""
+    return orjson.loads(body)
+
+
+def measure(func, body: bytes) -> float:
+    """Возвращает среднее время одного вызова в миллисекундах."""
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        func(body)
+    return (time.perf_counter() - started) / ROUNDS * 1000
+
+
+def main() -> None:
+    """Main entry point for the application."""
+    if len(sys.argv) > 1:
+        payloads = {Path(p).name: Path(p).read_bytes() for p in sys.argv[1:]}
+    else:
+        payloads = {
+            "binance premiumIndex": premium_index_payload(),
+            "okx tickers SWAP": okx_tickers_payload(),
+            "bitget tickers": bitget_tickers_payload(),
+        }
+
+    print(f"{'payload':<28}{'size, KB':>10}{'old, ms':>10}{'new, ms':>10}{'speedup':>10}")
+    for name, body in payloads.items():
+        assert old_path(body) == new_path(body)
+        old_ms = measure(old_path, body)
+        new_ms = measure(new_path, body)
+        print(
+            f"{name:<28}{len(body) / 1024:>10.1f}{old_ms:>10.3f}{new_ms:>10.3f}{old_ms / new_ms:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
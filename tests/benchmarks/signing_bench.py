@@ -0,0 +1,139 @@
+"""Сравнение старой (hmac.new + urlencode) и новой (HmacSigner + однопроходный query string) подписи.
+
+Запуск:
+    python tests/benchmarks/signing_bench.py
+
+Для каждой биржи подписывается типовой запрос на создание ордера. Перед замером
+проверяется, что подписи старого и нового пути совпадают.
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import time
+from collections.abc import Callable
+from urllib.parse import urlencode
+
+from unicex.binance import Client as BinanceClient
+from unicex.bitget import Client as BitgetClient
+from unicex.bybit import Client as BybitClient
+from unicex.gate import Client as GateClient
+from unicex.mexc import Client as MexcClient
+from unicex.okx import Client as OkxClient
+from unicex.utils import dict_to_query_string
+
+ROUNDS = 50_000
+API_KEY = "vmPUZE6mv9SD5VNHk4HlWFsOr6aKE2zvsw0MuIgwCIPy6utIco14y7Ju91duEh8A"
+API_SECRET = "NhqPtmdSJYdKjVHjA7PZj4Mge3R5YNiP1e3UZjInClVN65XAbvqqM6A7H5fATj0j"
+TIMESTAMP = "1759670527594"
+
+ORDER = {
+    "symbol": "BTCUSDT",
+    "side": "BUY",
+    "type": "LIMIT",
+    "timeInForce": "GTC",
+    "quantity": "0.001",
+    "price": "61234.5",
+    "newClientOrderId": "my order/1",
+    "timestamp": int(TIMESTAMP),
+    "recvWindow": 5000,
+}
+
+
+QUERY_CASES = [
+    ORDER,
+    {"a": 1e20, "b": 1e-7, "c": 0.1, "d": float("inf"), "e": -5, "f": -2.5},
+    {"flag": True, "empty": "", "text": "a b&c=d", "items": [1, "x"], "nested": {"k": 1.5}},
+]
+"""Параметры для сверки `dict_to_query_string` с прежней реализацией на urlencode."""
+
+
+def legacy_query_string(params: dict) -> str:
+    """Прежняя реализация `dict_to_query_string`."""
+    processed = {
+        k: json.dumps(v, separators=(",", ":")) if isinstance(v, list | dict) else v
+        for k, v in params.items()
+    }
+    return urlencode(processed, doseq=True)
+
+
+def legacy_hmac(secret: str, message: str, digestmod=hashlib.sha256) -> bytes:
+    """Прежняя подпись: ключ кодируется и подготавливается на каждый запрос."""
+    return hmac.new(secret.encode("utf-8"), message.encode("utf-8"), digestmod).digest()
+
+
+def cases() -> dict[str, tuple[Callable[[], str], Callable[[], str]]]:
+    """Возвращает пары (старый путь, новый путь) для каждой биржи."""
+    binance = BinanceClient(None, API_KEY, API_SECRET)  # type: ignore[arg-type]
+    bybit = BybitClient(None, API_KEY, API_SECRET)  # type: ignore[arg-type]
+    okx = OkxClient(None, API_KEY, API_SECRET, "passphrase")  # type: ignore[arg-type]
+    bitget = BitgetClient(None, API_KEY, API_SECRET, "passphrase")  # type: ignore[arg-type]
+    mexc = MexcClient(None, API_KEY, API_SECRET)  # type: ignore[arg-type]
+    gate = GateClient(None, API_KEY, API_SECRET)  # type: ignore[arg-type]
+
+    body = {k: v for k, v in ORDER.items() if k not in ("timestamp", "recvWindow")}
+    recv_window = bybit._RECV_WINDOW
+    body_str = json.dumps(body)
+    okx_prehash = f"{TIMESTAMP}POST/api/v5/trade/order{body_str}"
+    bitget_prehash = f"{TIMESTAMP}POST/api/v2/mix/order/place-order{body_str}"
+    gate_body = (
+        f"POST\n/api/v4/futures/usdt/orders\n\n"
+        f"{hashlib.sha512(body_str.encode()).hexdigest()}\n{TIMESTAMP}"
+    )
+
+    return {
+        "binance": (
+            lambda: legacy_hmac(API_SECRET, legacy_query_string(ORDER)).hex(),
+            lambda: binance._hmac_signer.hexdigest(dict_to_query_string(ORDER)),  # type: ignore[union-attr]
+        ),
+        "bybit": (
+            lambda: legacy_hmac(
+                API_SECRET, TIMESTAMP + API_KEY + recv_window + legacy_query_string(body)
+            ).hex(),
+            lambda: bybit._generate_signature(TIMESTAMP, body, "GET"),
+        ),
+        "okx": (
+            lambda: base64.b64encode(legacy_hmac(API_SECRET, okx_prehash)).decode(),
+            lambda: okx._hmac_signer.b64digest(okx_prehash),  # type: ignore[union-attr]
+        ),
+        "bitget": (
+            lambda: base64.b64encode(legacy_hmac(API_SECRET, bitget_prehash)).decode(),
+            lambda: bitget._hmac_signer.b64digest(bitget_prehash),  # type: ignore[union-attr]
+        ),
+        "mexc": (
+            lambda: legacy_hmac(API_SECRET, legacy_query_string(ORDER)).hex(),
+            lambda: mexc._generate_signature(ORDER),
+        ),
+        "gate": (
+            lambda: legacy_hmac(API_SECRET, gate_body, hashlib.sha512).hex(),
+            lambda: gate._hmac_signer.hexdigest(gate_body),  # type: ignore[union-attr]
+        ),
+    }
+
+
+def measure(func: Callable[[], str]) -> float:
+    """Возвращает среднее время одного вызова в микросекундах."""
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        func()
+    return (time.perf_counter() - started) / ROUNDS * 1_000_000
+
+
+def main() -> None:
+    """Main entry point for the application."""
+    for params in QUERY_CASES:
+        assert dict_to_query_string(params) == legacy_query_string(params), params
+    print(f"{'exchange':<12}{'old, us':>10}{'new, us':>10}{'speedup':>10}{'new, sig/s':>14}")
+    for name, (old, new) in cases().items():
+        assert old() == new(), name
+        old_us = measure(old)
+        new_us = measure(new)
+        print(
+            f"{name:<12}{old_us:>10.2f}{new_us:>10.2f}{old_us / new_us:>9.1f}x"
+            f"{1_000_000 / new_us:>14,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
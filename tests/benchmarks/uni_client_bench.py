@@ -0,0 +1,160 @@
+"""Нагрузочный замер унифицированных клиентов на локальном сервере-заглушке, без сети.
+
+Запуск:
+    python tests/benchmarks/uni_client_bench.py [--exchanges binance,okx] [--requests 2000]
+        [--concurrency 20] [--latency 0.002] [--jitter 0.0] [--error-rate 0.0] [--throttle-rate 0.0]
+
+Для каждой биржи поднимается `FakeExchangeServer` в отдельном потоке, и клиент выполняет
+`futures_ticker_24hr` (разбор ~100 тикеров) и `futures_klines` (100 свечей). Выводятся
+запросы в секунду, p50/p99 задержки и процессорное время клиента на вызов
+(`time.thread_time()` потока клиента — время сервера в него не попадает).
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+import aiohttp
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from fake_exchange import FakeExchangeServer, Faults  # noqa: E402
+
+from unicex import Exchange, IUniClient, Timeframe, get_uni_client  # noqa: E402
+
+WARMUP = 20
+
+KLINES_SYMBOLS: dict[Exchange, str] = {
+    Exchange.ASTER: "BTCUSDT",
+    Exchange.BINANCE: "BTCUSDT",
+    Exchange.BINGX: "BTC-USDT",
+    Exchange.BITGET: "BTCUSDT",
+    Exchange.BYBIT: "BTCUSDT",
+    Exchange.GATE: "BTC_USDT",
+    Exchange.HYPERLIQUID: "BTC",
+    Exchange.KUCOIN: "XBTUSDTM",
+    Exchange.MEXC: "BTC_USDT",
+    Exchange.OKX: "BTC-USDT-SWAP",
+}
+"""Тикер для запроса свечей на каждой бирже."""
+
+
+def scenarios(exchange: Exchange) -> dict[str, Callable[[IUniClient], Awaitable]]:
+    """Возвращает замеряемые вызовы для биржи."""
+    symbol = KLINES_SYMBOLS[exchange]
+    # На Gate фьючерсные свечи требуют размер контракта из ExchangeInfo, поэтому берем спот
+    klines_method = "klines" if exchange == Exchange.GATE else "futures_klines"
+    return {
+        "futures_ticker_24hr": lambda client: client.futures_ticker_24hr(),
+        klines_method: lambda client: getattr(client, klines_method)(
+            symbol, Timeframe.MIN_1, limit=100
+        ),
+    }
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Возвращает перцентиль `q` (0..100)."""
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * q / 100), len(ordered) - 1)]
+
+
+async def run_scenario(
+    client: IUniClient,
+    call: Callable[[IUniClient], Awaitable],
+    requests: int,
+    concurrency: int,
+) -> dict[str, float]:
+    """Выполняет `requests` вызовов в `concurrency` потоков и возвращает метрики."""
+    for _ in range(WARMUP):
+        try:
+            await call(client)
+        except Exception:
+            pass  # Искажения ответов учитываются только в замере
+
+    latencies: list[float] = []
+    errors = 0
+    queue = iter(range(requests))
+
+    async def worker() -> None:
+        nonlocal errors
+        for _ in queue:
+            started = time.perf_counter()
+            try:
+                await call(client)
+            except Exception:
+                errors += 1
+            latencies.append(time.perf_counter() - started)
+
+    cpu_started = time.thread_time()
+    wall_started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall = time.perf_counter() - wall_started
+    cpu = time.thread_time() - cpu_started
+
+    return {
+        "rps": requests / wall,
+        "p50": percentile(latencies, 50) * 1000,
+        "p99": percentile(latencies, 99) * 1000,
+        "mean": statistics.fmean(latencies) * 1000,
+        "cpu": cpu / requests * 1_000_000,
+        "errors": errors,
+    }
+
+
+async def bench_exchange(exchange: Exchange, faults: Faults, args: argparse.Namespace) -> None:
+    """Замеряет все вызовы одной биржи."""
+    server = FakeExchangeServer(exchange, faults)
+    server.start_in_thread()
+    try:
+        async with aiohttp.ClientSession() as session:
+            client = get_uni_client(exchange)(session=session, max_retries=args.retries)
+            server.point(client)
+            for name, call in scenarios(exchange).items():
+                m = await run_scenario(client, call, args.requests, args.concurrency)
+                print(
+                    f"{exchange.value.lower():<12}{name:<22}{m['rps']:>9.0f}{m['p50']:>9.2f}"
+                    f"{m['p99']:>9.2f}{m['cpu']:>14.0f}{m['errors']:>8}"
+                )
+    finally:
+        server.stop_thread()
+    if server.counters["throttled"] or server.counters["errors"]:
+        print(f"{'':<12}server: {dict(server.counters)}")
+
+
+async def main() -> None:
+    """Main entry point for the application."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--exchanges", default=",".join(e.value.lower() for e in Exchange))
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--retries", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    # Отладочный лог каждого запроса иначе занимает большую часть процессорного времени
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    faults = Faults(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+    )
+    print(
+        f"{'exchange':<12}{'call':<22}{'req/s':>9}{'p50, ms':>9}{'p99, ms':>9}{'cpu, µs/call':>14}{'errors':>8}"
+    )
+    for name in args.exchanges.split(","):
+        await bench_exchange(Exchange(name.strip().upper()), faults, args)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
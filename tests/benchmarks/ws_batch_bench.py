@@ -0,0 +1,87 @@
+"""Замер пакетной доставки сообщений вебсокета против доставки по одному, без сети.
+
+Запуск:
+    python tests/benchmarks/ws_batch_bench.py [--messages 50000] [--batch-sizes 16,64,512]
+        [--repeat 5]
+
+Очередь вебсокета Binance `futures_trades` заранее заполняется записанными сделками,
+после чего запускаются воркеры, и замеряется время, за которое унифицированный менеджер
+разберет их в `TradeDict` и отдаст в callback. Чтение сокета в замер не входит, поэтому видна
+именно стоимость доставки: получение из очереди, вызов callback и адаптера на каждое
+сообщение или на пачку. Каждый режим прогоняется `--repeat` раз, выводятся медианы:
+сообщения в секунду, процессорное время на сообщение и число вызовов callback.
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from fake_exchange import load_ws_messages  # noqa: E402
+
+from unicex import Exchange, get_uni_websocket_manager  # noqa: E402
+
+
+async def run_mode(messages: list, count: int, batch_size: int | None) -> dict[str, float]:
+    """Доставляет `count` сообщений из заполненной очереди и возвращает метрики."""
+    received = calls = 0
+    done = asyncio.Event()
+
+    async def callback(data: dict | list[dict]) -> None:
+        nonlocal received, calls
+        calls += 1
+        received += len(data) if isinstance(data, list) else 1
+        if received >= count:
+            done.set()
+
+    manager = get_uni_websocket_manager(Exchange.BINANCE)(
+        batch_size=batch_size, max_queue_size=count
+    )
+    websocket = manager.futures_trades(callback=callback, symbol="BTCUSDT")
+    queue = websocket._queues[0]
+    for i in range(count):
+        queue.put_nowait(messages[i % len(messages)])
+
+    websocket._running = True
+    worker = websocket._batch_worker if batch_size else websocket._worker
+    cpu_started = time.thread_time()
+    wall_started = time.perf_counter()
+    task = asyncio.create_task(worker())
+    try:
+        await done.wait()
+        wall = time.perf_counter() - wall_started
+        cpu = time.thread_time() - cpu_started
+    finally:
+        websocket._running = False
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    return {"rate": count / wall, "cpu": cpu / count * 1_000_000, "calls": calls}
+
+
+async def main() -> None:
+    """Main entry point for the application."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=50_000)
+    parser.add_argument("--batch-sizes", default="16,64,512")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    messages = load_ws_messages(Exchange.BINANCE, "trades_message")
+    modes: list[int | None] = [None, *(int(size) for size in args.batch_sizes.split(","))]
+
+    print(f"{'mode':<14}{'msg/s':>10}{'cpu, µs/msg':>14}{'callbacks':>12}")
+    for batch_size in modes:
+        runs = [await run_mode(messages, args.messages, batch_size) for _ in range(args.repeat)]
+        name = f"batch={batch_size}" if batch_size else "per-message"
+        rate = statistics.median(run["rate"] for run in runs)
+        cpu = statistics.median(run["cpu"] for run in runs)
+        print(f"{name:<14}{rate:>10.0f}{cpu:>14.2f}{runs[0]['calls']:>12}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,97 @@
+"""Замер задержки от отправки сообщения сервером до вызова callback в режимах "queue" и "inline".
+
+Запуск:
+    python tests/benchmarks/ws_latency_bench.py [--messages 20000] [--rate 5000] [--work-us 0]
+
+Локальный `FakeWebsocketServer` в отдельном потоке отправляет записанные лучшие цены Binance
+с заданной частотой и кладет в каждое сообщение время отправки `time.perf_counter_ns()`.
+Callback вычитает его из текущего времени, так что в задержку входят loopback, `conn.recv()`,
+декодирование и, в режиме "queue", переход через очередь к воркеру. Выводятся перцентили
+задержки в микросекундах и число медленных callback по бюджету `Websocket`.
+`--work-us` добавляет в callback синхронную работу, чтобы увидеть, где "inline" перестает
+выигрывать.
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from fake_exchange import FakeWebsocketServer, load_ws_messages  # noqa: E402
+
+from unicex import Exchange, Websocket  # noqa: E402
+
+
+async def run_mode(messages: list, args: argparse.Namespace, dispatch: str) -> dict[str, float]:
+    """Принимает `args.messages` сообщений в одном режиме и возвращает перцентили задержки."""
+    server = FakeWebsocketServer(messages, args.messages, rate=args.rate, stamp=True)
+    url = server.start_in_thread()
+
+    latencies: list[int] = []
+    done = asyncio.Event()
+    work_ns = int(args.work_us * 1000)
+
+    async def callback(message: dict) -> None:
+        latencies.append(time.perf_counter_ns() - message["sent_ns"])
+        if work_ns:
+            deadline = time.perf_counter_ns() + work_ns
+            while time.perf_counter_ns() < deadline:
+                pass
+        if len(latencies) >= args.messages:
+            done.set()
+
+    websocket = Websocket(callback=callback, url=url, dispatch=dispatch)  # type: ignore[arg-type]
+    task = asyncio.create_task(websocket.start())
+    try:
+        await done.wait()
+    finally:
+        await websocket.stop()
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        server.stop_thread()
+
+    # Первые сообщения приходят во время подключения и прогрева, их не считаем
+    latencies = sorted(latencies[len(latencies) // 20 :])
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        "p50": quantiles[49] / 1000,
+        "p90": quantiles[89] / 1000,
+        "p99": quantiles[98] / 1000,
+        "max": latencies[-1] / 1000,
+        "slow": websocket.stats()["slow_callbacks"],
+    }
+
+
+async def main() -> None:
+    """Main entry point for the application."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=20_000)
+    parser.add_argument("--rate", type=float, default=5_000, help="Сообщений в секунду")
+    parser.add_argument("--work-us", type=float, default=0, help="Работа в callback, мкс")
+    args = parser.parse_args()
+
+    # Предупреждения о медленных callback учитываются в таблице
+    logger.remove()
+    logger.add(sys.stderr, level="ERROR")
+
+    messages = load_ws_messages(Exchange.BINANCE, "futures_best_bid_ask_message")
+
+    print(
+        f"{'dispatch':<10}{'p50, µs':>10}{'p90, µs':>10}{'p99, µs':>10}{'max, µs':>10}{'slow':>8}"
+    )
+    for dispatch in ("queue", "inline"):
+        m = await run_mode(messages, args, dispatch)
+        print(
+            f"{dispatch:<10}{m['p50']:>10.1f}{m['p90']:>10.1f}{m['p99']:>10.1f}"
+            f"{m['max']:>10.1f}{m['slow']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
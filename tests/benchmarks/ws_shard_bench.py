@@ -0,0 +1,120 @@
+"""Замер шардирования воркеров вебсокета: параллельность и порядок сообщений по символам.
+
+Запуск:
+    python tests/benchmarks/ws_shard_bench.py [--messages 4000] [--symbols 4] [--workers 8]
+        [--io-ms 1.0]
+
+Локальный `FakeWebsocketServer` в отдельном потоке отправляет записанные сделки Binance,
+разнесенные по `--symbols` стримам, с временем отправки в каждом сообщении. Callback имитирует
+ввод-вывод (`asyncio.sleep` от половины до полутора `--io-ms`) и после него проверяет,
+что сообщения каждого стрима пришли по порядку. Сравниваются один воркер, несколько воркеров на общей очереди и режим
+"sharded". Выводятся сообщения в секунду, число нарушений порядка внутри стрима и
+наибольшая длина очереди каждого воркера за прогон.
+
+По умолчанию воркеров больше, чем стримов, как бывает, когда поток держат несколько активных
+символов: общая очередь тогда быстрее, но нарушает порядок внутри стрима, а "sharded"
+распараллеливает только разные стримы и порядок сохраняет.
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from fake_exchange import FakeWebsocketServer, load_ws_messages  # noqa: E402
+
+from unicex import Exchange, Websocket  # noqa: E402
+
+
+def spread_messages(messages: list[dict], symbols: int) -> list[dict]:
+    """Разносит записанные сообщения по `symbols` стримам мультиплекс-подключения."""
+    return [
+        {**message, "stream": f"sym{i % symbols}usdt@aggTrade"}
+        for i, message in enumerate(messages * symbols)
+    ]
+
+
+async def run_mode(
+    messages: list[dict], args: argparse.Namespace, dispatch: str, workers: int
+) -> dict[str, Any]:
+    """Принимает `args.messages` сообщений в одном режиме и возвращает метрики."""
+    server = FakeWebsocketServer(messages, args.messages, stamp=True)
+    url = server.start_in_thread()
+
+    last_sent: dict[str, int] = {}
+    received = reordered = 0
+    done = asyncio.Event()
+    rng = random.Random(0)
+
+    async def callback(message: dict) -> None:
+        nonlocal received, reordered
+        await asyncio.sleep(rng.uniform(0.5, 1.5) * args.io_ms / 1000)
+        stream, sent_ns = message["stream"], message["sent_ns"]
+        if sent_ns < last_sent.get(stream, 0):
+            reordered += 1
+        last_sent[stream] = max(sent_ns, last_sent.get(stream, 0))
+        received += 1
+        if received >= args.messages:
+            done.set()
+
+    websocket = Websocket(
+        callback=callback,
+        url=url,
+        worker_count=workers,
+        dispatch=dispatch,  # type: ignore[arg-type]
+    )
+    peaks = [0] * (workers if dispatch == "sharded" else 1)
+
+    async def sample() -> None:
+        while True:
+            peaks[:] = map(max, peaks, websocket.stats()["shards"])
+            await asyncio.sleep(0.005)
+
+    task = asyncio.create_task(websocket.start())
+    sampler = asyncio.create_task(sample())
+    started = time.perf_counter()
+    try:
+        await done.wait()
+        elapsed = time.perf_counter() - started
+    finally:
+        sampler.cancel()
+        await websocket.stop()
+        task.cancel()
+        await asyncio.gather(task, sampler, return_exceptions=True)
+        server.stop_thread()
+
+    return {"rate": args.messages / elapsed, "reordered": reordered, "peaks": peaks}
+
+
+async def main() -> None:
+    """Main entry point for the application."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=4_000)
+    parser.add_argument("--symbols", type=int, default=4)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--io-ms", type=float, default=1.0, help="Ввод-вывод в callback, мс")
+    args = parser.parse_args()
+
+    # Заполненная очередь здесь ожидаемо упирается в политику "block"
+    logger.remove()
+    logger.add(sys.stderr, level="ERROR")
+
+    messages = spread_messages(load_ws_messages(Exchange.BINANCE, "trades_message"), args.symbols)
+    modes = [("queue", 1), ("queue", args.workers), ("sharded", args.workers)]
+
+    print(f"{'mode':<18}{'msg/s':>10}{'reordered':>11}  peak queue per worker")
+    for dispatch, workers in modes:
+        m = await run_mode(messages, args, dispatch, workers)
+        name = f"{dispatch} x{workers}"
+        print(f"{name:<18}{m['rate']:>10.0f}{m['reordered']:>11}  {m['peaks']}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
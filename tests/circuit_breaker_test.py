@@ -0,0 +1,72 @@
+"""Проверка предохранителя на локальном сервере-заглушке, без сети.
+
+Пробный запрос полуоткрытого предохранителя отменяется (как проигравший хедж или запрос
+с истекшим дедлайном `MultiExchangeClient`). После этого следующий запрос должен стать
+пробным и замкнуть предохранитель, а не падать с `CircuitOpenError`.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import aiohttp
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from fake_exchange import FakeExchangeServer, Faults  # noqa: E402
+
+from unicex import CircuitBreaker, Exchange, RetryPolicy, get_uni_client  # noqa: E402
+from unicex.exceptions import CircuitOpenError, ResponseError  # noqa: E402
+
+logger.remove()
+
+RECOVERY_TIMEOUT = 0.2
+
+
+async def main() -> None:
+    """Main entry point for the application."""
+    server = FakeExchangeServer(Exchange.BINANCE, Faults(error_rate=1.0))
+    await server.start()
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=RECOVERY_TIMEOUT)
+
+    async with aiohttp.ClientSession() as session:
+        client = get_uni_client(Exchange.BINANCE)(
+            session=session, retry_policy=RetryPolicy(max_retries=1, circuit_breaker=breaker)
+        )
+        server.point(client)
+        host = server.url.removeprefix("http://")
+
+        # Ответ 500 размыкает предохранитель
+        try:
+            await client.futures_ticker_24hr()
+        except ResponseError:
+            pass
+        assert breaker.state(host) == "open", breaker.stats()
+        try:
+            await client.futures_ticker_24hr()
+            raise AssertionError("Request passed through open circuit")
+        except CircuitOpenError as e:
+            print(f"open: {e}")
+
+        # Пробный запрос зависает на медленном ответе и отменяется
+        await asyncio.sleep(RECOVERY_TIMEOUT)
+        server.faults = Faults(latency=5)
+        probe = asyncio.create_task(client.futures_ticker_24hr())
+        await asyncio.sleep(0.1)
+        assert breaker.state(host) == "half_open", breaker.stats()
+        probe.cancel()
+        await asyncio.gather(probe, return_exceptions=True)
+        print(f"cancelled probe: {breaker.stats()}")
+
+        # Следующий запрос становится пробным и замыкает предохранитель
+        server.faults = Faults()
+        tickers = await client.futures_ticker_24hr()
+        assert breaker.state(host) == "closed", breaker.stats()
+        print(f"closed after new probe: {len(tickers)} tickers")
+
+    await server.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,422 @@
+"""Локальные серверы-заглушки REST API и вебсокетов бирж для нагрузочных тестов и замеров без сети.
+
+Сервер отдает записанные ответы из `tests/fixtures/<exchange>/` на эндпоинты, которые используют
+унифицированные клиенты, и умеет добавлять задержку, ошибки 5xx, ответы 429 с `Retry-After`
+и заголовки лимитов запросов в формате биржи.
+
+Пример:
+    ```python
+    server = FakeExchangeServer(Exchange.BINANCE, Faults(latency=0.005, throttle_rate=0.01))
+    await server.start()
+
+    client = BinanceUniClient(session)
+    server.point(client)  # клиент теперь ходит на http://127.0.0.1:<port>
+    await client.futures_ticker_24hr()
+    ```
+
+`FakeWebsocketServer` после подключения клиента отправляет записанные сообщения вебсокета
+из `ws_*.json` с заданной частотой или так быстро, как клиент их читает.
+
+Чтобы процессорное время сервера не смешивалось со временем клиента, сервер можно запустить
+в отдельном потоке со своим циклом событий (`start_in_thread`) и мерить `time.thread_time()`.
+"""
+
+__all__ = [
+    "FIXTURES_DIR",
+    "ROUTES",
+    "FakeExchangeServer",
+    "FakeWebsocketServer",
+    "Faults",
+    "Route",
+    "load_ws_messages",
+]
+
+import asyncio
+import random
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import orjson
+from aiohttp import web
+from websockets.asyncio.server import ServerConnection, serve
+
+from unicex import BaseClient, Exchange, IUniClient, Websocket
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+"""Каталог с записанными ответами бирж: `<exchange>/<fixture>.json`."""
+
+
+@dataclass(frozen=True)
+class Route:
+    """Эндпоинт биржи и записанный ответ на него."""
+
+    method: str
+    """HTTP-метод."""
+
+    path: str
+    """Путь в формате роутера aiohttp, например "/api/v1/contract/kline/{symbol}"."""
+
+    fixture: str
+    """Имя файла ответа в каталоге биржи без расширения."""
+
+    body_type: str | None = None
+    """Значение поля "type" в JSON-теле (для API с одним эндпоинтом, как `/info` Hyperliquid)."""
+
+
+@dataclass
+class Faults:
+    """Искажения, которые сервер добавляет к ответам."""
+
+    latency: float = 0.0
+    """Задержка каждого ответа, сек."""
+
+    jitter: float = 0.0
+    """Случайная добавка к задержке от 0 до `jitter`, сек."""
+
+    error_rate: float = 0.0
+    """Доля ответов с ошибкой 500."""
+
+    throttle_rate: float = 0.0
+    """Доля ответов 429 с заголовком `Retry-After`."""
+
+    retry_after: int = 1
+    """Значение `Retry-After` в ответах 429, сек."""
+
+    weight_limit: int = 2400
+    """Лимит запросов в минуту, который сообщается в заголовках лимитов."""
+
+
+ROUTES: dict[Exchange, list[Route]] = {
+    Exchange.ASTER: [
+        Route("GET", "/fapi/v3/ticker/24hr", "rest_futures_ticker_24hr"),
+        Route("GET", "/fapi/v3/klines", "rest_futures_klines"),
+    ],
+    Exchange.BINANCE: [
+        Route("GET", "/fapi/v1/ticker/24hr", "rest_futures_ticker_24hr"),
+        Route("GET", "/fapi/v1/klines", "rest_futures_klines"),
+    ],
+    Exchange.BINGX: [
+        Route("GET", "/openApi/swap/v2/quote/ticker", "rest_futures_ticker_24hr"),
+        Route("GET", "/openApi/swap/v3/quote/klines", "rest_futures_klines"),
+    ],
+    Exchange.BITGET: [
+        Route("GET", "/api/v2/mix/market/tickers", "rest_futures_ticker_24hr"),
+        Route("GET", "/api/v2/mix/market/candles", "rest_futures_klines"),
+    ],
+    Exchange.BYBIT: [
+        Route("GET", "/v5/market/tickers", "rest_futures_ticker_24hr"),
+        Route("GET", "/v5/market/kline", "rest_futures_klines"),
+    ],
+    Exchange.GATE: [
+        Route("GET", "/api/v4/futures/usdt/tickers", "rest_futures_ticker_24hr"),
+        Route("GET", "/api/v4/spot/candlesticks", "rest_klines"),
+    ],
+    Exchange.HYPERLIQUID: [
+        Route("POST", "/info", "rest_futures_ticker_24hr", body_type="metaAndAssetCtxs"),
+        Route("POST", "/info", "rest_futures_klines", body_type="candleSnapshot"),
+    ],
+    Exchange.KUCOIN: [
+        Route("GET", "/api/ua/v1/market/ticker", "rest_futures_ticker_24hr"),
+        Route("GET", "/api/ua/v1/market/kline", "rest_futures_klines"),
+    ],
+    Exchange.MEXC: [
+        Route("GET", "/api/v1/contract/ticker", "rest_futures_ticker_24hr"),
+        Route("GET", "/api/v1/contract/kline/{symbol}", "rest_futures_klines"),
+    ],
+    Exchange.OKX: [
+        Route("GET", "/api/v5/market/tickers", "rest_futures_ticker_24hr"),
+        Route("GET", "/api/v5/market/candles", "rest_futures_klines"),
+    ],
+}
+"""Эндпоинты, которые отдает сервер для каждой биржи."""
+
+
+_RATE_LIMIT_HEADERS: dict[Exchange, Callable[[int, int], dict[str, str]]] = {
+    Exchange.ASTER: lambda used, limit: {"X-MBX-USED-WEIGHT-1M": str(used)},
+    Exchange.BINANCE: lambda used, limit: {"X-MBX-USED-WEIGHT-1M": str(used)},
+    Exchange.BYBIT: lambda used, limit: {
+        "X-Bapi-Limit": str(limit),
+        "X-Bapi-Limit-Status": str(max(limit - used, 0)),
+    },
+    Exchange.GATE: lambda used, limit: {
+        "X-Gate-RateLimit-Limit": str(limit),
+        "X-Gate-RateLimit-Requests-Remain": str(max(limit - used, 0)),
+    },
+    Exchange.KUCOIN: lambda used, limit: {
+        "gw-ratelimit-limit": str(limit),
+        "gw-ratelimit-remaining": str(max(limit - used, 0)),
+    },
+}
+"""Заголовки лимитов запросов в формате биржи: (использовано, лимит) -> заголовки."""
+
+
+class _ThreadedServer:
+    """Запуск сервера в отдельном потоке со своим циклом событий."""
+
+    _thread: threading.Thread | None = None
+    _loop: asyncio.AbstractEventLoop | None = None
+
+    async def start(self) -> str:
+        """Запускает сервер в текущем цикле событий и возвращает его URL."""
+        raise NotImplementedError
+
+    async def stop(self) -> None:
+        """Останавливает сервер."""
+        raise NotImplementedError
+
+    def start_in_thread(self) -> str:
+        """Запускает сервер в отдельном потоке со своим циклом событий.
+
+        Возвращает:
+            `str`: Базовый URL сервера.
+        """
+        started = threading.Event()
+        url = ""
+
+        def run() -> None:
+            nonlocal url
+            self._loop = asyncio.new_event_loop()
+            url = self._loop.run_until_complete(self.start())
+            started.set()
+            self._loop.run_forever()
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run, name=f"fake-{type(self).__name__}", daemon=True)
+        self._thread.start()
+        started.wait()
+        return url
+
+    def stop_thread(self) -> None:
+        """Останавливает сервер, запущенный через `start_in_thread`."""
+        if self._loop is None or self._thread is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.stop(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop = self._thread = None
+
+
+class FakeExchangeServer(_ThreadedServer):
+    """Сервер-заглушка REST API одной биржи."""
+
+    _BASE_URL_ATTRS = ("_BASE_URL", "_BASE_SPOT_URL", "_BASE_FUTURES_URL")
+    """Атрибуты клиентов с базовыми URL, которые подменяет `point`."""
+
+    def __init__(
+        self,
+        exchange: Exchange,
+        faults: Faults | None = None,
+        fixtures_dir: Path = FIXTURES_DIR,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        """Инициализирует сервер.
+
+        Параметры:
+            exchange (`Exchange`): Биржа.
+            faults (`Faults | None`): Искажения ответов. По умолчанию — без искажений.
+            fixtures_dir (`Path`): Каталог с записанными ответами.
+            host (`str`): Адрес сервера.
+            port (`int`): Порт сервера. 0 — свободный порт.
+        """
+        self.exchange = exchange
+        self.faults = faults or Faults()
+        self.counters: Counter[str] = Counter()
+        self._host = host
+        self._port = port
+        self._routes = ROUTES[exchange]
+        self._bodies = {
+            route.fixture: (
+                fixtures_dir / exchange.value.lower() / f"{route.fixture}.json"
+            ).read_bytes()
+            for route in self._routes
+        }
+        self._runner: web.AppRunner | None = None
+        self._window = 0
+        self._used = 0
+
+    @property
+    def url(self) -> str:
+        """Возвращает базовый URL запущенного сервера."""
+        return f"http://{self._host}:{self._port}"
+
+    async def start(self) -> str:
+        """Запускает сервер в текущем цикле событий.
+
+        Возвращает:
+            `str`: Базовый URL сервера.
+        """
+        app = web.Application()
+        paths: dict[tuple[str, str], list[Route]] = {}
+        for route in self._routes:
+            paths.setdefault((route.method, route.path), []).append(route)
+        for (method, path), routes in paths.items():
+            app.router.add_route(method, path, self._make_handler(routes))
+
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self._host, self._port)
+        await site.start()
+        self._port = self._runner.addresses[0][1]
+        return self.url
+
+    async def stop(self) -> None:
+        """Останавливает сервер."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def point(self, client: IUniClient | BaseClient) -> None:
+        """Перенаправляет запросы клиента на сервер.
+
+        Параметры:
+            client (`IUniClient | BaseClient`): Унифицированный или обычный клиент биржи.
+        """
+        target = client.client if isinstance(client, IUniClient) else client
+        for attr in self._BASE_URL_ATTRS:
+            if hasattr(target, attr):
+                setattr(target, attr, self.url)
+
+    def _make_handler(self, routes: list[Route]) -> Callable[[web.Request], Any]:
+        """Создает обработчик эндпоинта, выбирающий ответ по полю "type" тела при необходимости."""
+
+        async def handler(request: web.Request) -> web.Response:
+            route = routes[0]
+            if route.body_type is not None:
+                body_type = orjson.loads(await request.read()).get("type")
+                route = next((r for r in routes if r.body_type == body_type), None)  # type: ignore[assignment]
+                if route is None:
+                    self.counters["unmatched"] += 1
+                    return web.json_response({"error": f"Unknown type {body_type}"}, status=404)
+            return await self._respond(route)
+
+        return handler
+
+    async def _respond(self, route: Route) -> web.Response:
+        """Отдает записанный ответ с учетом искажений."""
+        faults = self.faults
+        self.counters["requests"] += 1
+
+        delay = faults.latency + (random.uniform(0, faults.jitter) if faults.jitter else 0)
+        if delay:
+            await asyncio.sleep(delay)
+
+        window = int(time.monotonic() // 60)
+        if window != self._window:
+            self._window, self._used = window, 0
+        self._used += 1
+        headers = _RATE_LIMIT_HEADERS.get(self.exchange, lambda used, limit: {})(
+            self._used, faults.weight_limit
+        )
+
+        roll = random.random()
+        if roll < faults.throttle_rate:
+            self.counters["throttled"] += 1
+            headers["Retry-After"] = str(faults.retry_after)
+            return web.json_response(
+                {"code": 429, "msg": "Too many requests"}, status=429, headers=headers
+            )
+        if roll < faults.throttle_rate + faults.error_rate:
+            self.counters["errors"] += 1
+            return web.json_response(
+                {"code": 500, "msg": "Internal server error"}, status=500, headers=headers
+            )
+        return web.Response(
+            body=self._bodies[route.fixture], content_type="application/json", headers=headers
+        )
+
+
+def load_ws_messages(
+    exchange: Exchange, adapter: str, fixtures_dir: Path = FIXTURES_DIR
+) -> list[Any]:
+    """Возвращает записанные сообщения вебсокета для адаптера, например "trades_message"."""
+    return orjson.loads((fixtures_dir / exchange.value.lower() / f"ws_{adapter}.json").read_bytes())
+
+
+class FakeWebsocketServer(_ThreadedServer):
+    """Сервер-заглушка вебсокета: каждому подключившемуся клиенту отправляет записанные сообщения по кругу."""
+
+    def __init__(
+        self,
+        messages: list[Any],
+        count: int,
+        rate: float | None = None,
+        stamp: bool = False,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        """Инициализирует сервер.
+
+        Параметры:
+            messages (`list[Any]`): Сообщения, которые отправляются по кругу.
+            count (`int`): Сколько сообщений отправить каждому клиенту.
+            rate (`float | None`): Сообщений в секунду. None — так быстро, как клиент читает.
+            stamp (`bool`): Добавлять в каждое сообщение поле "sent_ns" со временем отправки
+                по `time.perf_counter_ns()` (для замера задержки в том же процессе).
+            host (`str`): Адрес сервера.
+            port (`int`): Порт сервера. 0 — свободный порт.
+        """
+        self.counters: Counter[str] = Counter()
+        self._payloads = [orjson.dumps(message).decode() for message in messages]
+        self._messages = messages
+        self._count = count
+        self._rate = rate
+        self._stamp = stamp
+        self._host = host
+        self._port = port
+        self._server: Any = None
+
+    @property
+    def url(self) -> str:
+        """Возвращает URL запущенного сервера."""
+        return f"ws://{self._host}:{self._port}"
+
+    async def start(self) -> str:
+        """Запускает сервер в текущем цикле событий.
+
+        Возвращает:
+            `str`: URL сервера.
+        """
+        # Сжатие выключено, как у большинства бирж, чтобы не мерить zlib
+        self._server = await serve(self._handler, self._host, self._port, compression=None)
+        self._port = self._server.sockets[0].getsockname()[1]
+        return self.url
+
+    async def stop(self) -> None:
+        """Останавливает сервер."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    def point(self, websocket: Websocket) -> None:
+        """Перенаправляет вебсокет на сервер.
+
+        Параметры:
+            websocket (`Websocket`): Вебсокет, созданный менеджером биржи.
+        """
+        websocket._url = self.url
+
+    async def _handler(self, conn: ServerConnection) -> None:
+        """Отправляет клиенту сообщения и держит соединение до его закрытия."""
+        self.counters["connections"] += 1
+        started = time.perf_counter()
+        total = len(self._messages)
+        for i in range(self._count):
+            if self._stamp:
+                message = {**self._messages[i % total], "sent_ns": time.perf_counter_ns()}
+                payload = orjson.dumps(message).decode()
+            else:
+                payload = self._payloads[i % total]
+            await conn.send(payload)
+            self.counters["sent"] += 1
+            if self._rate:
+                delay = started + (i + 1) / self._rate - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+        await conn.wait_closed()
@@ -5,6 +5,9 @@ __all__ = [
     "get_uni_client",
     "get_uni_websocket_manager",
     "get_exchange_info",
+    # Multi-exchange
+    "MultiExchangeClient",
+    "MultiExchangeResult",
     # Exchanges info
     "load_exchanges_info",
     "start_exchanges_info",
@@ -23,6 +26,8 @@ __all__ = [
     "KlineDict",
     "TradeDict",
     "RequestMethod",
+    "OverflowPolicy",
+    "DispatchMode",
     "LoggerLike",
     "OpenInterestDict",
     "OpenInterestItem",
@@ -43,6 +48,22 @@ __all__ = [
     # Base clients and websockets
     "Websocket",
     "BaseClient",
+    "HedgePolicy",
+    "HmacSigner",
+    "KeepWarm",
+    "LatencyHistogram",
+    "MessageBatch",
+    "ProxyPool",
+    "RequestEvent",
+    "RequestHooks",
+    "ResponseCache",
+    "RetryPolicy",
+    "CircuitBreaker",
+    "ClockSync",
+    "ConflatingQueue",
+    "Eip712Signer",
+    "SessionPool",
+    "SpillQueue",
     # Aster
     "AsterClient",
     "AsterUniClient",
@@ -121,7 +142,26 @@ __all__ = [
 import asyncio
 from typing import Awaitable
 from ._abc import IUniClient, IUniWebsocketManager, IExchangeInfo
-from ._base import BaseClient, Websocket
+from ._base import (
+    BaseClient,
+    CircuitBreaker,
+    ClockSync,
+    ConflatingQueue,
+    Eip712Signer,
+    HedgePolicy,
+    HmacSigner,
+    KeepWarm,
+    LatencyHistogram,
+    MessageBatch,
+    ProxyPool,
+    RequestEvent,
+    RequestHooks,
+    ResponseCache,
+    RetryPolicy,
+    SessionPool,
+    SpillQueue,
+    Websocket,
+)
 
 # enums, mappers, types
 from .enums import (
@@ -135,12 +175,15 @@ from .enums import (
     MarginType,
 )
 from .mapper import get_uni_client, get_uni_websocket_manager, get_exchange_info
+from .multi import MultiExchangeClient, MultiExchangeResult
 from .types import (
     TickerDailyDict,
     TickerDailyItem,
     KlineDict,
     TradeDict,
     RequestMethod,
+    OverflowPolicy,
+    DispatchMode,
     LoggerLike,
     OpenInterestDict,
     OpenInterestItem,
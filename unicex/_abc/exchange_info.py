@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING, ClassVar
 import aiohttp
 from loguru import logger
 
+from unicex._base import SessionPool
 from unicex.enums import MarketType
 from unicex.types import TickerInfoItem, TickersInfoDict
 
@@ -63,15 +64,20 @@ class IExchangeInfo(ABC):
     @classmethod
     async def _load_exchange_info_loop(cls, update_interval_seconds: int) -> None:
         """Запускает бесконечный цикл для загрузки данных о бирже."""
-        while cls._running:
-            try:
-                await cls.load_exchange_info()
-            except Exception as e:
-                cls._logger.error(f"Error loading exchange data for {cls.exchange_name}: {e}")
-            for _ in range(update_interval_seconds):
-                if not cls._running:
-                    break
-                await asyncio.sleep(1)
+        # Удерживаем общую сессию биржи, пока цикл запущен, чтобы она не закрывалась между обновлениями
+        session = SessionPool.acquire(SessionPool.key_for(cls))
+        try:
+            while cls._running:
+                try:
+                    await cls.load_exchange_info()
+                except Exception as e:
+                    cls._logger.error(f"Error loading exchange data for {cls.exchange_name}: {e}")
+                for _ in range(update_interval_seconds):
+                    if not cls._running:
+                        break
+                    await asyncio.sleep(1)
+        finally:
+            await SessionPool.release(session)
 
     @classmethod
     async def load_exchange_info(cls) -> None:
@@ -79,7 +85,9 @@ class IExchangeInfo(ABC):
         spot_loaded = False
         futures_loaded = False
 
-        async with aiohttp.ClientSession() as session:
+        # Используем общую сессию биржи, чтобы не открывать новые соединения при каждом обновлении
+        session = SessionPool.acquire(SessionPool.key_for(cls))
+        try:
             try:
                 await cls._load_spot_exchange_info(session)
                 spot_loaded = True
@@ -96,6 +104,8 @@ class IExchangeInfo(ABC):
                 cls._logger.error(
                     f"{type(e)} loading futures exchange data for {cls.exchange_name}: {e}"
                 )
+        finally:
+            await SessionPool.release(session)
 
         cls._loaded = spot_loaded and futures_loaded
         if not cls._loaded:
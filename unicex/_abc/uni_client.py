@@ -1,14 +1,28 @@
 __all__ = ["IUniClient"]
 
+import asyncio
 import time
 from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
 from typing import Any, Generic, Self, TypeVar, overload
 
 import aiohttp
 
-from unicex._base import BaseClient
+from unicex._base import (
+    BaseClient,
+    BaseRateLimiter,
+    ClockSync,
+    HedgePolicy,
+    KeepWarm,
+    ProxyPool,
+    RequestHooks,
+    ResponseCache,
+    RetryPolicy,
+    SessionPool,
+)
 from unicex.enums import MarginType, OrderSide, OrderType, Timeframe
-from unicex.exceptions import NotAuthorized
+from unicex.exceptions import AdapterError, NotAuthorized
 from unicex.types import (
     BestBidAskDict,
     BestBidAskItem,
@@ -31,6 +45,18 @@ TClient = TypeVar("TClient", bound="BaseClient")
 class IUniClient(ABC, Generic[TClient]):
     """Интерфейс для унифицированного клиента."""
 
+    _FUTURES_BATCH_CREATE_SIZE: int | None = None
+    """Максимум ордеров в одном пакетном запросе на создание. None — пакетного эндпоинта нет."""
+
+    _FUTURES_BATCH_CANCEL_SIZE: int | None = None
+    """Максимум ордеров в одном пакетном запросе на отмену. None — пакетного эндпоинта нет."""
+
+    _KLINES_PAGE_SIZE: int | None = None
+    """Максимум свечей в одном запросе `klines`. None — постраничная загрузка не поддерживается."""
+
+    _FUTURES_KLINES_PAGE_SIZE: int | None = None
+    """Максимум свечей в одном запросе `futures_klines`. None — постраничная загрузка не поддерживается."""
+
     def __init__(
         self,
         session: aiohttp.ClientSession,
@@ -40,8 +66,16 @@ class IUniClient(ABC, Generic[TClient]):
         logger: LoggerLike | None = None,
         max_retries: int = 3,
         retry_delay: int | float = 0.1,
-        proxies: list[str] | None = None,
+        proxies: list[str] | ProxyPool | None = None,
         timeout: int = 10,
+        rate_limiter: BaseRateLimiter | None = None,
+        single_flight: bool = False,
+        cache: ResponseCache | None = None,
+        retry_policy: RetryPolicy | None = None,
+        hedge: HedgePolicy | None = None,
+        hooks: list[RequestHooks] | None = None,
+        clock_sync: ClockSync | None = None,
+        keep_warm: KeepWarm | None = None,
     ) -> None:
         """Инициализация клиента.
 
@@ -53,8 +87,16 @@ class IUniClient(ABC, Generic[TClient]):
             logger (`LoggerLike | None`): Логгер для вывода информации.
             max_retries (`int`): Максимальное количество повторных попыток запроса.
             retry_delay (`int | float`): Задержка между повторными попытками.
-            proxies (`list[str] | None`): Список HTTP(S) прокси для циклического использования.
+            proxies (`list[str] | ProxyPool | None`): Список HTTP(S)‑прокси или общий `ProxyPool`. Прокси выбираются с учетом здоровья и задержки.
             timeout (`int`): Максимальное время ожидания ответа от сервера.
+            rate_limiter (`BaseRateLimiter | None`): Ограничитель частоты запросов (например, `RateLimiter.shared()` биржи). Если не передан — запросы не ограничиваются.
+            single_flight (`bool`): Объединять одновременные одинаковые GET-запросы в один сетевой вызов с общим результатом.
+            cache (`ResponseCache | None`): Кэш ответов публичных эндпоинтов (например, `ResponseCache()`). Если не передан — ответы не кэшируются.
+            retry_policy (`RetryPolicy | None`): Политика повторов (backoff, jitter, `Retry-After`, предохранитель). Если не передана — собирается из `max_retries` и `retry_delay`.
+            hedge (`HedgePolicy | None`): Политика хеджирования GET-запросов: дубль запроса после перцентиля недавних задержек. Если не передана — запросы не хеджируются.
+            hooks (`list[RequestHooks] | None`): Обработчики событий жизненного цикла запросов (например, `LatencyHistogram()`).
+            clock_sync (`ClockSync | None`): Синхронизация часов с сервером биржи для подписи запросов. Если не передана — используется локальное время.
+            keep_warm (`KeepWarm | None`): Прогрев и поддержание открытых соединений к хостам биржи (например, `KeepWarm(connections=2)`), запускается через `warm_up()`. Если не передан — `warm_up()` использует настройки по умолчанию.
         """
         self._client: TClient = self._client_cls(
             api_key=api_key,
@@ -66,6 +108,14 @@ class IUniClient(ABC, Generic[TClient]):
             retry_delay=retry_delay,
             proxies=proxies,
             timeout=timeout,
+            rate_limiter=rate_limiter,
+            single_flight=single_flight,
+            cache=cache,
+            retry_policy=retry_policy,
+            hedge=hedge,
+            hooks=hooks,
+            clock_sync=clock_sync,
+            keep_warm=keep_warm,
         )
 
     @classmethod
@@ -78,8 +128,16 @@ class IUniClient(ABC, Generic[TClient]):
         logger: LoggerLike | None = None,
         max_retries: int = 3,
         retry_delay: int | float = 0.1,
-        proxies: list[str] | None = None,
+        proxies: list[str] | ProxyPool | None = None,
         timeout: int = 10,
+        rate_limiter: BaseRateLimiter | None = None,
+        single_flight: bool = False,
+        cache: ResponseCache | None = None,
+        retry_policy: RetryPolicy | None = None,
+        hedge: HedgePolicy | None = None,
+        hooks: list[RequestHooks] | None = None,
+        clock_sync: ClockSync | None = None,
+        keep_warm: KeepWarm | None = None,
     ) -> Self:
         """Создает инстанцию клиента.
         Создать клиент можно и через __init__, но в таком случае session: `aiohttp.ClientSession` - обязательный параметр.
@@ -88,18 +146,26 @@ class IUniClient(ABC, Generic[TClient]):
             api_key (`str | None`): Ключ API для аутентификации.
             api_secret (`str | None`): Секретный ключ API для аутентификации.
             api_passphrase (`str | None`): Пароль API для аутентификации (Bitget).
-            session (`aiohttp.ClientSession | None`): Сессия для выполнения HTTP-запросов.
+            session (`aiohttp.ClientSession | None`): Сессия для выполнения HTTP-запросов (если не передана, будет взята общая сессия биржи из `SessionPool`).
             logger (`LoggerLike | None`): Логгер для вывода информации.
             max_retries (`int`): Максимальное количество повторных попыток запроса.
             retry_delay (`int | float`): Задержка между повторными попытками.
-            proxies (`list[str] | None`): Список HTTP(S) прокси для циклического использования.
+            proxies (`list[str] | ProxyPool | None`): Список HTTP(S)‑прокси или общий `ProxyPool`. Прокси выбираются с учетом здоровья и задержки.
             timeout (`int`): Максимальное время ожидания ответа от сервера.
+            rate_limiter (`BaseRateLimiter | None`): Ограничитель частоты запросов (например, `RateLimiter.shared()` биржи). Если не передан — запросы не ограничиваются.
+            single_flight (`bool`): Объединять одновременные одинаковые GET-запросы в один сетевой вызов с общим результатом.
+            cache (`ResponseCache | None`): Кэш ответов публичных эндпоинтов (например, `ResponseCache()`). Если не передан — ответы не кэшируются.
+            retry_policy (`RetryPolicy | None`): Политика повторов (backoff, jitter, `Retry-After`, предохранитель). Если не передана — собирается из `max_retries` и `retry_delay`.
+            hedge (`HedgePolicy | None`): Политика хеджирования GET-запросов: дубль запроса после перцентиля недавних задержек. Если не передана — запросы не хеджируются.
+            hooks (`list[RequestHooks] | None`): Обработчики событий жизненного цикла запросов (например, `LatencyHistogram()`).
+            clock_sync (`ClockSync | None`): Синхронизация часов с сервером биржи для подписи запросов. Если не передана — используется локальное время.
+            keep_warm (`KeepWarm | None`): Прогрев и поддержание открытых соединений к хостам биржи (например, `KeepWarm(connections=2)`), запускается через `warm_up()`. Если не передан — `warm_up()` использует настройки по умолчанию.
 
         Возвращает:
             `IUniClient`: Созданный экземпляр клиента.
         """
         return cls(
-            session=session or aiohttp.ClientSession(),
+            session=session or SessionPool.acquire(SessionPool.key_for(cls)),
             api_key=api_key,
             api_secret=api_secret,
             api_passphrase=api_passphrase,
@@ -108,6 +174,14 @@ class IUniClient(ABC, Generic[TClient]):
             retry_delay=retry_delay,
             proxies=proxies,
             timeout=timeout,
+            rate_limiter=rate_limiter,
+            single_flight=single_flight,
+            cache=cache,
+            retry_policy=retry_policy,
+            hedge=hedge,
+            hooks=hooks,
+            clock_sync=clock_sync,
+            keep_warm=keep_warm,
         )
 
     @classmethod
@@ -143,6 +217,22 @@ class IUniClient(ABC, Generic[TClient]):
         """Закрывает сессию клиента."""
         await self._client.close_connection()
 
+    async def warm_up(self, urls: list[str] | None = None) -> None:
+        """Открывает соединения к хостам биржи и запускает их фоновое поддержание.
+
+        Параметры:
+            urls (`list[str] | None`): Эндпоинты для прогрева, по одному на хост. Если не переданы — используются ping/time эндпоинты биржи.
+        """
+        await self._client.warm_up(urls)
+
+    def connection_stats(self) -> dict[str, Any]:
+        """Возвращает состояние соединений клиента.
+
+        Возвращает:
+            `dict`: {"keep_warm": состояние прогрева или None, "hosts": {host: {"idle", "active"}}}.
+        """
+        return self._client.connection_stats()
+
     async def __aenter__(self) -> Self:
         """Вход в асинхронный контекст."""
         return self
@@ -226,6 +316,45 @@ class IUniClient(ABC, Generic[TClient]):
             return value // 1000
         return value
 
+    async def map_symbols[T](
+        self,
+        method: Callable[..., Awaitable[T]] | str,
+        symbols: Iterable[str],
+        concurrency: int = 10,
+        timeout: float | None = None,
+        **kwargs: Any,
+    ) -> dict[str, T | Exception]:
+        """Вызывает метод клиента для каждого тикера с ограничением параллельности.
+
+        Одновременно выполняется не более `concurrency` вызовов, частоту запросов дополнительно
+        ограничивает `rate_limiter` клиента. Ошибка или таймаут одного тикера не прерывает
+        остальные: вместо результата возвращается исключение.
+
+        Параметры:
+            method (`Callable | str`): Метод клиента или его имя, например `client.futures_depth`
+                или "futures_depth". Вызывается как `method(symbol, **kwargs)`.
+            symbols (`Iterable[str]`): Тикеры.
+            concurrency (`int`): Максимум одновременных вызовов.
+            timeout (`float | None`): Таймаут одного вызова, сек. None — без таймаута.
+            **kwargs: Дополнительные аргументы метода, общие для всех тикеров.
+
+        Возвращает:
+            `dict[str, T | Exception]`: Результат или исключение по каждому тикеру.
+        """
+        func = getattr(self, method) if isinstance(method, str) else method
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        async def call(symbol: str) -> T | Exception:
+            async with semaphore:
+                try:
+                    return await asyncio.wait_for(func(symbol, **kwargs), timeout)
+                except Exception as e:
+                    return e
+
+        symbols = list(dict.fromkeys(symbols))
+        results = await asyncio.gather(*(call(symbol) for symbol in symbols))
+        return dict(zip(symbols, results, strict=True))
+
     @abstractmethod
     async def futures_tickers(self, only_usdt: bool = True) -> list[str]:
         """Возвращает список тикеров.
@@ -335,6 +464,92 @@ class IUniClient(ABC, Generic[TClient]):
         """
         ...
 
+    async def klines_range(
+        self,
+        symbol: str,
+        interval: Timeframe,
+        start_time: int,
+        end_time: int | None = None,
+        futures: bool = False,
+        concurrency: int = 8,
+    ) -> AsyncIterator[list[KlineDict]]:
+        """Загружает свечи за произвольный период, постранично и параллельно.
+
+        Период разбивается на окна по лимиту свечей биржи в одном запросе. До `concurrency` окон
+        загружаются одновременно (общую частоту запросов ограничивает `rate_limiter` клиента),
+        а страницы отдаются по порядку: отсортированными, без дублей и без свечей вне периода.
+
+        Параметры:
+            symbol (`str`): Название тикера.
+            interval (`Timeframe`): Таймфрейм свечей.
+            start_time (`int`): Время начала периода в миллисекундах.
+            end_time (`int | None`): Время окончания периода в миллисекундах. По умолчанию — сейчас.
+            futures (`bool`): Загружать фьючерсные свечи вместо спотовых.
+            concurrency (`int`): Максимум одновременных запросов.
+
+        Возвращает:
+            `AsyncIterator[list[KlineDict]]`: Страницы свечей в хронологическом порядке.
+        """
+        page_size = self._FUTURES_KLINES_PAGE_SIZE if futures else self._KLINES_PAGE_SIZE
+        if page_size is None:
+            raise NotImplementedError("Method will be implemented later.")
+
+        end_time = int(time.time() * 1000) if end_time is None else end_time
+        interval_ms = interval.to_seconds * 1000
+        step = page_size * interval_ms
+        window_starts = iter(range(start_time - start_time % interval_ms, end_time + 1, step))
+
+        pending: deque[asyncio.Task[list[KlineDict]]] = deque()
+
+        def schedule() -> None:
+            for window_start in window_starts:
+                window_end = min(window_start + step - 1, end_time)
+                pending.append(
+                    asyncio.create_task(
+                        self._klines_page(symbol, interval, window_start, window_end, futures)
+                    )
+                )
+                if len(pending) >= max(concurrency, 1):
+                    return
+
+        last_time = start_time - 1
+        try:
+            schedule()
+            while pending:
+                klines = await pending.popleft()
+                schedule()
+                page = []
+                for kline in sorted(klines, key=lambda kline: kline["t"]):
+                    # Отбрасываем дубли (биржи повторяют граничную свечу) и свечи вне периода
+                    if last_time < kline["t"] <= end_time:
+                        page.append(kline)
+                        last_time = kline["t"]
+                if page:
+                    yield page
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _klines_page(
+        self,
+        symbol: str,
+        interval: Timeframe,
+        start_time: int,
+        end_time: int,
+        futures: bool,
+    ) -> list[KlineDict]:
+        """Загружает одно окно свечей для `klines_range`. Переопределяется биржами, у которых
+        `limit` несовместим с `start_time`/`end_time`.
+        """
+        fetch = self.futures_klines if futures else self.klines
+        return await fetch(
+            symbol=symbol,
+            interval=interval,
+            limit=self._FUTURES_KLINES_PAGE_SIZE if futures else self._KLINES_PAGE_SIZE,
+            start_time=start_time,
+            end_time=end_time,
+        )
+
     @overload
     async def funding_rate(self, symbol: str) -> float: ...
 
@@ -527,6 +742,171 @@ class IUniClient(ABC, Generic[TClient]):
         """
         ...
 
+    async def futures_order_cancel(
+        self,
+        symbol: str,
+        order_id: str | None = None,
+        client_order_id: str | None = None,
+    ) -> OrderIdDict:
+        """Отменяет фьючерсный ордер.
+
+        Реализован для Binance, Aster, Bybit, Bitget и Gate, на остальных биржах
+        выбрасывает `NotImplementedError`.
+
+        Параметры:
+            symbol (`str`): Название тикера.
+            order_id (`str | None`): ID ордера на бирже.
+            client_order_id (`str | None`): Пользовательский ID ордера (если не передан `order_id`).
+
+        Возвращает:
+            `OrderIdDict`: Словарь с айди отмененного ордера.
+        """
+        raise NotImplementedError("Method will be implemented later.")
+
+    async def futures_orders_create_batch(
+        self, orders: list[dict[str, Any]]
+    ) -> list[OrderIdDict | Exception]:
+        """Создает несколько фьючерсных ордеров.
+
+        Ордера разбиваются на пакеты по лимиту пакетного эндпоинта биржи, пакеты отправляются
+        одновременно. Если пакетного эндпоинта нет, ордера создаются одновременными
+        вызовами `futures_order_create`.
+
+        На OKX, MEXC, Kucoin, BingX и Hyperliquid создание ордеров через унифицированный
+        клиент пока не реализовано: результат каждого ордера — `NotImplementedError`.
+
+        Параметры:
+            orders (`list[dict[str, Any]]`): Параметры ордеров — аргументы `futures_order_create`,
+                например `{"symbol": "BTCUSDT", "side": OrderSide.BUY, "type": OrderType.LIMIT, "quantity": "0.01", "price": "60000"}`.
+
+        Возвращает:
+            `list[OrderIdDict | Exception]`: Результат по каждому ордеру в порядке входного списка:
+                айди созданного ордера или исключение, если ордер не создан.
+        """
+        return await self._run_batched(
+            items=orders,
+            size=self._FUTURES_BATCH_CREATE_SIZE,
+            group_key=self._futures_orders_create_group,
+            send_chunk=self._futures_orders_create_chunk,
+            send_one=self.futures_order_create,
+            check=self._check_futures_order,
+        )
+
+    async def futures_orders_cancel_batch(
+        self, cancels: list[dict[str, Any]]
+    ) -> list[OrderIdDict | Exception]:
+        """Отменяет несколько фьючерсных ордеров.
+
+        Отмены разбиваются на пакеты по лимиту пакетного эндпоинта биржи, пакеты отправляются
+        одновременно. Если пакетного эндпоинта нет, ордера отменяются одновременными
+        вызовами `futures_order_cancel`.
+
+        На OKX, MEXC, Kucoin, BingX и Hyperliquid отмена ордеров через унифицированный
+        клиент пока не реализована: результат каждого ордера — `NotImplementedError`.
+
+        Параметры:
+            cancels (`list[dict[str, Any]]`): Аргументы `futures_order_cancel`,
+                например `{"symbol": "BTCUSDT", "order_id": "123"}`.
+
+        Возвращает:
+            `list[OrderIdDict | Exception]`: Результат по каждому ордеру в порядке входного списка:
+                айди отмененного ордера или исключение, если ордер не отменен.
+        """
+        return await self._run_batched(
+            items=cancels,
+            size=self._FUTURES_BATCH_CANCEL_SIZE,
+            group_key=self._futures_orders_cancel_group,
+            send_chunk=self._futures_orders_cancel_chunk,
+            send_one=self.futures_order_cancel,
+        )
+
+    def _check_futures_order(self, order: dict[str, Any]) -> None:
+        """Проверяет параметры ордера перед отправкой пакетом и выбрасывает ошибку, если они неверны."""
+
+    def _futures_orders_create_group(self, order: dict[str, Any]) -> Any:
+        """Ключ группировки ордеров: в один пакет попадают ордера с одинаковым ключом."""
+        return None
+
+    def _futures_orders_cancel_group(self, cancel: dict[str, Any]) -> Any:
+        """Ключ группировки отмен: большинство бирж отменяют пакетом ордера одного тикера."""
+        return cancel["symbol"]
+
+    async def _futures_orders_create_chunk(
+        self, orders: list[dict[str, Any]]
+    ) -> list[OrderIdDict | Exception]:
+        """Создает пакет ордеров одним запросом. Переопределяется биржами с пакетным эндпоинтом."""
+        raise NotImplementedError("Method will be implemented later.")
+
+    async def _futures_orders_cancel_chunk(
+        self, cancels: list[dict[str, Any]]
+    ) -> list[OrderIdDict | Exception]:
+        """Отменяет пакет ордеров одним запросом. Переопределяется биржами с пакетным эндпоинтом."""
+        raise NotImplementedError("Method will be implemented later.")
+
+    @staticmethod
+    async def _run_batched(
+        items: list[dict[str, Any]],
+        size: int | None,
+        group_key: Callable[[dict[str, Any]], Any],
+        send_chunk: Callable[[list[dict[str, Any]]], Awaitable[list[Any]]],
+        send_one: Callable[..., Awaitable[Any]],
+        check: Callable[[dict[str, Any]], None] | None = None,
+    ) -> list[Any]:
+        """Разбивает элементы на пакеты, отправляет их одновременно и собирает результаты.
+
+        Параметры:
+            items (`list[dict[str, Any]]`): Элементы (параметры ордеров или отмен).
+            size (`int | None`): Максимальный размер пакета. None — отправлять по одному.
+            group_key (`Callable`): Ключ, по которому элементы группируются в пакеты.
+            send_chunk (`Callable`): Отправка пакета, возвращает результаты в порядке пакета.
+            send_one (`Callable`): Отправка одного элемента.
+            check (`Callable | None`): Проверка элемента перед разбиением на пакеты.
+
+        Элемент с ошибкой в проверке или в аргументах не отправляется, ошибка попадает
+        только в его результат.
+
+        Возвращает:
+            `list[Any]`: Результаты в порядке входного списка; ошибки возвращаются исключениями.
+        """
+        if size is None:
+
+            async def send(item: dict[str, Any]) -> Any:
+                # Неверные аргументы (TypeError) попадают в результат элемента, а не в весь вызов
+                return await send_one(**item)
+
+            return list(
+                await asyncio.gather(*(send(item) for item in items), return_exceptions=True)
+            )
+
+        results: list[Any] = [None] * len(items)
+        groups: dict[Any, list[int]] = {}
+        for index, item in enumerate(items):
+            try:
+                if check is not None:
+                    check(item)
+                key = group_key(item)
+            except Exception as e:
+                results[index] = e
+                continue
+            groups.setdefault(key, []).append(index)
+        chunks = [chunk for indices in groups.values() for chunk in batched_list(indices, size)]
+        responses = await asyncio.gather(
+            *(send_chunk([items[index] for index in chunk]) for chunk in chunks),
+            return_exceptions=True,
+        )
+
+        for chunk, response in zip(chunks, responses, strict=True):
+            for position, index in enumerate(chunk):
+                if isinstance(response, BaseException):
+                    results[index] = response
+                elif position < len(response):
+                    results[index] = response[position]
+                else:
+                    results[index] = AdapterError(
+                        f"Batch response has {len(response)} results for {len(chunk)} items"
+                    )
+        return results
+
     @abstractmethod
     async def futures_position_info(self, symbol: str) -> PositionInfoDict:
         """Возвращает информацию о позиции для фьючерсного тикера.
@@ -6,7 +6,7 @@ from typing import Any
 
 from loguru import logger as _logger
 
-from unicex._base import BaseClient, Websocket
+from unicex._base import BaseClient, MessageBatch, Websocket
 from unicex.enums import Timeframe
 from unicex.exceptions import AdapterError
 from unicex.types import LoggerLike
@@ -42,9 +42,17 @@ class IUniWebsocketManager(ABC):
         adapter_func: Callable[[dict], Any],
         callback: CallbackType,
     ) -> CallbackType:
-        """Создает обертку над callback, применяя адаптер к сырым сообщениям."""
+        """Создает обертку над callback, применяя адаптер к сырым сообщениям.
+
+        В пакетном режиме вебсокета (`batch_size`) обертка адаптирует всю пачку за один проход
+        и вызывает callback один раз со списком унифицированных элементов.
+        """
 
         async def _wrapper(raw_msg: dict) -> None:
+            if isinstance(raw_msg, MessageBatch):
+                if items := self._adapt_batch(adapter_func, raw_msg):
+                    await callback(items)
+                return
             try:
                 adapted = adapter_func(raw_msg)
             except Exception as e:
@@ -61,6 +69,22 @@ class IUniWebsocketManager(ABC):
 
         return _wrapper
 
+    def _adapt_batch(self, adapter_func: Callable[[dict], Any], batch: MessageBatch) -> list:
+        """Адаптирует пачку сырых сообщений в один список унифицированных элементов."""
+        items: list = []
+        for raw_msg in batch:
+            try:
+                adapted = adapter_func(raw_msg)
+            except Exception as e:
+                if not (isinstance(e, AdapterError) and self._is_service_message(raw_msg)):
+                    self._logger.error(f"{type(e)} while adapting message: {e}")
+                continue
+            if isinstance(adapted, list):
+                items.extend(adapted)
+            else:
+                items.append(adapted)
+        return items
+
     def _is_service_message(self, raw_msg: Any) -> bool:
         """Дополнительно обрабатывает ошибку адаптации сообщения на случай, если это сервисное сообщение, например `ping` или `subscribe`.
 
@@ -214,6 +238,11 @@ class IUniWebsocketManager(ABC):
 
         Должен быть указан либо `symbol`, либо `symbols`.
 
+        Если политика переполнения не задана явно, очередь стрима схлопывает сообщения
+        по символу (`overflow_policy="conflate"`): обработчик получает самые свежие цены.
+        Для быстрого обработчика, которому важна задержка, можно передать менеджеру
+        `dispatch="inline"`: сообщения пойдут в callback без очереди.
+
         Возвращает:
             `Websocket`: Экземпляр вебсокета.
         """
@@ -237,6 +266,9 @@ class IUniWebsocketManager(ABC):
 
         Должен быть указан либо `symbol`, либо `symbols`.
 
+        Если политика переполнения не задана явно и биржа присылает снимки стакана, а не дельты,
+        очередь стрима схлопывает сообщения по символу (`overflow_policy="conflate"`).
+
         Возвращает:
             `Websocket`: Экземпляр вебсокета.
         """
@@ -2,8 +2,37 @@
 
 __all__ = [
     "BaseClient",
+    "BaseRateLimiter",
+    "ClockSync",
+    "ConflatingQueue",
+    "Eip712Signer",
+    "HedgePolicy",
+    "HmacSigner",
+    "KeepWarm",
+    "LatencyHistogram",
+    "MessageBatch",
+    "ProxyPool",
+    "RequestEvent",
+    "RequestHooks",
+    "ResponseCache",
+    "RetryPolicy",
+    "CircuitBreaker",
+    "TokenBucket",
+    "SessionPool",
+    "SpillQueue",
     "Websocket",
 ]
 
+from .cache import ResponseCache
 from .client import BaseClient
-from .websocket import Websocket
+from .clock import ClockSync
+from .hedge import HedgePolicy
+from .metrics import LatencyHistogram, RequestEvent, RequestHooks
+from .proxy import ProxyPool
+from .queues import ConflatingQueue, SpillQueue
+from .rate_limiter import BaseRateLimiter, TokenBucket
+from .retry import CircuitBreaker, RetryPolicy
+from .session import SessionPool
+from .signer import Eip712Signer, HmacSigner
+from .warm import KeepWarm
+from .websocket import MessageBatch, Websocket
@@ -0,0 +1,186 @@
+__all__ = ["ResponseCache"]
+
+import time
+from collections import OrderedDict
+from typing import Any, ClassVar
+from urllib.parse import urlsplit
+
+
+class ResponseCache:
+    """In-memory кэш ответов публичных GET-эндпоинтов с TTL и LRU-вытеснением.
+
+    Время жизни задается для каждого эндпоинта отдельно (по пути URL). Эндпоинты без TTL
+    и подписанные запросы не кэшируются. Один экземпляр можно передать нескольким клиентам.
+
+    Закэшированный объект возвращается всем вызывающим без копирования, поэтому его нельзя мутировать.
+    """
+
+    DEFAULT_TTLS: ClassVar[dict[str, float]] = {
+        # Aster
+        "/fapi/v3/exchangeInfo": 300,
+        "/fapi/v3/fundingInfo": 300,
+        # Binance, Aster spot, Mexc spot
+        "/api/v3/exchangeInfo": 300,
+        "/fapi/v1/exchangeInfo": 300,
+        "/fapi/v1/fundingInfo": 300,
+        # Bybit
+        "/v5/market/instruments-info": 300,
+        # OKX
+        "/api/v5/public/instruments": 300,
+        # Bitget
+        "/api/v2/spot/public/symbols": 300,
+        "/api/v2/mix/market/contracts": 300,
+        # Gate
+        "/api/v4/spot/currency_pairs": 300,
+        "/api/v4/futures/usdt/contracts": 300,
+        # Mexc
+        "/api/v1/contract/detail": 300,
+        # Kucoin
+        "/api/ua/v1/market/instrument": 300,
+        # BingX
+        "/openApi/spot/v1/common/symbols": 300,
+        "/openApi/swap/v2/quote/contracts": 300,
+    }
+    """TTL по умолчанию для редко меняющихся эндпоинтов (правила торговли, контракты), сек.
+
+    Из этих эндпоинтов берут данные `futures_delistings()` и `funding_interval()` на Binance,
+    Aster, Bybit и Gate. Списки тикеров (`tickers()`, `futures_tickers()`) и интервалы
+    финансирования OKX и Bitget берутся из эндпоинтов, которые возвращают и текущие цены
+    или ставки, поэтому по умолчанию не кэшируются: TTL для них задается через `ttls`.
+    """
+
+    def __init__(
+        self,
+        ttls: dict[str, float | None] | None = None,
+        default_ttl: float | None = None,
+        max_size: int = 256,
+    ) -> None:
+        """Инициализирует кэш.
+
+        Параметры:
+            ttls (`dict[str, float | None] | None`): TTL для эндпоинтов: путь -> секунды. Дополняет и переопределяет `DEFAULT_TTLS`. None исключает эндпоинт из кэширования, даже при `default_ttl`.
+            default_ttl (`float | None`): TTL для эндпоинтов, которых нет в таблице. Если None — такие эндпоинты не кэшируются.
+            max_size (`int`): Максимальное количество записей, после которого вытесняются самые давно использованные.
+        """
+        self._ttls: dict[str, float | None] = {**self.DEFAULT_TTLS, **(ttls or {})}
+        self._default_ttl = default_ttl
+        self._max_size = max(max_size, 1)
+        self._entries: OrderedDict[str, tuple[float, str, Any]] = OrderedDict()
+        self._hits: dict[str, int] = {}
+        self._misses: dict[str, int] = {}
+
+    def get_ttl(self, url: str) -> float | None:
+        """Возвращает TTL эндпоинта или None, если эндпоинт не кэшируется.
+
+        Параметры:
+            url (`str`): Полный URL запроса.
+        """
+        path = urlsplit(url).path
+        # Явный None в таблице исключает эндпоинт и из `default_ttl`
+        if path in self._ttls:
+            return self._ttls[path]
+        return self._default_ttl
+
+    def set_ttl(self, path: str, ttl: float | None) -> None:
+        """Задает TTL эндпоинта. None отключает кэширование эндпоинта, даже при `default_ttl`.
+
+        Параметры:
+            path (`str`): Путь эндпоинта, например "/fapi/v1/exchangeInfo".
+            ttl (`float | None`): Время жизни записи, сек.
+        """
+        self._ttls[path] = ttl
+
+    def get(self, key: str, url: str) -> tuple[bool, Any]:
+        """Возвращает запись из кэша.
+
+        Параметры:
+            key (`str`): Ключ запроса.
+            url (`str`): Полный URL запроса (для счетчиков по эндпоинтам).
+
+        Возвращает:
+            `tuple[bool, Any]`: Признак попадания и закэшированное значение.
+        """
+        path = urlsplit(url).path
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, _, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self._hits[path] = self._hits.get(path, 0) + 1
+                return True, value
+            del self._entries[key]
+        self._misses[path] = self._misses.get(path, 0) + 1
+        return False, None
+
+    def set(self, key: str, url: str, value: Any, ttl: float) -> None:
+        """Сохраняет значение в кэш, вытесняя самые давно использованные записи.
+
+        Параметры:
+            key (`str`): Ключ запроса.
+            url (`str`): Полный URL запроса.
+            value (`Any`): Значение для сохранения.
+            ttl (`float`): Время жизни записи, сек.
+        """
+        self._entries[key] = (time.monotonic() + ttl, urlsplit(url).path, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, path: str | None = None) -> int:
+        """Удаляет записи эндпоинта или все записи, если путь не передан.
+
+        Параметры:
+            path (`str | None`): Путь эндпоинта, например "/fapi/v1/exchangeInfo".
+
+        Возвращает:
+            `int`: Количество удаленных записей.
+        """
+        if path is None:
+            removed = len(self._entries)
+            self._entries.clear()
+            return removed
+        keys = [key for key, (_, entry_path, _) in self._entries.items() if entry_path == path]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    @property
+    def hits(self) -> int:
+        """Возвращает общее количество попаданий в кэш."""
+        return sum(self._hits.values())
+
+    @property
+    def misses(self) -> int:
+        """Возвращает общее количество промахов кэша."""
+        return sum(self._misses.values())
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Возвращает счетчики попаданий и промахов по эндпоинтам.
+
+        Возвращает:
+            `dict[str, dict[str, int]]`: Путь -> {"hits", "misses", "size"}.
+        """
+        sizes: dict[str, int] = {}
+        for _, path, _ in self._entries.values():
+            sizes[path] = sizes.get(path, 0) + 1
+        return {
+            path: {
+                "hits": self._hits.get(path, 0),
+                "misses": self._misses.get(path, 0),
+                "size": sizes.get(path, 0),
+            }
+            for path in {*self._hits, *self._misses, *sizes}
+        }
+
+    def reset_stats(self) -> None:
+        """Обнуляет счетчики попаданий и промахов."""
+        self._hits.clear()
+        self._misses.clear()
+
+    def __len__(self) -> int:
+        """Возвращает количество записей в кэше."""
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        """Репрезентация кэша."""
+        return f"<ResponseCache(size={len(self)}, hits={self.hits}, misses={self.misses})>"
@@ -1,20 +1,43 @@
 __all__ = ["BaseClient"]
 
 import asyncio
-import json
-from itertools import cycle
+import hashlib
+import time
+from functools import partial
 from typing import Any, Self
+from urllib.parse import urlsplit
 
 import aiohttp
+import orjson
 from loguru import logger as _logger
 
-from unicex.exceptions import ResponseError
+from unicex.exceptions import NotSupported, ResponseError
 from unicex.types import LoggerLike, RequestMethod
 
+from .cache import ResponseCache
+from .clock import ClockSync
+from .hedge import HedgePolicy
+from .metrics import RequestEvent, RequestHooks, _TraceTimings, endpoint_template
+from .proxy import ProxyPool
+from .rate_limiter import BaseRateLimiter
+from .retry import RetryPolicy
+from .session import SessionPool
+from .signer import HmacSigner
+from .warm import KeepWarm
+
 
 class BaseClient:
     """Базовый асинхронный класс для работы с API."""
 
+    _RETRYABLE_CODES: frozenset[str] = frozenset()
+    """Коды ошибок биржи, которые означают временный сбой и допускают повтор запроса."""
+
+    _HMAC_DIGEST: Any = hashlib.sha256
+    """Хэш-функция HMAC-подписи запросов."""
+
+    _KEEP_WARM_URLS: tuple[str, ...] = ()
+    """Дешевые эндпоинты (ping, серверное время) для прогрева соединений, по одному на хост."""
+
     def __init__(
         self,
         session: aiohttp.ClientSession,
@@ -24,8 +47,16 @@ class BaseClient:
         logger: LoggerLike | None = None,
         max_retries: int = 3,
         retry_delay: int | float = 0.1,
-        proxies: list[str] | None = None,
+        proxies: list[str] | ProxyPool | None = None,
         timeout: int = 10,
+        rate_limiter: BaseRateLimiter | None = None,
+        single_flight: bool = False,
+        cache: ResponseCache | None = None,
+        retry_policy: RetryPolicy | None = None,
+        hedge: HedgePolicy | None = None,
+        hooks: list[RequestHooks] | None = None,
+        clock_sync: ClockSync | None = None,
+        keep_warm: KeepWarm | None = None,
     ) -> None:
         """Инициализация клиента.
 
@@ -37,18 +68,41 @@ class BaseClient:
             logger (`LoggerLike | None`): Логгер для вывода информации.
             max_retries (`int`): Максимальное количество повторных попыток запроса.
             retry_delay (`int | float`): Задержка между повторными попытками, сек.
-            proxies (`list[str] | None`): Список HTTP(S)‑прокси для циклического использования.
+            proxies (`list[str] | ProxyPool | None`): Список HTTP(S)‑прокси или общий `ProxyPool`. Прокси выбираются с учетом здоровья и задержки.
             timeout (`int`): Максимальное время ожидания ответа от сервера, сек.
+            rate_limiter (`BaseRateLimiter | None`): Ограничитель частоты запросов (например, `RateLimiter.shared()` биржи). Если не передан — запросы не ограничиваются.
+            single_flight (`bool`): Объединять одновременные одинаковые GET-запросы в один сетевой вызов с общим результатом.
+            cache (`ResponseCache | None`): Кэш ответов публичных эндпоинтов (например, `ResponseCache()`). Если не передан — ответы не кэшируются.
+            retry_policy (`RetryPolicy | None`): Политика повторов (backoff, jitter, `Retry-After`, предохранитель). Если не передана — собирается из `max_retries` и `retry_delay`.
+            hedge (`HedgePolicy | None`): Политика хеджирования GET-запросов: дубль запроса после перцентиля недавних задержек. Если не передана — запросы не хеджируются.
+            hooks (`list[RequestHooks] | None`): Обработчики событий жизненного цикла запросов (например, `LatencyHistogram()`).
+            clock_sync (`ClockSync | None`): Синхронизация часов с сервером биржи для подписи запросов. Если не передана — используется локальное время.
+            keep_warm (`KeepWarm | None`): Прогрев и поддержание открытых соединений к хостам биржи (например, `KeepWarm(connections=2)`), запускается через `warm_up()`. Если не передан — `warm_up()` использует настройки по умолчанию.
         """
         self._api_key = api_key
         self._api_secret = api_secret
+        self._hmac_signer = HmacSigner(api_secret, self._HMAC_DIGEST) if api_secret else None
         self._api_passphrase = api_passphrase
         self._session = session
         self._logger = logger or _logger
-        self._max_retries = max(max_retries, 1)
-        self._retry_delay = max(retry_delay, 0)
-        self._proxies_cycle = cycle(proxies) if proxies else None
+        self._retry_policy = retry_policy or RetryPolicy(
+            max_retries=max_retries, base_delay=retry_delay
+        )
+        self._proxy_pool = (
+            proxies if isinstance(proxies, ProxyPool) else ProxyPool(proxies) if proxies else None
+        )
         self._timeout = timeout
+        self._rate_limiter = rate_limiter
+        self._single_flight = single_flight
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._cache = cache
+        self._hedge = hedge
+        self._hooks = list(hooks) if hooks else []
+        self._clock_sync = clock_sync
+        self._owns_clock_task = False
+        self._keep_warm = keep_warm
+        self._exchange = SessionPool.key_for(type(self))
+        self._session_released = False
 
     @classmethod
     async def create(
@@ -60,8 +114,16 @@ class BaseClient:
         logger: LoggerLike | None = None,
         max_retries: int = 3,
         retry_delay: int | float = 0.1,
-        proxies: list[str] | None = None,
+        proxies: list[str] | ProxyPool | None = None,
         timeout: int = 10,
+        rate_limiter: BaseRateLimiter | None = None,
+        single_flight: bool = False,
+        cache: ResponseCache | None = None,
+        retry_policy: RetryPolicy | None = None,
+        hedge: HedgePolicy | None = None,
+        hooks: list[RequestHooks] | None = None,
+        clock_sync: ClockSync | None = None,
+        keep_warm: KeepWarm | None = None,
     ) -> Self:
         """Создаёт инстанцию клиента.
 
@@ -69,18 +131,26 @@ class BaseClient:
             api_key (`str | None`): Ключ API для аутентификации.
             api_secret (`str | None`): Секретный ключ API для аутентификации.
             api_passphrase (`str | None`): Пароль API для аутентификации (Bitget, OKX).
-            session (`aiohttp.ClientSession | None`): Сессия для HTTP‑запросов (если не передана, будет создана).
+            session (`aiohttp.ClientSession | None`): Сессия для HTTP‑запросов (если не передана, будет взята общая сессия биржи из `SessionPool`).
             logger (`LoggerLike | None`): Логгер для вывода информации.
             max_retries (`int`): Максимум повторов при ошибках запроса.
             retry_delay (`int | float`): Задержка между повторами, сек.
-            proxies (`list[str] | None`): Список HTTP(S)‑прокси.
+            proxies (`list[str] | ProxyPool | None`): Список HTTP(S)‑прокси или общий `ProxyPool`.
             timeout (`int`): Таймаут ответа сервера, сек.
+            rate_limiter (`BaseRateLimiter | None`): Ограничитель частоты запросов (например, `RateLimiter.shared()` биржи). Если не передан — запросы не ограничиваются.
+            single_flight (`bool`): Объединять одновременные одинаковые GET-запросы в один сетевой вызов с общим результатом.
+            cache (`ResponseCache | None`): Кэш ответов публичных эндпоинтов (например, `ResponseCache()`). Если не передан — ответы не кэшируются.
+            retry_policy (`RetryPolicy | None`): Политика повторов (backoff, jitter, `Retry-After`, предохранитель). Если не передана — собирается из `max_retries` и `retry_delay`.
+            hedge (`HedgePolicy | None`): Политика хеджирования GET-запросов: дубль запроса после перцентиля недавних задержек. Если не передана — запросы не хеджируются.
+            hooks (`list[RequestHooks] | None`): Обработчики событий жизненного цикла запросов (например, `LatencyHistogram()`).
+            clock_sync (`ClockSync | None`): Синхронизация часов с сервером биржи для подписи запросов. Если не передана — используется локальное время.
+            keep_warm (`KeepWarm | None`): Прогрев и поддержание открытых соединений к хостам биржи (например, `KeepWarm(connections=2)`), запускается через `warm_up()`. Если не передан — `warm_up()` использует настройки по умолчанию.
 
         Возвращает:
             `Self`: Созданный экземпляр клиента.
         """
         return cls(
-            session=session or aiohttp.ClientSession(),
+            session=session or SessionPool.acquire(SessionPool.key_for(cls)),
             api_key=api_key,
             api_secret=api_secret,
             api_passphrase=api_passphrase,
@@ -89,11 +159,93 @@ class BaseClient:
             retry_delay=retry_delay,
             proxies=proxies,
             timeout=timeout,
+            rate_limiter=rate_limiter,
+            single_flight=single_flight,
+            cache=cache,
+            retry_policy=retry_policy,
+            hedge=hedge,
+            hooks=hooks,
+            clock_sync=clock_sync,
+            keep_warm=keep_warm,
         )
 
     async def close_connection(self) -> None:
-        """Закрывает сессию."""
-        await self._session.close()
+        """Закрывает сессию. Общая сессия из `SessionPool` закрывается, когда ее освободят все клиенты."""
+        # Фоновая синхронизация часов использует сессию клиента, который ее запустил
+        if self._clock_sync and self._owns_clock_task:
+            await self._clock_sync.stop()
+            self._owns_clock_task = False
+        if self._keep_warm:
+            await self._keep_warm.stop()
+        # Повторное закрытие (явное и в __aexit__) не должно второй раз уменьшать счетчик общей сессии
+        if self._session_released:
+            return
+        self._session_released = True
+        if SessionPool.owns(self._session):
+            await SessionPool.release(self._session)
+        else:
+            await self._session.close()
+
+    async def sync_clock(self) -> float:
+        """Синхронизирует часы с сервером биржи и запускает фоновую синхронизацию.
+
+        Если клиент создан без `clock_sync`, используется общий `ClockSync.shared()` биржи.
+        Вызовите перед первым подписанным запросом, чтобы метка времени сразу была точной.
+
+        Возвращает:
+            `float`: Смещение серверных часов относительно локальных, сек.
+        """
+        if self._clock_sync is None:
+            self._clock_sync = ClockSync.shared(self._exchange)
+        offset = await self._clock_sync.sync(self._fetch_server_time)
+        self._start_clock_sync()
+        return offset
+
+    async def warm_up(self, urls: list[str] | None = None) -> None:
+        """Открывает соединения к хостам биржи и запускает их фоновое поддержание.
+
+        Вызовите при старте стратегии, чтобы первый ордер не тратил время на DNS, TCP и TLS.
+        Если клиент создан без `keep_warm`, используется `KeepWarm()` с настройками по умолчанию.
+
+        Параметры:
+            urls (`list[str] | None`): Эндпоинты для прогрева, по одному на хост. Если не переданы — используются ping/time эндпоинты биржи.
+        """
+        urls = urls or list(self._KEEP_WARM_URLS)
+        if not urls:
+            raise NotSupported(f"Keep-warm endpoints are not defined for {type(self).__name__}")
+        if self._keep_warm is None:
+            self._keep_warm = KeepWarm(logger=self._logger)
+
+        keepalive = getattr(self._session.connector, "_keepalive_timeout", None)
+        if keepalive and self._keep_warm.interval >= keepalive:
+            self._logger.warning(
+                f"Keep-warm interval {self._keep_warm.interval}s is not below "
+                f"connector keepalive_timeout {keepalive}s, idle connections will be dropped"
+            )
+
+        # Запросы идут в обход single-flight и кэша: одинаковые запросы не должны склеиваться
+        probes = [partial(self._send_request, "GET", url, None, None, None) for url in urls]
+        await self._keep_warm.warm(probes)
+        self._keep_warm.start(probes)
+
+    def connection_stats(self) -> dict[str, Any]:
+        """Возвращает состояние соединений клиента.
+
+        Возвращает:
+            `dict`: {"keep_warm": состояние прогрева или None, "hosts": {host: {"idle", "active"}}}.
+        """
+        hosts: dict[str, dict[str, int]] = {}
+        connector = self._session.connector
+        for key, conns in getattr(connector, "_conns", {}).items():
+            host = hosts.setdefault(f"{key.host}:{key.port}", {"idle": 0, "active": 0})
+            host["idle"] += len(conns)
+        for key, conns in getattr(connector, "_acquired_per_host", {}).items():
+            host = hosts.setdefault(f"{key.host}:{key.port}", {"idle": 0, "active": 0})
+            host["active"] += len(conns)
+        return {
+            "keep_warm": self._keep_warm.stats() if self._keep_warm else None,
+            "hosts": hosts,
+        }
 
     def is_authorized(self) -> bool:
         """Проверяет наличие API‑ключей у клиента.
@@ -118,6 +270,8 @@ class BaseClient:
         params: dict[str, Any] | None = None,
         data: dict[str, Any] | None = None,
         headers: dict[str, Any] | None = None,
+        *,
+        signed: bool = False,
     ) -> Any:
         """Выполняет HTTP‑запрос к API биржи.
 
@@ -127,6 +281,7 @@ class BaseClient:
             params (`dict[str, Any] | None`): Параметры запроса (query string).
             data (`dict[str, Any] | None`): Тело запроса для POST/PUT.
             headers (`dict[str, Any] | None`): Заголовки запроса.
+            signed (`bool`): Подписанный запрос. Такие ответы не кэшируются: метка времени и подпись делают ключ каждого запроса уникальным.
 
         Возвращает:
             `dict | list`: Ответ API в формате JSON.
@@ -135,48 +290,303 @@ class BaseClient:
             f"Request: {method} {url} | Params: {params} | Data: {data} | Headers: {headers}"
         )
 
-        errors = []
-        for attempt in range(1, self._max_retries + 1):
+        if method != "GET":
+            return await self._send_request(method, url, params, data, headers)
+
+        key = self._request_key(url, params, headers)
+
+        # Ответы медленно меняющихся публичных эндпоинтов отдаются из кэша
+        ttl = self._cache.get_ttl(url) if self._cache is not None and not signed else None
+        if ttl is not None:
+            hit, value = self._cache.get(key, url)  # type: ignore[union-attr]
+            if hit:
+                self._logger.debug(f"Cache hit: GET {url}")
+                return value
+
+        if self._single_flight:
+            result = await self._make_single_flight_request(key, url, params, headers)
+        else:
+            result = await self._send_get_request(url, params, headers)
+
+        if ttl is not None:
+            self._cache.set(key, url, result, ttl)  # type: ignore[union-attr]
+        return result
+
+    @staticmethod
+    def _request_key(
+        url: str, params: dict[str, Any] | None, headers: dict[str, Any] | None
+    ) -> str:
+        """Возвращает ключ GET-запроса для объединения запросов и кэша ответов.
+
+        Заголовки входят в ключ, поэтому подписанные запросы никогда не совпадают с публичными.
+        """
+        return f"{url}|{sorted(params.items()) if params else ''}|{sorted(headers.items()) if headers else ''}"
+
+    async def _make_single_flight_request(
+        self,
+        key: str,
+        url: str,
+        params: dict[str, Any] | None,
+        headers: dict[str, Any] | None,
+    ) -> Any:
+        """Объединяет одновременные одинаковые GET-запросы в один сетевой вызов.
+
+        Все ожидающие получают один и тот же распарсенный объект, поэтому его нельзя мутировать.
+        Подписанные запросы не объединяются на практике: подпись и временная метка делают их уникальными.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._send_get_request(url, params, headers))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._release_inflight(key, t))
+        else:
+            self._logger.debug(f"Joined in-flight request: GET {url}")
+        # shield: отмена одного из ожидающих не должна отменять запрос для остальных
+        return await asyncio.shield(task)
+
+    def _release_inflight(self, key: str, task: asyncio.Task) -> None:
+        """Удаляет завершенный запрос из списка выполняющихся."""
+        self._inflight.pop(key, None)
+        if not task.cancelled():
+            task.exception()  # Помечаем исключение как полученное, если все ожидающие отменились
+
+    async def _send_get_request(
+        self,
+        url: str,
+        params: dict[str, Any] | None,
+        headers: dict[str, Any] | None,
+    ) -> Any:
+        """Отправляет GET-запрос, хеджируя его, если задана политика `HedgePolicy`."""
+        hedge = self._hedge
+        path = urlsplit(url).path
+        if hedge is None or not hedge.applies_to(path):
+            return await self._send_request("GET", url, params, None, headers)
+
+        hedge.requests += 1
+        started = time.monotonic()
+        primary = asyncio.create_task(self._send_request("GET", url, params, None, headers))
+        pending = {primary}
+        hedges_left = hedge.max_hedges
+        error: BaseException | None = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=hedge.get_delay(path) if hedges_left else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    # Ответа нет дольше перцентиля недавних задержек — отправляем дубль
+                    self._logger.debug(f"Hedging request: GET {url}")
+                    hedges_left -= 1
+                    hedge.hedged += 1
+                    pending.add(
+                        asyncio.create_task(self._send_request("GET", url, params, None, headers))
+                    )
+                    continue
+                for task in done:
+                    if task.exception() is None:
+                        hedge.record(path, time.monotonic() - started)
+                        if task is not primary:
+                            hedge.hedge_wins += 1
+                        return task.result()
+                    error = task.exception()
+            raise error  # type: ignore[misc]
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _send_request(
+        self,
+        method: RequestMethod,
+        url: str,
+        params: dict[str, Any] | None,
+        data: dict[str, Any] | None,
+        headers: dict[str, Any] | None,
+    ) -> Any:
+        """Отправляет HTTP‑запрос с повторами по политике `RetryPolicy`."""
+        policy = self._retry_policy
+        breaker = policy.circuit_breaker
+        host = urlsplit(url).netloc
+        errors: list[Exception] = []
+        for attempt in range(1, policy.max_retries + 1):
+            retry_after = None
+            proxy = self._proxy_pool.choose() if self._proxy_pool else None
+            rate_limiter = self._get_rate_limiter(proxy)
+            event = self._new_event(method, url, attempt) if self._hooks else None
+            timings = _TraceTimings() if event else None
+            probe = False
             try:
+                # Пока хост деградировал, запросы падают сразу, не копя ожидающие корутины
+                if breaker:
+                    probe = breaker.before_request(host)
+
+                # Дожидаемся бюджета на запрос, чтобы не получить 429/418 от биржи
+                if rate_limiter:
+                    await rate_limiter.acquire(method, url, params, data)
+
+                if event:
+                    self._emit("on_request_start", event)
+
+                started = time.monotonic()
                 async with self._session.request(
                     method=method,
                     url=url,
                     params=params,
                     json=data if method in {"POST", "PUT"} else None,  # Передача тела запроса
                     headers=headers,
-                    proxy=next(self._proxies_cycle) if self._proxies_cycle else None,
+                    proxy=proxy,
                     timeout=aiohttp.ClientTimeout(total=self._timeout) if self._timeout else None,
+                    trace_request_ctx=timings,
                 ) as response:
-                    return await self._handle_response(response=response)
+                    if event:
+                        event.status = response.status
+                        event.ttfb = time.monotonic() - started
+                    if rate_limiter:
+                        rate_limiter.calibrate(url, response.status, response.headers)
+                    if proxy:
+                        self._proxy_pool.record_success(proxy, time.monotonic() - started)  # type: ignore[union-attr]
+                    retry_after = policy.parse_retry_after(response.headers)
+                    try:
+                        result = await self._handle_response(response=response)
+                    finally:
+                        if event:
+                            event.total = time.monotonic() - started
+                            event.bytes = response.content.total_bytes
+                            event.dns = timings.dns  # type: ignore[union-attr]
+                            event.connect = timings.connect  # type: ignore[union-attr]
+                            self._emit("on_response", event)
 
-            except (TimeoutError, aiohttp.ServerTimeoutError, aiohttp.ConnectionTimeoutError) as e:
+            except (ResponseError, aiohttp.ClientError, TimeoutError, ConnectionResetError) as e:
+                # Ответ биржи (даже с ошибкой) означает, что прокси работает
+                if proxy and not isinstance(e, ResponseError):
+                    self._proxy_pool.record_failure(proxy)  # type: ignore[union-attr]
+                if event:
+                    event.error = e
+                    self._emit("on_error", event)
+                if breaker:
+                    if policy.is_host_failure(e):
+                        breaker.record_failure(host)
+                    else:
+                        breaker.record_success(host)  # Хост отвечает, ошибка в самом запросе
+                    probe = False
+                if not policy.is_retryable(e, method, self._RETRYABLE_CODES):
+                    raise
+                if retry_after is not None and retry_after > policy.max_retry_after:
+                    raise
                 errors.append(e)
+                if attempt == policy.max_retries:
+                    break
+                delay = policy.get_delay(attempt, retry_after)
                 self._logger.debug(
-                    f"Attempt {attempt}/{self._max_retries} failed: {type(e)} -> {e or 'null'}"
+                    f"Attempt {attempt}/{policy.max_retries} failed: {type(e)} -> {e or 'null'}. "
+                    f"Retry in {delay:.3f}s"
                 )
-                if attempt < self._max_retries:
-                    await asyncio.sleep(self._retry_delay)
+                if event:
+                    event.retry_in = delay
+                    self._emit("on_retry", event)
+                await asyncio.sleep(delay)
+
+            else:
+                if breaker:
+                    breaker.record_success(host)
+                    probe = False
+                return result
+
+            finally:
+                # Пробный запрос отменили или он упал с посторонней ошибкой: хост не ответил,
+                # поэтому состояние не меняется, но следующий запрос должен стать пробным
+                if probe:
+                    breaker.release_probe(host)  # type: ignore[union-attr]
 
+        if isinstance(errors[-1], ResponseError):
+            raise errors[-1]
         raise ConnectionError(
-            f"Connection error after {self._max_retries} request on {method} {url}. Errors: {errors}"
+            f"Connection error after {policy.max_retries} request on {method} {url}. Errors: {errors}"
         ) from errors[-1]
 
+    def _new_event(self, method: str, url: str, attempt: int) -> RequestEvent:
+        """Создает событие жизненного цикла для попытки запроса."""
+        return RequestEvent(
+            exchange=self._exchange,
+            method=method,
+            endpoint=endpoint_template(urlsplit(url).path),
+            url=url,
+            attempt=attempt,
+        )
+
+    def _emit(self, name: str, event: RequestEvent) -> None:
+        """Вызывает обработчик события у всех хуков. Ошибки хуков не ломают запрос."""
+        for hooks in self._hooks:
+            try:
+                getattr(hooks, name)(event)
+            except Exception as e:
+                self._logger.error(f"Error in request hook {type(hooks).__name__}.{name}: {e}")
+
+    async def _fetch_server_time(self) -> int:
+        """Возвращает серверное время биржи в миллисекундах. Переопределяется в клиентах бирж."""
+        raise NotSupported(f"Server time is not supported by {type(self).__name__}")
+
+    def _server_time(self) -> float:
+        """Возвращает текущее время по часам биржи, сек. Без `clock_sync` — локальное время."""
+        if self._clock_sync is None:
+            return time.time()
+        self._start_clock_sync()
+        return self._clock_sync.time()
+
+    def _server_timestamp(self, milliseconds: bool = True) -> int:
+        """Возвращает метку времени по часам биржи для подписи запросов.
+
+        Параметры:
+            milliseconds (`bool`): Возвращать в миллисекундах (иначе в секундах).
+
+        Возвращает:
+            `int`: Метка времени.
+        """
+        now = self._server_time()
+        return int(now * 1000) if milliseconds else int(now)
+
+    def _start_clock_sync(self) -> None:
+        """Запускает фоновую синхронизацию часов, если она еще не запущена."""
+        if self._clock_sync is None or self._clock_sync.running:
+            return
+        try:
+            self._clock_sync.start(self._fetch_server_time)
+        except RuntimeError:
+            return  # Нет запущенного цикла событий
+        self._owns_clock_task = True
+
+    def _get_rate_limiter(self, proxy: str | None) -> BaseRateLimiter | None:
+        """Возвращает ограничитель частоты для запроса.
+
+        Лимиты бирж считаются на IP, поэтому у каждого прокси свой бюджет. Он выводится
+        из переданного ограничителя через `for_key` и сохраняет его настройки; клиенты
+        с общим ограничителем делят и бюджеты прокси.
+        """
+        if self._rate_limiter is None or proxy is None:
+            return self._rate_limiter
+        return self._rate_limiter.for_key(proxy)
+
     async def _handle_response(self, response: aiohttp.ClientResponse) -> Any:
         """Обрабатывает HTTP‑ответ.
 
+        Тело ответа читается сырыми байтами и парсится через orjson без промежуточного
+        декодирования в `str`. Текст ответа собирается только при выбрасывании ошибки.
+
         Параметры:
             response (`aiohttp.ClientResponse`): Ответ HTTP‑запроса.
 
         Возвращает:
             `dict | list`: Ответ API в формате JSON.
         """
-        response_text = await response.text()
+        response_body = await response.read()
         status_code = response.status
 
         # Парсинг JSON
         try:
-            response_json = json.loads(response_text)
-        except json.JSONDecodeError as e:
+            response_json = orjson.loads(response_body)
+        except orjson.JSONDecodeError as e:
+            response_text = self._decode_body(response_body)
             raise ResponseError(
                 f"JSONDecodeError: {e}. Response: {response_text}. Status code: {response.status}",
                 status_code=status_code,
@@ -199,25 +609,36 @@ class BaseClient:
                 f"HTTP error: {e}. Response: {response_json}. Status code: {response.status}",
                 status_code=status_code,
                 code=str(error_code),
-                response_text=response_text,
+                response_text=self._decode_body(response_body),
                 response_json=response_json,
             ) from None
 
         # Логирование ответа
         try:
             self._logger.debug(
-                f"Response: {response_text[:300]}{'...' if len(response_text) > 300 else ''}"
+                f"Response: {self._decode_body(response_body[:300])}{'...' if len(response_body) > 300 else ''}"
             )
         except Exception as e:
             self._logger.error(f"Error while logging response: {e}")
 
         # Валидирование ответа в конкретной реализации клиента
-        self._validate_response(status_code, response_text, response_json)
+        self._validate_response(status_code, response_body, response_json)
 
         return response_json
 
+    @staticmethod
+    def _decode_body(response_body: bytes) -> str:
+        """Декодирует сырое тело ответа в строку для логов и текста ошибок."""
+        return response_body.decode("utf-8", errors="replace")
+
     def _validate_response(
-        self, status_code: int, response_text: str, response_json: dict[str, Any]
+        self, status_code: int, response_body: bytes, response_json: dict[str, Any]
     ) -> None:
-        """Проверка ответа API на ошибки биржи. Переопределяется в клиентах конкретных бирж."""
+        """Проверка ответа API на ошибки биржи. Переопределяется в клиентах конкретных бирж.
+
+        Параметры:
+            status_code (`int`): HTTP-статус ответа.
+            response_body (`bytes`): Сырое тело ответа. Декодируется через `_decode_body` только при ошибке.
+            response_json (`dict[str, Any]`): Распарсенный ответ.
+        """
         return None
@@ -0,0 +1,161 @@
+__all__ = ["ClockSync"]
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import ClassVar, Self
+
+from loguru import logger as _logger
+
+from unicex.types import LoggerLike
+
+type ServerTimeFetcher = Callable[[], Awaitable[int]]
+"""Асинхронная функция, возвращающая серверное время биржи в миллисекундах."""
+
+
+class ClockSync:
+    """Оценка смещения локальных часов относительно серверного времени биржи.
+
+    Смещение считается по NTP-схеме: для каждого замера `offset = server - (t0 + t1) / 2`,
+    где `t0`/`t1` — локальное время отправки и получения ответа, а `rtt = t1 - t0`.
+    Из последних `window` замеров берется замер с минимальным RTT: у него наименьшая
+    погрешность, так как она ограничена половиной RTT.
+
+    Подписанные запросы используют `time()` вместо `time.time()`, поэтому метка времени
+    совпадает с часами биржи даже при дрейфе локальных часов.
+    """
+
+    _shared: ClassVar[dict[str, "ClockSync"]] = {}
+    """Общие на процесс экземпляры: ключ биржи -> сервис синхронизации."""
+
+    def __init__(
+        self,
+        interval: float = 60,
+        samples: int = 4,
+        window: int = 16,
+        logger: LoggerLike | None = None,
+    ) -> None:
+        """Инициализирует сервис синхронизации.
+
+        Параметры:
+            interval (`float`): Период фоновой синхронизации, сек.
+            samples (`int`): Количество замеров за один раунд синхронизации.
+            window (`int`): Сколько последних замеров учитывать при выборе смещения.
+            logger (`LoggerLike | None`): Логгер для вывода информации.
+        """
+        self._interval = interval
+        self._samples = max(samples, 1)
+        self._logger = logger or _logger
+        self._window: deque[tuple[float, float]] = deque(maxlen=max(window, 1))
+        self._offset = 0.0
+        self._rtt: float | None = None
+        self._last_sync: float | None = None
+        self._task: asyncio.Task | None = None
+
+    @classmethod
+    def shared(cls, key: str) -> Self:
+        """Возвращает общий на процесс сервис синхронизации биржи.
+
+        Параметры:
+            key (`str`): Ключ биржи, например "binance".
+
+        Возвращает:
+            `Self`: Общий экземпляр сервиса.
+        """
+        instance = cls._shared.get(key)
+        if instance is None:
+            instance = cls()
+            cls._shared[key] = instance
+        return instance  # type: ignore[return-value]
+
+    @property
+    def offset(self) -> float:
+        """Возвращает смещение серверных часов относительно локальных, сек."""
+        return self._offset
+
+    @property
+    def rtt(self) -> float | None:
+        """Возвращает RTT замера, по которому выбрано смещение, сек."""
+        return self._rtt
+
+    @property
+    def running(self) -> bool:
+        """Проверяет, запущена ли фоновая синхронизация."""
+        return self._task is not None and not self._task.done()
+
+    def time(self) -> float:
+        """Возвращает текущее время по часам биржи, сек (аналог `time.time()`)."""
+        return time.time() + self._offset
+
+    async def sync(self, fetch: ServerTimeFetcher) -> float:
+        """Выполняет раунд синхронизации.
+
+        Параметры:
+            fetch (`ServerTimeFetcher`): Функция получения серверного времени в миллисекундах.
+
+        Возвращает:
+            `float`: Новое смещение, сек.
+        """
+        for _ in range(self._samples):
+            t0 = time.time()
+            server = await fetch() / 1000
+            t1 = time.time()
+            self._window.append((t1 - t0, server - (t0 + t1) / 2))
+
+        self._rtt, self._offset = min(self._window)
+        self._last_sync = time.time()
+        self._logger.debug(
+            f"Clock synced: offset={self._offset * 1000:.1f}ms rtt={self._rtt * 1000:.1f}ms"
+        )
+        return self._offset
+
+    def start(self, fetch: ServerTimeFetcher) -> None:
+        """Запускает фоновую синхронизацию. Повторный вызов при работающей синхронизации ничего не делает.
+
+        Параметры:
+            fetch (`ServerTimeFetcher`): Функция получения серверного времени в миллисекундах.
+        """
+        if not self.running:
+            self._task = asyncio.create_task(self._sync_loop(fetch))
+
+    async def stop(self) -> None:
+        """Останавливает фоновую синхронизацию."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def stats(self) -> dict[str, float | bool | None]:
+        """Возвращает состояние синхронизации для мониторинга.
+
+        Возвращает:
+            `dict`: {"offset_ms", "rtt_ms", "last_sync_ago", "running"}.
+        """
+        return {
+            "offset_ms": self._offset * 1000,
+            "rtt_ms": self._rtt * 1000 if self._rtt is not None else None,
+            "last_sync_ago": time.time() - self._last_sync if self._last_sync else None,
+            "running": self.running,
+        }
+
+    async def _sync_loop(self, fetch: ServerTimeFetcher) -> None:
+        """Периодически синхронизирует часы."""
+        while True:
+            # Пропускаем раунд, если часы только что синхронизированы вручную
+            if self._last_sync is None or time.time() - self._last_sync >= self._interval:
+                try:
+                    await self.sync(fetch)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    self._logger.error(f"Clock sync failed: {type(e)} -> {e}")
+            await asyncio.sleep(self._interval)
+
+    def __repr__(self) -> str:
+        """Репрезентация сервиса синхронизации."""
+        return f"<ClockSync({self.stats()})>"
@@ -0,0 +1,103 @@
+__all__ = ["HedgePolicy"]
+
+from collections import deque
+from collections.abc import Collection
+
+
+class HedgePolicy:
+    """Политика хеджирования GET-запросов.
+
+    Если запрос не получил ответа за `percentile` недавних задержек эндпоинта, отправляется
+    дублирующий запрос (через другое соединение пула или другой прокси), и используется
+    первый успешный ответ. Снижает хвостовые задержки ценой дополнительных запросов:
+    каждый дубль расходует бюджет ограничителя частоты.
+
+    Хеджируются только GET-запросы, так как их безопасно выполнять повторно.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        min_delay: float = 0.02,
+        max_delay: float = 1.0,
+        window: int = 200,
+        min_samples: int = 20,
+        max_hedges: int = 1,
+        paths: Collection[str] | None = None,
+    ) -> None:
+        """Инициализирует политику хеджирования.
+
+        Параметры:
+            percentile (`float`): Перцентиль недавних задержек, после которого отправляется дубль (0..1).
+            min_delay (`float`): Минимальная задержка перед дублем, сек.
+            max_delay (`float`): Максимальная задержка перед дублем (и задержка, пока мало измерений), сек.
+            window (`int`): Сколько последних задержек эндпоинта учитывать.
+            min_samples (`int`): Минимальное количество измерений для расчета перцентиля.
+            max_hedges (`int`): Максимальное количество дублей одного запроса.
+            paths (`Collection[str] | None`): Пути эндпоинтов для хеджирования. Если None — хеджируются все GET-запросы.
+        """
+        self.percentile = min(max(percentile, 0.0), 1.0)
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = max(min_samples, 1)
+        self.max_hedges = max(max_hedges, 0)
+        self.paths = frozenset(paths) if paths is not None else None
+        self._window = max(window, 1)
+        self._latencies: dict[str, deque[float]] = {}
+        # Счетчики: запросы через политику, отправленные дубли, победы дублей
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+
+    def applies_to(self, path: str) -> bool:
+        """Проверяет, нужно ли хеджировать запросы к эндпоинту.
+
+        Параметры:
+            path (`str`): Путь эндпоинта.
+        """
+        return self.max_hedges > 0 and (self.paths is None or path in self.paths)
+
+    def get_delay(self, path: str) -> float:
+        """Возвращает задержку перед отправкой дубля.
+
+        Параметры:
+            path (`str`): Путь эндпоинта.
+
+        Возвращает:
+            `float`: Задержка, сек.
+        """
+        latencies = self._latencies.get(path)
+        if not latencies or len(latencies) < self.min_samples:
+            return self.max_delay
+        ordered = sorted(latencies)
+        value = ordered[min(int(len(ordered) * self.percentile), len(ordered) - 1)]
+        return min(max(value, self.min_delay), self.max_delay)
+
+    def record(self, path: str, latency: float) -> None:
+        """Сохраняет задержку успешного запроса.
+
+        Параметры:
+            path (`str`): Путь эндпоинта.
+            latency (`float`): Задержка ответа, сек.
+        """
+        latencies = self._latencies.get(path)
+        if latencies is None:
+            latencies = self._latencies[path] = deque(maxlen=self._window)
+        latencies.append(latency)
+
+    def stats(self) -> dict[str, float | int]:
+        """Возвращает счетчики хеджирования.
+
+        Возвращает:
+            `dict[str, float | int]`: {"requests", "hedged", "hedge_wins", "hedge_rate"}.
+        """
+        return {
+            "requests": self.requests,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "hedge_rate": self.hedged / self.requests if self.requests else 0.0,
+        }
+
+    def __repr__(self) -> str:
+        """Репрезентация политики хеджирования."""
+        return f"<HedgePolicy(percentile={self.percentile}, {self.stats()})>"
@@ -0,0 +1,282 @@
+__all__ = ["LatencyHistogram", "RequestEvent", "RequestHooks"]
+
+import re
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Any
+
+import aiohttp
+
+_ID_SEGMENT = re.compile(r"^(\d+|[0-9a-fA-F-]{16,})$")
+"""Сегменты пути, которые являются идентификаторами (номера и UUID ордеров и т.п.)."""
+
+
+def endpoint_template(path: str) -> str:
+    """Возвращает шаблон эндпоинта: идентификаторы в пути заменяются на `{id}`.
+
+    Параметры:
+        path (`str`): Путь запроса.
+
+    Возвращает:
+        `str`: Шаблон эндпоинта, например "/api/v1/orders/{id}".
+    """
+    return "/".join("{id}" if _ID_SEGMENT.match(part) else part for part in path.split("/"))
+
+
+@dataclass
+class RequestEvent:
+    """Событие жизненного цикла одной попытки REST-запроса."""
+
+    exchange: str
+    """Ключ биржи, например "binance"."""
+
+    method: str
+    """HTTP-метод запроса."""
+
+    endpoint: str
+    """Шаблон эндпоинта (путь с `{id}` вместо идентификаторов)."""
+
+    url: str
+    """Полный URL запроса."""
+
+    attempt: int = 1
+    """Номер попытки, начиная с 1."""
+
+    status: int | None = None
+    """HTTP-статус ответа. None, если ответ не получен."""
+
+    bytes: int = 0
+    """Размер тела ответа, байт."""
+
+    dns: float | None = None
+    """Время DNS-резолва, сек. None, если резолв не выполнялся (кэш, переиспользованное соединение)."""
+
+    connect: float | None = None
+    """Время установки соединения (TCP+TLS), сек. None для переиспользованного соединения."""
+
+    ttfb: float | None = None
+    """Время до получения заголовков ответа, сек."""
+
+    total: float | None = None
+    """Полное время попытки, включая чтение и разбор тела, сек."""
+
+    error: BaseException | None = None
+    """Ошибка попытки, если она завершилась неудачно."""
+
+    retry_in: float | None = None
+    """Задержка перед следующей попыткой (для `on_retry`), сек."""
+
+
+@dataclass
+class _TraceTimings:
+    """Тайминги, собираемые `aiohttp.TraceConfig` для одного запроса."""
+
+    dns: float | None = None
+    connect: float | None = None
+    _started: dict[str, float] = field(default_factory=dict)
+
+
+def create_trace_config() -> aiohttp.TraceConfig:
+    """Создает `aiohttp.TraceConfig`, который пишет тайминги DNS и соединения в `_TraceTimings`.
+
+    Тайминги пишутся, только если в запрос передан `trace_request_ctx=_TraceTimings()`.
+    """
+    trace_config = aiohttp.TraceConfig()
+
+    def on_start(stage: str):
+        async def handler(session: Any, ctx: Any, params: Any) -> None:
+            timings = ctx.trace_request_ctx
+            if isinstance(timings, _TraceTimings):
+                timings._started[stage] = session.loop.time()
+
+        return handler
+
+    def on_end(stage: str):
+        async def handler(session: Any, ctx: Any, params: Any) -> None:
+            timings = ctx.trace_request_ctx
+            if isinstance(timings, _TraceTimings) and stage in timings._started:
+                setattr(timings, stage, session.loop.time() - timings._started.pop(stage))
+
+        return handler
+
+    trace_config.on_dns_resolvehost_start.append(on_start("dns"))
+    trace_config.on_dns_resolvehost_end.append(on_end("dns"))
+    trace_config.on_connection_create_start.append(on_start("connect"))
+    trace_config.on_connection_create_end.append(on_end("connect"))
+    return trace_config
+
+
+class RequestHooks:
+    """Обработчики событий жизненного цикла REST-запросов.
+
+    Наследуйтесь и переопределите нужные методы. Обработчики синхронные и вызываются прямо
+    в цикле запроса, поэтому должны быть быстрыми; исключения в них логируются и не ломают запрос.
+    """
+
+    def on_request_start(self, event: RequestEvent) -> None:
+        """Вызывается перед отправкой каждой попытки запроса."""
+
+    def on_response(self, event: RequestEvent) -> None:
+        """Вызывается после получения и обработки ответа (в том числе с HTTP-ошибкой)."""
+
+    def on_retry(self, event: RequestEvent) -> None:
+        """Вызывается перед повтором запроса. Задержка повтора — в `event.retry_in`."""
+
+    def on_error(self, event: RequestEvent) -> None:
+        """Вызывается при неудачной попытке запроса. Ошибка — в `event.error`."""
+
+
+class LatencyHistogram(RequestHooks):
+    """In-memory гистограммы задержек по бирже, методу и эндпоинту.
+
+    Экспортируется в виде словаря (`to_dict`) или текста в формате Prometheus (`to_prometheus`).
+    """
+
+    DEFAULT_BUCKETS: tuple[float, ...] = (
+        0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+    )  # fmt: skip
+    """Границы корзин гистограммы по умолчанию, сек."""
+
+    def __init__(self, buckets: tuple[float, ...] | None = None) -> None:
+        """Инициализирует агрегатор.
+
+        Параметры:
+            buckets (`tuple[float, ...] | None`): Верхние границы корзин, сек. По умолчанию `DEFAULT_BUCKETS`.
+        """
+        self._bounds = tuple(sorted(buckets or self.DEFAULT_BUCKETS))
+        self._series: dict[tuple[str, str, str, str], dict[str, Any]] = {}
+        self._errors: dict[tuple[str, str, str, str], int] = {}
+        self._retries: dict[tuple[str, str, str], int] = {}
+        self._bytes: dict[tuple[str, str, str], int] = {}
+
+    def on_response(self, event: RequestEvent) -> None:
+        """Учитывает задержки и размер ответа."""
+        labels = (event.exchange, event.method, event.endpoint)
+        stages = (
+            ("total", event.total),
+            ("ttfb", event.ttfb),
+            ("dns", event.dns),
+            ("connect", event.connect),
+        )
+        for stage, value in stages:
+            if value is not None:
+                self._observe((*labels, stage), value)
+        self._bytes[labels] = self._bytes.get(labels, 0) + event.bytes
+
+    def on_retry(self, event: RequestEvent) -> None:
+        """Учитывает повтор запроса."""
+        labels = (event.exchange, event.method, event.endpoint)
+        self._retries[labels] = self._retries.get(labels, 0) + 1
+
+    def on_error(self, event: RequestEvent) -> None:
+        """Учитывает ошибку запроса по типу ошибки."""
+        key = (event.exchange, event.method, event.endpoint, type(event.error).__name__)
+        self._errors[key] = self._errors.get(key, 0) + 1
+
+    def reset(self) -> None:
+        """Очищает все накопленные данные."""
+        self._series.clear()
+        self._errors.clear()
+        self._retries.clear()
+        self._bytes.clear()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Возвращает накопленные данные в виде словаря.
+
+        Возвращает:
+            `dict[str, Any]`: {exchange: {"METHOD endpoint": {stage: {"count", "sum", "buckets"}, "errors", "retries", "bytes"}}}.
+        """
+        result: dict[str, Any] = {}
+        for (exchange, method, endpoint, stage), series in self._series.items():
+            item = self._endpoint_item(result, exchange, method, endpoint)
+            item[stage] = {
+                "count": series["count"],
+                "sum": series["sum"],
+                "buckets": dict(zip((*self._bounds, float("inf")), series["counts"], strict=True)),
+            }
+        for (exchange, method, endpoint, error), count in self._errors.items():
+            item = self._endpoint_item(result, exchange, method, endpoint)
+            item["errors"][error] = count
+        for (exchange, method, endpoint), count in self._retries.items():
+            self._endpoint_item(result, exchange, method, endpoint)["retries"] = count
+        for (exchange, method, endpoint), count in self._bytes.items():
+            self._endpoint_item(result, exchange, method, endpoint)["bytes"] = count
+        return result
+
+    def to_prometheus(self, prefix: str = "unicex") -> str:
+        """Возвращает накопленные данные в текстовом формате Prometheus.
+
+        Параметры:
+            prefix (`str`): Префикс имен метрик.
+
+        Возвращает:
+            `str`: Текст экспозиции Prometheus.
+        """
+        lines = [
+            f"# HELP {prefix}_request_duration_seconds REST request latency by stage.",
+            f"# TYPE {prefix}_request_duration_seconds histogram",
+        ]
+        for (exchange, method, endpoint, stage), series in sorted(self._series.items()):
+            labels = self._labels(exchange=exchange, method=method, endpoint=endpoint, stage=stage)
+            cumulative = 0
+            for bound, count in zip((*self._bounds, float("inf")), series["counts"], strict=True):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                lines.append(
+                    f'{prefix}_request_duration_seconds_bucket{{{labels},le="{le}"}} {cumulative}'
+                )
+            lines.append(f"{prefix}_request_duration_seconds_sum{{{labels}}} {series['sum']}")
+            lines.append(f"{prefix}_request_duration_seconds_count{{{labels}}} {series['count']}")
+
+        lines += [
+            f"# HELP {prefix}_request_errors_total Failed REST request attempts.",
+            f"# TYPE {prefix}_request_errors_total counter",
+        ]
+        for (exchange, method, endpoint, error), count in sorted(self._errors.items()):
+            labels = self._labels(exchange=exchange, method=method, endpoint=endpoint, error=error)
+            lines.append(f"{prefix}_request_errors_total{{{labels}}} {count}")
+
+        lines += [
+            f"# HELP {prefix}_request_retries_total Retried REST requests.",
+            f"# TYPE {prefix}_request_retries_total counter",
+        ]
+        for (exchange, method, endpoint), count in sorted(self._retries.items()):
+            labels = self._labels(exchange=exchange, method=method, endpoint=endpoint)
+            lines.append(f"{prefix}_request_retries_total{{{labels}}} {count}")
+
+        lines += [
+            f"# HELP {prefix}_response_bytes_total Received REST response bytes.",
+            f"# TYPE {prefix}_response_bytes_total counter",
+        ]
+        for (exchange, method, endpoint), count in sorted(self._bytes.items()):
+            labels = self._labels(exchange=exchange, method=method, endpoint=endpoint)
+            lines.append(f"{prefix}_response_bytes_total{{{labels}}} {count}")
+        return "\n".join(lines) + "\n"
+
+    def _observe(self, key: tuple[str, str, str, str], value: float) -> None:
+        """Добавляет измерение в гистограмму."""
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = {
+                "count": 0,
+                "sum": 0.0,
+                "counts": [0] * (len(self._bounds) + 1),
+            }
+        series["count"] += 1
+        series["sum"] += value
+        series["counts"][bisect_left(self._bounds, value)] += 1
+
+    @staticmethod
+    def _endpoint_item(result: dict[str, Any], exchange: str, method: str, endpoint: str) -> dict:
+        """Возвращает (создавая при необходимости) запись эндпоинта в словаре экспорта."""
+        return result.setdefault(exchange, {}).setdefault(
+            f"{method} {endpoint}", {"errors": {}, "retries": 0, "bytes": 0}
+        )
+
+    @staticmethod
+    def _labels(**labels: str) -> str:
+        """Форматирует метки Prometheus."""
+        escaped = {
+            name: value.replace("\\", "\\\\").replace('"', '\\"') for name, value in labels.items()
+        }
+        return ",".join(f'{name}="{value}"' for name, value in escaped.items())
@@ -0,0 +1,160 @@
+__all__ = ["ProxyPool"]
+
+import random
+import time
+from dataclasses import dataclass
+
+
+@dataclass
+class _ProxyState:
+    """Статистика одного прокси."""
+
+    latency: float | None = None
+    """EWMA задержки ответа, сек. None — прокси еще не измерялся."""
+
+    success_rate: float = 1.0
+    """EWMA доли успешных запросов."""
+
+    successes: int = 0
+    """Количество успешных запросов."""
+
+    failures: int = 0
+    """Количество неудачных запросов."""
+
+    consecutive_failures: int = 0
+    """Количество подряд идущих неудачных запросов."""
+
+    ejected_until: float = 0.0
+    """До какого момента (time.monotonic) прокси исключен из ротации."""
+
+
+class ProxyPool:
+    """Пул HTTP(S)-прокси с учетом здоровья и задержки.
+
+    Для каждого прокси считаются EWMA задержки и доли успешных запросов. Прокси выбирается
+    по принципу "двух случайных": из двух случайных здоровых прокси берется тот, у которого
+    лучше оценка (задержка, деленная на долю успехов). Так быстрые прокси получают больше
+    запросов, а нагрузка все равно распределяется по всем IP.
+
+    После `failure_threshold` подряд идущих сбоев прокси исключается на `cooldown` секунд.
+    После возвращения одного сбоя достаточно, чтобы снова исключить его.
+
+    Один экземпляр можно передать нескольким клиентам, чтобы они делили статистику.
+    """
+
+    def __init__(
+        self,
+        proxies: list[str],
+        alpha: float = 0.2,
+        failure_threshold: int = 3,
+        cooldown: float = 30,
+    ) -> None:
+        """Инициализирует пул прокси.
+
+        Параметры:
+            proxies (`list[str]`): Список HTTP(S)-прокси.
+            alpha (`float`): Вес нового измерения в EWMA (0..1).
+            failure_threshold (`int`): Количество подряд идущих сбоев, после которого прокси исключается.
+            cooldown (`float`): На сколько исключать прокси из ротации, сек.
+        """
+        if not proxies:
+            raise ValueError("ProxyPool requires at least one proxy")
+        self._alpha = min(max(alpha, 0.0), 1.0)
+        self._failure_threshold = max(failure_threshold, 1)
+        self._cooldown = cooldown
+        self._states: dict[str, _ProxyState] = {proxy: _ProxyState() for proxy in proxies}
+
+    @property
+    def proxies(self) -> list[str]:
+        """Возвращает все прокси пула."""
+        return list(self._states)
+
+    def healthy(self) -> list[str]:
+        """Возвращает прокси, которые сейчас не исключены из ротации."""
+        now = time.monotonic()
+        return [proxy for proxy, state in self._states.items() if state.ejected_until <= now]
+
+    def choose(self) -> str:
+        """Выбирает прокси для следующего запроса.
+
+        Если все прокси исключены, возвращается тот, чей период исключения закончится раньше всех.
+
+        Возвращает:
+            `str`: Адрес прокси.
+        """
+        candidates = self.healthy()
+        if not candidates:
+            return min(self._states, key=lambda proxy: self._states[proxy].ejected_until)
+        if len(candidates) == 1:
+            return candidates[0]
+        first, second = random.sample(candidates, 2)
+        return first if self._score(first) <= self._score(second) else second
+
+    def record_success(self, proxy: str, latency: float) -> None:
+        """Фиксирует успешный запрос через прокси.
+
+        Параметры:
+            proxy (`str`): Адрес прокси.
+            latency (`float`): Время выполнения запроса, сек.
+        """
+        state = self._states.get(proxy)
+        if state is None:
+            return
+        state.latency = latency if state.latency is None else self._ewma(state.latency, latency)
+        state.success_rate = self._ewma(state.success_rate, 1.0)
+        state.successes += 1
+        state.consecutive_failures = 0
+
+    def record_failure(self, proxy: str) -> None:
+        """Фиксирует сбой запроса через прокси (таймаут, ошибка соединения).
+
+        Параметры:
+            proxy (`str`): Адрес прокси.
+        """
+        state = self._states.get(proxy)
+        if state is None:
+            return
+        state.success_rate = self._ewma(state.success_rate, 0.0)
+        state.failures += 1
+        state.consecutive_failures += 1
+        if state.consecutive_failures >= self._failure_threshold:
+            state.ejected_until = time.monotonic() + self._cooldown
+            # После возвращения в ротацию прокси будет исключен при первом же сбое
+            state.consecutive_failures = self._failure_threshold - 1
+
+    def stats(self) -> dict[str, dict[str, float | int | bool | None]]:
+        """Возвращает статистику по прокси.
+
+        Возвращает:
+            `dict[str, dict]`: Прокси -> {"latency", "success_rate", "successes", "failures", "ejected"}.
+        """
+        now = time.monotonic()
+        return {
+            proxy: {
+                "latency": state.latency,
+                "success_rate": state.success_rate,
+                "successes": state.successes,
+                "failures": state.failures,
+                "ejected": state.ejected_until > now,
+            }
+            for proxy, state in self._states.items()
+        }
+
+    def _score(self, proxy: str) -> float:
+        """Возвращает оценку прокси: чем меньше, тем лучше. Неизмеренные прокси пробуются первыми."""
+        state = self._states[proxy]
+        if state.latency is None:
+            return 0.0
+        return state.latency / max(state.success_rate, 0.05)
+
+    def _ewma(self, current: float, value: float) -> float:
+        """Возвращает обновленное экспоненциальное скользящее среднее."""
+        return current + self._alpha * (value - current)
+
+    def __len__(self) -> int:
+        """Возвращает количество прокси в пуле."""
+        return len(self._states)
+
+    def __repr__(self) -> str:
+        """Репрезентация пула прокси."""
+        return f"<ProxyPool(proxies={len(self)}, healthy={len(self.healthy())})>"
@@ -0,0 +1,169 @@
+__all__ = ["ConflatingQueue", "SpillQueue", "stream_key"]
+
+import asyncio
+import itertools
+import tempfile
+from collections import OrderedDict, deque
+from collections.abc import Callable, Hashable
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+_UNKEYED = object()
+"""Метка сообщений без ключа: они не схлопываются и обрабатываются как в обычной очереди."""
+
+
+def stream_key(message: Any) -> Hashable | None:
+    """Возвращает ключ стрима и символа сообщения для известных форматов бирж.
+
+    Параметры:
+        message (`Any`): Декодированное сообщение вебсокета.
+
+    Возвращает:
+        `Hashable | None`: Ключ сообщения или None, если формат не распознан.
+    """
+    if not isinstance(message, dict):
+        return None
+
+    # Binance и Aster (multiplex), Bybit, BingX
+    for field in ("stream", "topic", "dataType"):
+        if (value := message.get(field)) is not None:
+            return value
+
+    # Okx, Bitget
+    arg = message.get("arg")
+    if isinstance(arg, dict):
+        return (arg.get("channel"), arg.get("instId"))
+
+    # Gate, Hyperliquid, Mexc
+    channel = message.get("channel")
+    if channel is not None:
+        symbol = message.get("symbol")
+        data = message.get("result", message.get("data"))
+        # Сделки и свечи приходят списком, все элементы которого относятся к одному символу
+        if isinstance(data, list) and data:
+            data = data[0]
+        if symbol is None and isinstance(data, dict):
+            symbol = data.get("s") or data.get("contract") or data.get("coin") or data.get("n")
+        return (channel, symbol)
+
+    # Binance и Aster (одиночный стрим)
+    if "s" in message:
+        return (message.get("e"), message["s"])
+    return None
+
+
+class ConflatingQueue(asyncio.Queue):
+    """Очередь, в которой новое сообщение заменяет еще не обработанное сообщение с тем же ключом.
+
+    Подходит для стримов, где каждое сообщение — полное состояние (лучшие цены, стакан
+    со снимками, тикеры, mark price): медленный обработчик всегда получает самое свежее значение
+    по каждому символу, а размер очереди ограничен числом ключей. Замененное сообщение
+    остается на своем месте в очереди, поэтому частые символы не вытесняют редкие. Если ключей
+    больше `max_keys`, вытесняется самое старое сообщение.
+
+    Не подходит для сделок и дельт стакана — там важно каждое сообщение.
+    """
+
+    def __init__(
+        self,
+        key: Callable[[Any], Hashable | None] = stream_key,
+        max_keys: int = 0,
+    ) -> None:
+        """Инициализирует очередь.
+
+        Параметры:
+            key (`Callable[[Any], Hashable | None]`): Функция ключа сообщения. Сообщения с ключом None не схлопываются.
+            max_keys (`int`): Максимальное количество сообщений с разными ключами. 0 — без ограничения.
+        """
+        self._key = key
+        self._max_keys = max_keys
+        self._counter = itertools.count()
+        self.conflated = 0
+        """Количество сообщений, замененных более новыми до обработки."""
+        self.dropped = 0
+        """Количество сообщений, вытесненных при превышении `max_keys`."""
+        super().__init__()
+
+    def _init(self, maxsize: int) -> None:
+        self._queue: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def _put(self, item: Any) -> None:
+        key = self._key(item)
+        if key is None:
+            key = (_UNKEYED, next(self._counter))
+        elif key in self._queue:
+            self.conflated += 1
+            # `put_nowait` увеличит счетчик незавершенных задач, а новой позиции в очереди нет
+            self._unfinished_tasks -= 1  # type: ignore[attr-defined]
+            self._queue[key] = item
+            return
+
+        if self._max_keys and len(self._queue) >= self._max_keys:
+            self._queue.popitem(last=False)
+            self.dropped += 1
+            self._unfinished_tasks -= 1  # type: ignore[attr-defined]
+        self._queue[key] = item
+
+    def _get(self) -> Any:
+        return self._queue.popitem(last=False)[1]
+
+
+class SpillQueue(asyncio.Queue):
+    """Очередь, которая держит в памяти не больше `memory_size` сообщений, а остальные пишет на диск.
+
+    Порядок сообщений сохраняется: пока на диске есть сообщения, новые тоже пишутся туда,
+    а при чтении из памяти очередь дочитывает по одному сообщению с диска. Сообщения хранятся
+    во временном файле в формате JSON Lines, поэтому должны сериализоваться `orjson`.
+    Запись идет синхронно в кэш страниц ОС и не требует отдельного потока.
+    """
+
+    def __init__(self, memory_size: int, directory: str | Path | None = None) -> None:
+        """Инициализирует очередь.
+
+        Параметры:
+            memory_size (`int`): Максимальное количество сообщений в памяти.
+            directory (`str | Path | None`): Каталог временного файла. По умолчанию — системный.
+        """
+        self._memory_size = max(memory_size, 1)
+        self._file = tempfile.TemporaryFile(dir=directory)
+        self._read_position = 0
+        self._on_disk = 0
+        self.spilled = 0
+        """Количество сообщений, записанных на диск."""
+        super().__init__()
+
+    def qsize(self) -> int:
+        """Возвращает количество сообщений в памяти и на диске."""
+        return len(self._queue) + self._on_disk
+
+    def close(self) -> None:
+        """Закрывает и удаляет временный файл."""
+        self._file.close()
+
+    def _init(self, maxsize: int) -> None:
+        self._queue: deque[Any] = deque()
+
+    def _put(self, item: Any) -> None:
+        if not self._on_disk and len(self._queue) < self._memory_size:
+            self._queue.append(item)
+            return
+        self._file.seek(0, 2)
+        self._file.write(orjson.dumps(item) + b"\n")
+        self._on_disk += 1
+        self.spilled += 1
+
+    def _get(self) -> Any:
+        item = self._queue.popleft()
+        if self._on_disk:
+            self._file.seek(self._read_position)
+            line = self._file.readline()
+            self._read_position = self._file.tell()
+            self._on_disk -= 1
+            self._queue.append(orjson.loads(line))
+            if not self._on_disk:
+                self._file.seek(0)
+                self._file.truncate()
+                self._read_position = 0
+        return item
@@ -0,0 +1,282 @@
+__all__ = ["BaseRateLimiter", "TokenBucket"]
+
+import asyncio
+import copy
+import time
+from collections.abc import Callable, Mapping
+from typing import Any, ClassVar, Self
+from urllib.parse import urlsplit
+
+type EndpointWeight = int | Callable[[dict[str, Any], dict[str, Any]], int]
+"""Вес эндпоинта: число или функция от (params, data), возвращающая вес."""
+
+
+class TokenBucket:
+    """Асинхронное ведро токенов.
+
+    Токены восполняются равномерно: `capacity` токенов за `period` секунд.
+    Запросы, которым не хватает бюджета, ждут в очереди (FIFO), а не падают с ошибкой.
+    """
+
+    def __init__(self, capacity: float, period: float) -> None:
+        """Инициализирует ведро токенов.
+
+        Параметры:
+            capacity (`float`): Максимальное количество токенов (вес за период).
+            period (`float`): Период полного восполнения ведра, сек.
+        """
+        self.capacity = float(capacity)
+        self.period = float(period)
+        self._rate = self.capacity / self.period
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def available(self) -> float:
+        """Возвращает текущее количество доступных токенов."""
+        self._refill()
+        return self._tokens
+
+    async def acquire(self, weight: float = 1) -> None:
+        """Списывает `weight` токенов, дожидаясь их накопления при необходимости.
+
+        Параметры:
+            weight (`float`): Вес запроса.
+        """
+        weight = min(float(weight), self.capacity)
+        async with self._lock:
+            while True:
+                self._refill()
+                pause = self._paused_until - time.monotonic()
+                if pause > 0:
+                    await asyncio.sleep(pause)
+                    continue
+                if self._tokens >= weight:
+                    self._tokens -= weight
+                    return
+                await asyncio.sleep((weight - self._tokens) / self._rate)
+
+    def set_used(self, used: float) -> None:
+        """Калибрует ведро по израсходованному на сервере весу.
+
+        Бюджет только уменьшается: если сервер видит меньший расход, чем локальный учет,
+        локальный учет остается более консервативным.
+
+        Параметры:
+            used (`float`): Израсходованный в текущем окне вес по данным сервера.
+        """
+        self.set_remaining(self.capacity - used)
+
+    def set_remaining(self, remaining: float) -> None:
+        """Калибрует ведро по оставшемуся на сервере бюджету.
+
+        Параметры:
+            remaining (`float`): Оставшийся в текущем окне вес по данным сервера.
+        """
+        self._refill()
+        self._tokens = max(min(self._tokens, float(remaining)), 0.0)
+
+    def pause(self, seconds: float) -> None:
+        """Останавливает выдачу токенов на `seconds` секунд (например, после 429/418).
+
+        Параметры:
+            seconds (`float`): Длительность паузы, сек.
+        """
+        self._refill()
+        self._tokens = 0.0
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def _refill(self) -> None:
+        """Восполняет токены пропорционально прошедшему времени."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def __repr__(self) -> str:
+        """Репрезентация ведра токенов."""
+        return f"<TokenBucket({self.available:.1f}/{self.capacity:.0f} per {self.period:g}s)>"
+
+
+class BaseRateLimiter:
+    """Базовый ограничитель частоты REST-запросов.
+
+    Конкретные биржи задают таблицы лимитов через атрибуты класса:
+        - `BUCKETS`: общие ведра (например, вес на IP), имя -> (емкость, период в секундах);
+        - `HOST_BUCKETS`: какое общее ведро использовать для хоста;
+        - `ENDPOINT_WEIGHTS`: вес запроса к эндпоинту в общем ведре (по умолчанию 1);
+        - `ENDPOINT_LIMITS`: собственный лимит эндпоинта (емкость, период), если он есть.
+
+    Калибровка по заголовкам ответа переопределяется в наследниках в методе `_calibrate`.
+    """
+
+    BUCKETS: ClassVar[dict[str, tuple[float, float]]] = {"default": (10, 1)}
+    """Общие ведра: имя -> (емкость, период в секундах)."""
+
+    HOST_BUCKETS: ClassVar[dict[str, str]] = {}
+    """Соответствие хоста и общего ведра. Для неизвестных хостов используется "default"."""
+
+    ENDPOINT_WEIGHTS: ClassVar[dict[str, EndpointWeight]] = {}
+    """Вес эндпоинта в общем ведре: путь -> вес."""
+
+    ENDPOINT_LIMITS: ClassVar[dict[str, tuple[float, float]]] = {}
+    """Собственные лимиты эндпоинтов: путь -> (емкость, период в секундах)."""
+
+    DEFAULT_BAN_SECONDS: ClassVar[float] = 60
+    """Пауза после 429/418, если сервер не вернул `Retry-After`, сек."""
+
+    _shared: ClassVar[dict[tuple[type, str | None], "BaseRateLimiter"]] = {}
+    """Общие на процесс экземпляры: (класс, ключ) -> ограничитель."""
+
+    def __init__(self) -> None:
+        """Инициализирует ограничитель с ведрами из таблиц класса."""
+        self._buckets: dict[str, TokenBucket] = {
+            name: TokenBucket(capacity, period) for name, (capacity, period) in self.BUCKETS.items()
+        }
+        self._endpoint_buckets: dict[str, TokenBucket] = {}
+        self._derived: dict[str, Self] = {}
+
+    @classmethod
+    def shared(cls, key: str | None = None) -> Self:
+        """Возвращает общий на процесс экземпляр ограничителя.
+
+        Лимиты бирж обычно считаются на IP, поэтому все клиенты одной биржи,
+        работающие через один IP, должны делить один ограничитель.
+
+        Параметры:
+            key (`str | None`): Дополнительный ключ (например, адрес прокси) для раздельных бюджетов.
+
+        Возвращает:
+            `Self`: Общий экземпляр ограничителя.
+        """
+        instance = cls._shared.get((cls, key))
+        if instance is None:
+            instance = cls()
+            cls._shared[(cls, key)] = instance
+        return instance  # type: ignore[return-value]
+
+    def for_key(self, key: str) -> Self:
+        """Возвращает ограничитель с отдельным бюджетом для ключа (например, адреса прокси).
+
+        Производный ограничитель копирует настройки этого экземпляра: класс, атрибуты
+        и емкости ведер, включая откалиброванные, но считает токены отдельно. Для одного ключа
+        всегда возвращается один и тот же экземпляр.
+
+        Параметры:
+            key (`str`): Ключ отдельного бюджета.
+
+        Возвращает:
+            `Self`: Ограничитель для ключа.
+        """
+        limiter = self._derived.get(key)
+        if limiter is None:
+            limiter = copy.copy(self)
+            limiter._buckets = {
+                name: TokenBucket(bucket.capacity, bucket.period)
+                for name, bucket in self._buckets.items()
+            }
+            limiter._endpoint_buckets = {
+                path: TokenBucket(bucket.capacity, bucket.period)
+                for path, bucket in self._endpoint_buckets.items()
+            }
+            limiter._derived = {}
+            self._derived[key] = limiter
+        return limiter
+
+    @property
+    def buckets(self) -> dict[str, TokenBucket]:
+        """Возвращает все ведра ограничителя, включая ведра отдельных эндпоинтов."""
+        return {**self._buckets, **self._endpoint_buckets}
+
+    async def acquire(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None = None,
+        data: dict[str, Any] | None = None,
+    ) -> None:
+        """Дожидается бюджета на выполнение запроса.
+
+        Параметры:
+            method (`str`): HTTP-метод запроса.
+            url (`str`): Полный URL запроса.
+            params (`dict[str, Any] | None`): Query-параметры запроса.
+            data (`dict[str, Any] | None`): Тело запроса.
+        """
+        host, path = self._split_url(url)
+        weight = self._get_weight(path, params or {}, data or {})
+        await self._host_bucket(host).acquire(weight)
+
+        endpoint_bucket = self._endpoint_bucket(path)
+        if endpoint_bucket is not None:
+            await endpoint_bucket.acquire(1)
+
+    def calibrate(self, url: str, status: int, headers: Mapping[str, str]) -> None:
+        """Калибрует ведра по ответу сервера.
+
+        При статусах 429 и 418 выдача токенов приостанавливается на `Retry-After` секунд.
+
+        Параметры:
+            url (`str`): Полный URL запроса.
+            status (`int`): HTTP-статус ответа.
+            headers (`Mapping[str, str]`): Заголовки ответа.
+        """
+        host, path = self._split_url(url)
+        try:
+            self._calibrate(host, path, headers)
+        except (TypeError, ValueError):
+            pass  # Некорректные заголовки не должны ломать запрос
+
+        if status in (418, 429):
+            try:
+                ban_seconds = float(headers.get("Retry-After", self.DEFAULT_BAN_SECONDS))
+            except ValueError:
+                ban_seconds = self.DEFAULT_BAN_SECONDS
+            self._host_bucket(host).pause(ban_seconds)
+            endpoint_bucket = self._endpoint_bucket(path)
+            if endpoint_bucket is not None:
+                endpoint_bucket.pause(ban_seconds)
+
+    def _calibrate(self, host: str, path: str, headers: Mapping[str, str]) -> None:
+        """Калибрует ведра по заголовкам ответа. Переопределяется в наследниках."""
+        return None
+
+    def _get_weight(self, path: str, params: dict[str, Any], data: dict[str, Any]) -> int:
+        """Возвращает вес запроса к эндпоинту."""
+        weight = self.ENDPOINT_WEIGHTS.get(path, 1)
+        if callable(weight):
+            return weight(params, data)
+        return weight
+
+    def _host_bucket(self, host: str) -> TokenBucket:
+        """Возвращает общее ведро для хоста."""
+        return self._buckets[self.HOST_BUCKETS.get(host, "default")]
+
+    def _endpoint_bucket(
+        self, path: str, limit: tuple[float, float] | None = None
+    ) -> TokenBucket | None:
+        """Возвращает ведро эндпоинта, создавая его при первом обращении.
+
+        Параметры:
+            path (`str`): Путь эндпоинта.
+            limit (`tuple[float, float] | None`): Лимит эндпоинта, если он известен только из ответа сервера.
+        """
+        bucket = self._endpoint_buckets.get(path)
+        if bucket is None:
+            limit = limit or self.ENDPOINT_LIMITS.get(path)
+            if limit is None:
+                return None
+            bucket = TokenBucket(*limit)
+            self._endpoint_buckets[path] = bucket
+        return bucket
+
+    @staticmethod
+    def _split_url(url: str) -> tuple[str, str]:
+        """Возвращает хост и путь URL."""
+        parts = urlsplit(url)
+        return parts.netloc, parts.path
+
+    def __repr__(self) -> str:
+        """Репрезентация ограничителя."""
+        return f"<{type(self).__module__}.{type(self).__name__}(buckets={self.buckets})>"
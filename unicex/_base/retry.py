@@ -0,0 +1,261 @@
+__all__ = ["CircuitBreaker", "RetryPolicy"]
+
+import random
+import time
+from collections.abc import Collection, Mapping
+from email.utils import parsedate_to_datetime
+
+import aiohttp
+
+from unicex.exceptions import CircuitOpenError, ResponseError
+
+IDEMPOTENT_METHODS = frozenset({"GET"})
+"""Методы, которые безопасно повторять после того, как запрос мог дойти до биржи."""
+
+
+class CircuitBreaker:
+    """Предохранитель на хост биржи.
+
+    После `failure_threshold` подряд идущих сбоев (таймауты, обрывы соединения, 5xx) хост
+    считается деградировавшим: запросы к нему сразу падают с `CircuitOpenError`, не создавая
+    нагрузку и не копя ожидающие корутины. Через `recovery_timeout` секунд пропускается
+    пробный запрос: успех замыкает предохранитель, сбой снова размыкает его.
+
+    Один экземпляр можно разделить между всеми клиентами процесса.
+    """
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30) -> None:
+        """Инициализирует предохранитель.
+
+        Параметры:
+            failure_threshold (`int`): Количество подряд идущих сбоев, после которого хост отключается.
+            recovery_timeout (`float`): Сколько держать хост отключенным до пробного запроса, сек.
+        """
+        self._failure_threshold = max(failure_threshold, 1)
+        self._recovery_timeout = recovery_timeout
+        self._failures: dict[str, int] = {}
+        self._opened_at: dict[str, float] = {}
+        self._probing: set[str] = set()
+
+    def state(self, host: str) -> str:
+        """Возвращает состояние предохранителя хоста: "closed", "open" или "half_open".
+
+        Параметры:
+            host (`str`): Хост биржи.
+        """
+        opened_at = self._opened_at.get(host)
+        if opened_at is None:
+            return "closed"
+        if time.monotonic() - opened_at < self._recovery_timeout:
+            return "open"
+        return "half_open"
+
+    def before_request(self, host: str) -> bool:
+        """Проверяет, можно ли отправить запрос к хосту.
+
+        Выбрасывает `CircuitOpenError`, если хост отключен или пробный запрос уже выполняется.
+
+        Параметры:
+            host (`str`): Хост биржи.
+
+        Возвращает:
+            `bool`: True, если запрос стал пробным. Его нужно завершить через `record_success`,
+                `record_failure` или `release_probe`, иначе хост останется отключенным.
+        """
+        state = self.state(host)
+        if state == "closed":
+            return False
+        if state == "half_open" and host not in self._probing:
+            self._probing.add(host)
+            return True
+        retry_in = self._opened_at[host] + self._recovery_timeout - time.monotonic()
+        raise CircuitOpenError(
+            f"Circuit is open for {host}: too many consecutive failures",
+            host=host,
+            retry_in=max(retry_in, 0.0),
+        )
+
+    def record_success(self, host: str) -> None:
+        """Фиксирует успешный ответ хоста и замыкает предохранитель.
+
+        Параметры:
+            host (`str`): Хост биржи.
+        """
+        self._failures.pop(host, None)
+        self._opened_at.pop(host, None)
+        self._probing.discard(host)
+
+    def record_failure(self, host: str) -> None:
+        """Фиксирует сбой хоста и размыкает предохранитель при превышении порога.
+
+        Параметры:
+            host (`str`): Хост биржи.
+        """
+        self._failures[host] = self._failures.get(host, 0) + 1
+        if host in self._probing or self._failures[host] >= self._failure_threshold:
+            self._opened_at[host] = time.monotonic()
+        self._probing.discard(host)
+
+    def release_probe(self, host: str) -> None:
+        """Освобождает пробный запрос, который завершился без ответа хоста (например, был отменен).
+
+        Предохранитель остается полуоткрытым, и пробным станет следующий запрос.
+
+        Параметры:
+            host (`str`): Хост биржи.
+        """
+        self._probing.discard(host)
+
+    def stats(self) -> dict[str, dict[str, int | str]]:
+        """Возвращает состояние предохранителей по хостам.
+
+        Возвращает:
+            `dict[str, dict[str, int | str]]`: Хост -> {"state", "failures"}.
+        """
+        return {
+            host: {"state": self.state(host), "failures": failures}
+            for host, failures in self._failures.items()
+        }
+
+    def __repr__(self) -> str:
+        """Репрезентация предохранителя."""
+        return f"<CircuitBreaker({self.stats()})>"
+
+
+class RetryPolicy:
+    """Политика повторов REST-запросов.
+
+    Задержка растет экспоненциально (`base_delay * multiplier ** (attempt - 1)`, но не больше
+    `max_delay`) и рандомизируется (jitter), чтобы клиенты не повторяли запросы синхронно.
+    Если сервер вернул `Retry-After`, задержка не меньше указанной в нем.
+
+    Повторяются:
+        - таймауты и ошибки установки соединения — для любых методов (как и раньше);
+        - 429 — для любых методов: биржа отклонила запрос, не выполнив его;
+        - 5xx, обрывы соединения и коды временных ошибок биржи — только для GET,
+          если не включен `retry_non_idempotent`: POST/DELETE могли успеть выполниться.
+
+    418 (бан IP) и остальные ошибки не повторяются.
+    """
+
+    RETRY_STATUSES: frozenset[int] = frozenset({500, 502, 503, 504})
+    """HTTP-статусы временных ошибок сервера."""
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 0.1,
+        max_delay: float = 10,
+        multiplier: float = 2,
+        jitter: float = 1.0,
+        max_retry_after: float = 60,
+        retry_non_idempotent: bool = False,
+        circuit_breaker: CircuitBreaker | None = None,
+    ) -> None:
+        """Инициализирует политику повторов.
+
+        Параметры:
+            max_retries (`int`): Максимальное количество попыток запроса.
+            base_delay (`float`): Задержка перед первым повтором, сек.
+            max_delay (`float`): Максимальная задержка между попытками (без учета `Retry-After`), сек.
+            multiplier (`float`): Множитель экспоненциального роста задержки.
+            jitter (`float`): Доля задержки, которая рандомизируется: 0 — без jitter, 1 — full jitter.
+            max_retry_after (`float`): Если сервер просит ждать дольше, запрос не повторяется, сек.
+            retry_non_idempotent (`bool`): Повторять ли не-GET запросы при 5xx и обрывах соединения.
+            circuit_breaker (`CircuitBreaker | None`): Предохранитель на хост. Если не передан — не используется.
+        """
+        self.max_retries = max(max_retries, 1)
+        self.base_delay = max(base_delay, 0)
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = min(max(jitter, 0.0), 1.0)
+        self.max_retry_after = max_retry_after
+        self.retry_non_idempotent = retry_non_idempotent
+        self.circuit_breaker = circuit_breaker
+
+    def is_retryable(
+        self, error: Exception, method: str, retryable_codes: Collection[str] = ()
+    ) -> bool:
+        """Проверяет, можно ли повторить запрос после ошибки.
+
+        Параметры:
+            error (`Exception`): Ошибка попытки.
+            method (`str`): HTTP-метод запроса.
+            retryable_codes (`Collection[str]`): Коды временных ошибок биржи.
+
+        Возвращает:
+            `bool`: True, если запрос можно повторить.
+        """
+        if isinstance(error, ResponseError):
+            if error.status_code == 429:
+                return True
+            if error.status_code in self.RETRY_STATUSES or error.code in retryable_codes:
+                return self._can_repeat(method)
+            return False
+        if isinstance(error, TimeoutError | aiohttp.ClientConnectorError):
+            return True
+        if isinstance(error, aiohttp.ClientError | ConnectionResetError):
+            return self._can_repeat(method)
+        return False
+
+    def is_host_failure(self, error: Exception) -> bool:
+        """Проверяет, говорит ли ошибка о деградации хоста (для предохранителя).
+
+        Параметры:
+            error (`Exception`): Ошибка попытки.
+
+        Возвращает:
+            `bool`: True для таймаутов, ошибок соединения и 5xx.
+        """
+        if isinstance(error, ResponseError):
+            return error.status_code >= 500
+        return isinstance(error, TimeoutError | aiohttp.ClientError | ConnectionResetError)
+
+    def get_delay(self, attempt: int, retry_after: float | None = None) -> float:
+        """Возвращает задержку перед следующей попыткой.
+
+        Параметры:
+            attempt (`int`): Номер завершившейся попытки, начиная с 1.
+            retry_after (`float | None`): Значение `Retry-After` из ответа, сек.
+
+        Возвращает:
+            `float`: Задержка, сек.
+        """
+        delay = min(self.base_delay * self.multiplier ** (attempt - 1), self.max_delay)
+        delay -= random.uniform(0, delay * self.jitter)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    @staticmethod
+    def parse_retry_after(headers: Mapping[str, str]) -> float | None:
+        """Возвращает значение заголовка `Retry-After` в секундах.
+
+        Параметры:
+            headers (`Mapping[str, str]`): Заголовки ответа.
+
+        Возвращает:
+            `float | None`: Секунды ожидания или None, если заголовка нет или он некорректен.
+        """
+        value = headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        try:
+            return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+        except (TypeError, ValueError):
+            return None
+
+    def _can_repeat(self, method: str) -> bool:
+        """Проверяет, можно ли повторить запрос, который мог дойти до биржи."""
+        return method in IDEMPOTENT_METHODS or self.retry_non_idempotent
+
+    def __repr__(self) -> str:
+        """Репрезентация политики повторов."""
+        return (
+            f"<RetryPolicy(max_retries={self.max_retries}, base_delay={self.base_delay}, "
+            f"max_delay={self.max_delay}, multiplier={self.multiplier}, jitter={self.jitter})>"
+        )
@@ -0,0 +1,218 @@
+__all__ = ["SessionPool"]
+
+import asyncio
+from typing import Any, ClassVar
+
+import aiohttp
+from loguru import logger
+
+from .metrics import create_trace_config
+
+
+class SessionPool:
+    """Процесс-глобальный реестр HTTP-сессий, разделяемых между клиентами одной биржи.
+
+    Каждой бирже соответствует одна `aiohttp.ClientSession` с собственным коннектором,
+    поэтому `Client`, `UniClient`, `ExchangeInfo` и `UserWebsocket` одной биржи переиспользуют
+    уже открытые TCP+TLS соединения вместо того, чтобы устанавливать их заново.
+
+    Сессии выдаются по счетчику ссылок: `acquire` увеличивает счетчик, `release` уменьшает
+    и закрывает сессию, когда она больше никому не нужна.
+
+    Сессия привязана к циклу событий, поэтому реестр хранит ее по паре (цикл, биржа):
+    клиенты одной биржи в разных циклах получают разные сессии.
+    """
+
+    _DEFAULT_CONFIG: ClassVar[dict[str, Any]] = {
+        "limit": 100,
+        "limit_per_host": 20,
+        "ttl_dns_cache": 300,
+        "keepalive_timeout": 30,
+    }
+    """Настройки коннектора по умолчанию."""
+
+    _config: ClassVar[dict[str, Any]] = dict(_DEFAULT_CONFIG)
+    """Текущие настройки коннектора для всех бирж."""
+
+    _key_config: ClassVar[dict[str, dict[str, Any]]] = {}
+    """Переопределения настроек коннектора для отдельных бирж."""
+
+    _sessions: ClassVar[dict[tuple[asyncio.AbstractEventLoop, str], aiohttp.ClientSession]] = {}
+    """Открытые сессии по циклу событий и ключу биржи."""
+
+    _refs: ClassVar[dict[tuple[asyncio.AbstractEventLoop, str], int]] = {}
+    """Количество клиентов, использующих каждую сессию."""
+
+    @classmethod
+    def configure(
+        cls,
+        key: str | None = None,
+        limit: int | None = None,
+        limit_per_host: int | None = None,
+        ttl_dns_cache: int | None = None,
+        keepalive_timeout: int | float | None = None,
+    ) -> None:
+        """Задает параметры коннектора для новых сессий.
+
+        Уже открытые сессии не меняются — настройки применяются при следующем создании сессии.
+
+        Параметры:
+            key (`str | None`): Ключ биржи (например, "binance"). Если не передан — настройки применяются ко всем биржам.
+            limit (`int | None`): Общий лимит одновременных соединений сессии.
+            limit_per_host (`int | None`): Лимит одновременных соединений к одному хосту.
+            ttl_dns_cache (`int | None`): Время жизни DNS-кэша, сек.
+            keepalive_timeout (`int | float | None`): Сколько держать простаивающее соединение открытым, сек.
+        """
+        params = {
+            "limit": limit,
+            "limit_per_host": limit_per_host,
+            "ttl_dns_cache": ttl_dns_cache,
+            "keepalive_timeout": keepalive_timeout,
+        }
+        params = {k: v for k, v in params.items() if v is not None}
+        if key is None:
+            cls._config.update(params)
+        else:
+            cls._key_config.setdefault(key, {}).update(params)
+
+    @classmethod
+    def reset_config(cls) -> None:
+        """Сбрасывает параметры коннектора к значениям по умолчанию."""
+        cls._config = dict(cls._DEFAULT_CONFIG)
+        cls._key_config = {}
+
+    @staticmethod
+    def key_for(owner: type) -> str:
+        """Возвращает ключ сессии для класса клиента.
+
+        Ключом служит имя пакета биржи: `unicex.binance.client.Client` -> "binance".
+        Для классов вне библиотеки используется полное имя модуля.
+
+        Параметры:
+            owner (`type`): Класс клиента, унифицированного клиента или ExchangeInfo.
+
+        Возвращает:
+            `str`: Ключ сессии.
+        """
+        parts = owner.__module__.split(".")
+        if parts[0] == "unicex" and len(parts) > 2:
+            return parts[1]
+        return owner.__module__
+
+    @classmethod
+    def acquire(cls, key: str) -> aiohttp.ClientSession:
+        """Возвращает общую сессию для биржи и увеличивает счетчик ее использования.
+
+        Должен вызываться внутри запущенного цикла событий.
+
+        Параметры:
+            key (`str`): Ключ биржи.
+
+        Возвращает:
+            `aiohttp.ClientSession`: Общая сессия.
+        """
+        cls._forget_closed_loops()
+        pool_key = (asyncio.get_running_loop(), key)
+        session = cls._sessions.get(pool_key)
+        if session is None or session.closed:
+            session = cls._create_session(key)
+            cls._sessions[pool_key] = session
+            cls._refs[pool_key] = 0
+        cls._refs[pool_key] += 1
+        return session
+
+    @classmethod
+    def owns(cls, session: aiohttp.ClientSession) -> bool:
+        """Проверяет, выдана ли сессия реестром.
+
+        Параметры:
+            session (`aiohttp.ClientSession`): Сессия для проверки.
+
+        Возвращает:
+            `bool`: True, если сессией управляет реестр.
+        """
+        return any(s is session for s in cls._sessions.values())
+
+    @classmethod
+    async def release(cls, session: aiohttp.ClientSession) -> None:
+        """Уменьшает счетчик использования сессии и закрывает ее, если она больше не нужна.
+
+        Параметры:
+            session (`aiohttp.ClientSession`): Сессия, полученная через `acquire`.
+        """
+        for pool_key, pooled in list(cls._sessions.items()):
+            if pooled is not session:
+                continue
+            cls._refs[pool_key] -= 1
+            if cls._refs[pool_key] <= 0:
+                cls._forget(pool_key)
+                await session.close()
+            return
+
+    @classmethod
+    async def close_all(cls) -> None:
+        """Закрывает все сессии реестра текущего цикла событий, независимо от счетчиков.
+
+        Сессии других циклов закрыть отсюда нельзя, они остаются в реестре.
+        """
+        loop = asyncio.get_running_loop()
+        for pool_key, session in list(cls._sessions.items()):
+            if pool_key[0] is not loop:
+                continue
+            cls._forget(pool_key)
+            if not session.closed:
+                await session.close()
+
+    @classmethod
+    def stats(cls) -> dict[str, dict[str, int]]:
+        """Возвращает состояние открытых сессий.
+
+        Сессии одной биржи из разных циклов событий суммируются.
+
+        Возвращает:
+            `dict[str, dict[str, int]]`: Ключ биржи -> количество клиентов, активных и простаивающих соединений.
+        """
+        result: dict[str, dict[str, int]] = {}
+        for pool_key, session in cls._sessions.items():
+            connector = session.connector
+            idle = getattr(connector, "_conns", {})
+            stats = result.setdefault(pool_key[1], {"refs": 0, "active": 0, "idle": 0})
+            stats["refs"] += cls._refs.get(pool_key, 0)
+            stats["active"] += len(getattr(connector, "_acquired", ()))
+            stats["idle"] += sum(len(conns) for conns in idle.values())
+        return result
+
+    @classmethod
+    def _create_session(cls, key: str) -> aiohttp.ClientSession:
+        """Создает новую сессию с настроенным коннектором."""
+        config = {**cls._config, **cls._key_config.get(key, {})}
+        connector = aiohttp.TCPConnector(
+            limit=config["limit"],
+            limit_per_host=config["limit_per_host"],
+            ttl_dns_cache=config["ttl_dns_cache"],
+            use_dns_cache=True,
+            keepalive_timeout=config["keepalive_timeout"],
+        )
+        return aiohttp.ClientSession(connector=connector, trace_configs=[create_trace_config()])
+
+    @classmethod
+    def _forget_closed_loops(cls) -> None:
+        """Удаляет из реестра сессии завершенных циклов событий."""
+        for pool_key, session in list(cls._sessions.items()):
+            loop, key = pool_key
+            if not loop.is_closed():
+                continue
+            cls._forget(pool_key)
+            # Закрыть соединения можно только в цикле, которому они принадлежат
+            if not session.closed:
+                logger.warning(
+                    f"Shared session for '{key}' was left open by a closed event loop. "
+                    "Close clients with close_connection() (or SessionPool.close_all()) "
+                    "before their loop ends"
+                )
+
+    @classmethod
+    def _forget(cls, pool_key: tuple[asyncio.AbstractEventLoop, str]) -> None:
+        """Удаляет сессию из реестра без ее закрытия."""
+        cls._sessions.pop(pool_key, None)
+        cls._refs.pop(pool_key, None)
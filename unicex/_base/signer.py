@@ -0,0 +1,185 @@
+__all__ = ["HmacSigner", "Eip712Signer"]
+
+import base64
+import hashlib
+from collections.abc import Callable
+from typing import Any
+
+from eth_account.datastructures import SignedMessage
+from eth_account.signers.local import LocalAccount
+from eth_utils.crypto import keccak
+
+_EIP712_DOMAIN_FIELDS: dict[str, str] = {
+    "name": "string",
+    "version": "string",
+    "chainId": "uint256",
+    "verifyingContract": "address",
+    "salt": "bytes32",
+}
+"""Поля EIP712Domain в порядке, заданном стандартом."""
+
+
+class HmacSigner:
+    """HMAC-подписчик с заранее подготовленным ключом.
+
+    Создается один раз на клиента. Внутренние состояния хэша для `key ^ ipad` и `key ^ opad`
+    считаются при создании, а каждая подпись лишь копирует их (`copy()`) и дописывает
+    сообщение. Это быстрее, чем `hmac.new(secret.encode(), ...)` на каждый запрос:
+    ключ не кодируется заново, а блоки ключа не хэшируются повторно.
+
+    Результат совпадает со стандартным `hmac` (RFC 2104).
+    """
+
+    def __init__(self, secret: str | bytes, digestmod: Callable[..., Any] = hashlib.sha256) -> None:
+        """Инициализирует подписчика.
+
+        Параметры:
+            secret (`str | bytes`): Секретный ключ API.
+            digestmod (`Callable`): Конструктор хэш-функции из `hashlib` (sha256, sha512 и т.д.).
+        """
+        key = secret.encode("utf-8") if isinstance(secret, str) else secret
+        block_size = digestmod().block_size
+        if len(key) > block_size:
+            key = digestmod(key).digest()
+        key = key.ljust(block_size, b"\x00")
+        self._inner = digestmod(bytes(b ^ 0x36 for b in key))
+        self._outer = digestmod(bytes(b ^ 0x5C for b in key))
+
+    def digest(self, payload: str | bytes) -> bytes:
+        """Возвращает HMAC сообщения в виде байт.
+
+        Параметры:
+            payload (`str | bytes`): Подписываемое сообщение.
+
+        Возвращает:
+            `bytes`: Подпись.
+        """
+        inner = self._inner.copy()
+        inner.update(payload.encode("utf-8") if isinstance(payload, str) else payload)
+        outer = self._outer.copy()
+        outer.update(inner.digest())
+        return outer.digest()
+
+    def hexdigest(self, payload: str | bytes) -> str:
+        """Возвращает HMAC сообщения в виде hex-строки.
+
+        Параметры:
+            payload (`str | bytes`): Подписываемое сообщение.
+
+        Возвращает:
+            `str`: Подпись в hex-формате.
+        """
+        return self.digest(payload).hex()
+
+    def b64digest(self, payload: str | bytes) -> str:
+        """Возвращает HMAC сообщения в виде base64-строки.
+
+        Параметры:
+            payload (`str | bytes`): Подписываемое сообщение.
+
+        Возвращает:
+            `str`: Подпись в base64.
+        """
+        return base64.b64encode(self.digest(payload)).decode()
+
+
+class Eip712Signer:
+    """EIP-712 подписчик с заранее посчитанными доменом и хэшем типа.
+
+    `encode_typed_data` на каждый запрос заново валидирует и кодирует всю структуру
+    `typed_data` (типы, домен, сообщение). Здесь разделитель домена и хэш типа
+    считаются один раз при создании, а для каждой подписи хэшируется только сообщение:
+    `keccak(0x1901 || domainSeparator || keccak(typeHash || encodeData(message)))`.
+
+    Поддерживаются плоские типы (без вложенных структур и массивов): `string`, `bytes`,
+    `bytesN`, `uintN`, `intN`, `address`, `bool` — этого достаточно для подписи
+    запросов Aster и Hyperliquid. Результат совпадает с `encode_typed_data` + `sign_message`.
+    """
+
+    def __init__(
+        self,
+        wallet: LocalAccount,
+        domain: dict[str, Any],
+        primary_type: str,
+        fields: list[dict[str, str]],
+    ) -> None:
+        """Инициализирует подписчика.
+
+        Параметры:
+            wallet (`LocalAccount`): Кошелёк, которым подписываются сообщения.
+            domain (`dict[str, Any]`): EIP-712 домен (name, version, chainId, verifyingContract, salt).
+            primary_type (`str`): Имя типа сообщения, например "Message".
+            fields (`list[dict[str, str]]`): Поля типа сообщения: `[{"name": ..., "type": ...}]`.
+        """
+        self._wallet = wallet
+        self._fields = [(field["name"], field["type"]) for field in fields]
+        self._type_hash = keccak(text=self._encode_type(primary_type, self._fields))
+
+        domain_fields = [(k, t) for k, t in _EIP712_DOMAIN_FIELDS.items() if k in domain]
+        self._domain_separator = keccak(
+            keccak(text=self._encode_type("EIP712Domain", domain_fields))
+            + self._encode_values(domain_fields, domain)
+        )
+        self._prefix = b"\x19\x01" + self._domain_separator
+
+    @property
+    def address(self) -> str:
+        """Возвращает адрес кошелька."""
+        return self._wallet.address
+
+    @property
+    def domain_separator(self) -> bytes:
+        """Возвращает разделитель домена EIP-712."""
+        return self._domain_separator
+
+    def hash_message(self, message: dict[str, Any]) -> bytes:
+        """Возвращает EIP-712 хэш сообщения, который подписывается кошельком.
+
+        Параметры:
+            message (`dict[str, Any]`): Значения полей сообщения.
+
+        Возвращает:
+            `bytes`: 32-байтовый хэш.
+        """
+        struct_hash = keccak(self._type_hash + self._encode_values(self._fields, message))
+        return keccak(self._prefix + struct_hash)
+
+    def sign(self, message: dict[str, Any]) -> SignedMessage:
+        """Подписывает сообщение.
+
+        Параметры:
+            message (`dict[str, Any]`): Значения полей сообщения.
+
+        Возвращает:
+            `SignedMessage`: Подпись (`signature`, `r`, `s`, `v`).
+        """
+        return self._wallet.unsafe_sign_hash(self.hash_message(message))
+
+    @staticmethod
+    def _encode_type(name: str, fields: list[tuple[str, str]]) -> str:
+        """Кодирует описание типа, например "Message(string msg)"."""
+        return f"{name}({','.join(f'{type_} {field}' for field, type_ in fields)})"
+
+    @staticmethod
+    def _encode_values(fields: list[tuple[str, str]], values: dict[str, Any]) -> bytes:
+        """Кодирует значения полей в 32-байтовые слова по правилам `encodeData`."""
+        encoded = bytearray()
+        for field, type_ in fields:
+            value = values[field]
+            if type_ == "string":
+                encoded += keccak(text=value)
+            elif type_ == "bytes":
+                encoded += keccak(value if isinstance(value, bytes) else bytes.fromhex(value[2:]))
+            elif type_.startswith("bytes"):
+                raw = value if isinstance(value, bytes) else bytes.fromhex(value[2:])
+                encoded += raw.ljust(32, b"\x00")
+            elif type_ == "address":
+                encoded += bytes.fromhex(value[2:]).rjust(32, b"\x00")
+            elif type_ == "bool":
+                encoded += int(bool(value)).to_bytes(32, "big")
+            elif type_.startswith(("uint", "int")):
+                number = int(value, 0) if isinstance(value, str) else int(value)
+                encoded += number.to_bytes(32, "big", signed=type_.startswith("int"))
+            else:
+                raise TypeError(f"Unsupported EIP-712 field type: {type_}")
+        return bytes(encoded)
@@ -0,0 +1,127 @@
+__all__ = ["KeepWarm"]
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from loguru import logger as _logger
+
+from unicex.types import LoggerLike
+
+type WarmProbe = Callable[[], Awaitable[Any]]
+"""Дешевый запрос к хосту биржи (ping или серверное время)."""
+
+
+class KeepWarm:
+    """Прогрев и поддержание открытых соединений к хостам биржи.
+
+    Биржи закрывают простаивающие соединения, и первый ордер после паузы платит за DNS,
+    TCP и TLS. `warm` отправляет `connections` одновременных дешевых запросов на каждый хост:
+    одновременные запросы не могут использовать одно соединение, поэтому в пуле коннектора
+    остается `connections` открытых соединений. Фоновая задача повторяет это каждые `interval`
+    секунд — интервал должен быть меньше таймаута простоя сервера и `keepalive_timeout`
+    коннектора (по умолчанию 30 сек в `SessionPool`).
+    """
+
+    def __init__(
+        self,
+        connections: int = 2,
+        interval: float = 15,
+        logger: LoggerLike | None = None,
+    ) -> None:
+        """Инициализирует прогрев соединений.
+
+        Параметры:
+            connections (`int`): Сколько соединений держать открытыми к каждому хосту.
+            interval (`float`): Период повторного прогрева, сек.
+            logger (`LoggerLike | None`): Логгер для вывода информации.
+        """
+        self._connections = max(connections, 1)
+        self._interval = interval
+        self._logger = logger or _logger
+        self._task: asyncio.Task | None = None
+        self._pings = 0
+        self._failures = 0
+        self._last_ping: float | None = None
+        self._last_ping_ms: float | None = None
+
+    @property
+    def interval(self) -> float:
+        """Возвращает период повторного прогрева, сек."""
+        return self._interval
+
+    @property
+    def running(self) -> bool:
+        """Проверяет, запущен ли фоновый прогрев."""
+        return self._task is not None and not self._task.done()
+
+    async def warm(self, probes: list[WarmProbe]) -> None:
+        """Открывает (или освежает) `connections` соединений к каждому хосту.
+
+        Параметры:
+            probes (`list[WarmProbe]`): Запросы к хостам, по одному на хост.
+        """
+        started = time.perf_counter()
+        results = await asyncio.gather(
+            *(probe() for probe in probes for _ in range(self._connections)),
+            return_exceptions=True,
+        )
+        self._last_ping_ms = (time.perf_counter() - started) * 1000
+        self._last_ping = time.time()
+        self._pings += len(results)
+        for result in results:
+            if isinstance(result, Exception):
+                self._failures += 1
+                self._logger.warning(f"Keep-warm request failed: {type(result)} -> {result}")
+
+    def start(self, probes: list[WarmProbe]) -> None:
+        """Запускает фоновый прогрев. Повторный вызов при работающем прогреве ничего не делает.
+
+        Параметры:
+            probes (`list[WarmProbe]`): Запросы к хостам, по одному на хост.
+        """
+        if not self.running:
+            self._task = asyncio.create_task(self._keep_warm_loop(probes))
+
+    async def stop(self) -> None:
+        """Останавливает фоновый прогрев."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def stats(self) -> dict[str, Any]:
+        """Возвращает состояние прогрева для мониторинга.
+
+        Возвращает:
+            `dict`: {"connections", "interval", "running", "pings", "failures", "last_ping_ago", "last_ping_ms"}.
+        """
+        return {
+            "connections": self._connections,
+            "interval": self._interval,
+            "running": self.running,
+            "pings": self._pings,
+            "failures": self._failures,
+            "last_ping_ago": time.time() - self._last_ping if self._last_ping else None,
+            "last_ping_ms": self._last_ping_ms,
+        }
+
+    async def _keep_warm_loop(self, probes: list[WarmProbe]) -> None:
+        """Периодически освежает соединения."""
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                await self.warm(probes)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._logger.error(f"Keep-warm failed: {type(e)} -> {e}")
+
+    def __repr__(self) -> str:
+        """Репрезентация прогрева соединений."""
+        return f"<KeepWarm({self.stats()})>"
@@ -1,17 +1,24 @@
-__all__ = ["Websocket"]
+__all__ = ["MessageBatch", "Websocket"]
 
 import asyncio
 import time
-from collections.abc import Awaitable, Callable
-from typing import Any, Literal, Protocol
+from collections import Counter
+from collections.abc import Awaitable, Callable, Hashable
+from pathlib import Path
+from typing import Any, Literal, Protocol, get_args
 
 import orjson
 import websockets
 from loguru import logger as _logger
 from websockets.asyncio.client import ClientConnection
 
-from unicex.exceptions import QueueOverflowError
-from unicex.types import LoggerLike
+from unicex.types import DispatchMode, LoggerLike, OverflowPolicy
+
+from .queues import ConflatingQueue, SpillQueue, stream_key
+
+
+class MessageBatch(list):
+    """Пачка сообщений, которую вебсокет в пакетном режиме передает в callback одним вызовом."""
 
 
 class Websocket:
@@ -20,6 +27,15 @@ class Websocket:
     MAX_QUEUE_SIZE: int = 500
     """Максимальная длина очереди."""
 
+    DEFAULT_OVERFLOW_POLICY: OverflowPolicy = "block"
+    """Политика переполнения очереди, если она не задана ни пользователем, ни стримом."""
+
+    DEFAULT_CALLBACK_BUDGET: float = 0.005
+    """Время выполнения callback в режиме "inline", после которого пишется предупреждение, сек."""
+
+    _QUEUE_COUNTERS = ("conflated", "dropped", "spilled")
+    """Счетчики, которые ведут сами очереди и которые переносятся при пересоздании очереди."""
+
     class _DecoderProtocol(Protocol):
         """Протокол декодирования сообщений."""
 
@@ -44,6 +60,15 @@ class Websocket:
         worker_count: int = 1,
         logger: LoggerLike | None = None,
         decoder: type[_DecoderProtocol] = _JsonDecoder,
+        overflow_policy: OverflowPolicy | None = None,
+        max_queue_size: int | None = None,
+        conflate_key: Callable[[Any], Hashable | None] | None = None,
+        spill_dir: str | Path | None = None,
+        batch_size: int | None = None,
+        batch_window: float = 0,
+        dispatch: DispatchMode = "queue",
+        callback_budget: float | None = None,
+        shard_key: Callable[[Any], Hashable | None] | None = None,
         **kwargs: Any,  # Не дадим сломаться, если юзер передал ненужные аргументы
     ) -> None:
         """Инициализация вебсокета.
@@ -60,7 +85,31 @@ class Websocket:
             worker_count (`int`): Количество рабочих задач для обработки сообщений.
             logger (`LoggerLike | None`): Логгер для записи логов.
             decoder (`IDecoder | None`): Декодер для обработки входящих сообщений.
+            overflow_policy (`OverflowPolicy | None`): Что делать при заполнении очереди:
+                "block" — не читать сокет, пока очередь не освободится (TCP backpressure, без потерь);
+                "drop_oldest" / "drop_newest" — отбросить самое старое / новое сообщение;
+                "conflate" — всегда заменять необработанное сообщение того же стрима и символа более свежим (только для стримов состояния);
+                "spill" — писать сообщения сверх лимита на диск, без потерь.
+                По умолчанию — политика стрима или `DEFAULT_OVERFLOW_POLICY`.
+            max_queue_size (`int | None`): Размер очереди в памяти. По умолчанию — `MAX_QUEUE_SIZE`.
+            conflate_key (`Callable[[Any], Hashable | None] | None`): Ключ сообщения для схлопывания. По умолчанию — `stream_key`.
+            spill_dir (`str | Path | None`): Каталог для сообщений политики "spill". По умолчанию — системный временный.
+            batch_size (`int | None`): Пакетный режим: callback получает `MessageBatch` из накопившихся в очереди сообщений, но не больше `batch_size`. None — по одному сообщению.
+            batch_window (`float`): Сколько ждать дополнительных сообщений после первого в пакетном режиме, сек. Пачка отправляется раньше, если набралось `batch_size` сообщений. 0 — брать только уже накопившиеся.
+            dispatch (`DispatchMode`): Способ передачи сообщений в callback:
+                "queue" — через очередь и `worker_count` воркеров, для тяжелых обработчиков;
+                "sharded" — у каждого из `worker_count` воркеров своя очередь, сообщение попадает в нее по `shard_key`.
+                Сообщения одного символа обрабатываются по порядку, разных символов — параллельно;
+                "inline" — прямо в цикле чтения, без очереди и переключения задач. Минимальная задержка,
+                но пока callback выполняется, сокет не читается — подходит только для быстрых обработчиков.
+            callback_budget (`float | None`): В режиме "inline" — время выполнения callback, после которого пишется предупреждение, сек. По умолчанию — `DEFAULT_CALLBACK_BUDGET`.
+            shard_key (`Callable[[Any], Hashable | None] | None`): В режиме "sharded" — ключ стрима или символа, по которому выбирается очередь воркера (не уникальный ключ сообщения: ключи запоминаются). Сообщения с ключом None идут в первую очередь. По умолчанию — `stream_key`.
         """
+        if dispatch not in get_args(DispatchMode.__value__):
+            raise ValueError(f"Unknown dispatch mode: {dispatch}")
+        if dispatch == "inline" and batch_size:
+            raise ValueError("Batch delivery requires dispatch='queue'")
+
         self._callback = callback
         self._url = url
         self._subscription_messages = subscription_messages or []
@@ -71,10 +120,26 @@ class Websocket:
         self._reconnect_timeout = reconnect_timeout or 0
         self._last_message_time = time.monotonic()
         self._worker_count = worker_count
+        self._batch_size = batch_size
+        self._batch_window = batch_window
+        self._dispatch = dispatch
+        self._callback_budget = callback_budget or self.DEFAULT_CALLBACK_BUDGET
+        self._shard_key = shard_key or stream_key
+        self._shards: dict[Hashable, int] = {}
+        self._last_budget_warning = 0.0
         self._logger = logger or _logger
         self._decoder = decoder()
         self._tasks: list[asyncio.Task] = []
-        self._queue = asyncio.Queue()
+        self._max_queue_size = max_queue_size or self.MAX_QUEUE_SIZE
+        self._conflate_key = conflate_key or stream_key
+        self._spill_dir = spill_dir
+        self._overflow_policy_explicit = overflow_policy is not None
+        self._overflow_policy = self._validate_overflow_policy(
+            overflow_policy or self.DEFAULT_OVERFLOW_POLICY
+        )
+        self._queues = self._create_queues()
+        self._overflowing: set[int] = set()
+        self._counters: Counter[str] = Counter()
         self._running = False
 
     async def start(self) -> None:
@@ -108,6 +173,55 @@ class Websocket:
         """Возвращает статус вебсокета."""
         return self._running
 
+    @property
+    def overflow_policy(self) -> OverflowPolicy:
+        """Возвращает политику переполнения очереди."""
+        return self._overflow_policy
+
+    @overflow_policy.setter
+    def overflow_policy(self, policy: OverflowPolicy) -> None:
+        """Задает политику переполнения очереди. Доступно только до запуска вебсокета."""
+        if self._running:
+            raise RuntimeError("Overflow policy can not be changed while websocket is running")
+        self._overflow_policy = self._validate_overflow_policy(policy)
+        self._overflow_policy_explicit = True
+        self._reset_queues()
+
+    def set_default_overflow_policy(self, policy: OverflowPolicy) -> None:
+        """Задает политику переполнения стрима, если пользователь не указал ее явно.
+
+        Используется менеджерами вебсокетов для стримов, которым важнее свежесть, чем полнота.
+
+        Параметры:
+            policy (`OverflowPolicy`): Политика переполнения.
+        """
+        if not self._overflow_policy_explicit and not self._running:
+            self._overflow_policy = self._validate_overflow_policy(policy)
+            self._reset_queues()
+
+    def stats(self) -> dict[str, Any]:
+        """Возвращает счетчики очереди сообщений для мониторинга.
+
+        Возвращает:
+            `dict`: {"dispatch", "policy", "received", "queued", "shards", "blocked", "conflated",
+                "dropped", "spilled", "slow_callbacks"}, где "shards" — длины очередей воркеров
+                в режиме "sharded" (в остальных режимах — одной общей очереди).
+        """
+        shards = [queue.qsize() for queue in self._queues]
+        return {
+            "dispatch": self._dispatch,
+            "policy": self._overflow_policy,
+            "received": self._counters["received"],
+            "queued": sum(shards),
+            "shards": shards,
+            "blocked": self._counters["blocked"],
+            **{
+                name: self._counters[name] + sum(getattr(queue, name, 0) for queue in self._queues)
+                for name in self._QUEUE_COUNTERS
+            },
+            "slow_callbacks": self._counters["slow_callbacks"],
+        }
+
     async def _connect(self) -> None:
         """Подключается к вебсокету и настраивает соединение."""
         self._logger.debug(f"Establishing connection with {self._url}")
@@ -146,13 +260,11 @@ class Websocket:
             if decoded_message == "ping":
                 await self._send_pong(conn)
             else:
-                await self._queue.put(decoded_message)
-
-                # Проверяем размер очереди сообщений и выбрасываем ошибку, если он превышает максимальный размер
-                self._check_queue_size()
-        except QueueOverflowError:
-            cleaned_messages = self._clear_queue()
-            self._logger.error(f"Message queue is overflow, cleaned {cleaned_messages} messages")
+                self._counters["received"] += 1
+                if self._dispatch == "inline":
+                    await self._call_inline(decoded_message)
+                else:
+                    await self._enqueue(decoded_message)
         except orjson.JSONDecodeError as e:
             if message in ["ping", "pong"]:
                 self._logger.debug(f"Received ping message: {message}")
@@ -161,23 +273,101 @@ class Websocket:
         except Exception as e:
             self._logger.error(f"Unexpected error: {e}")
 
-    def _check_queue_size(self) -> None:
-        """Проверяет размер очереди и выбрасывает ошибку при переполнении."""
-        qsize = self._queue.qsize()
-        if qsize >= self.MAX_QUEUE_SIZE:
-            raise QueueOverflowError(f"Message queue is overflow: {qsize}")
-
-    def _clear_queue(self) -> int:
-        """Очищает очередь сообщений."""
-        cleared = 0
-        while True:
-            try:
-                self._queue.get_nowait()
-                self._queue.task_done()
-                cleared += 1
-            except asyncio.QueueEmpty:
-                break
-        return cleared
+    async def _enqueue(self, message: Any) -> None:
+        """Кладет сообщение в очередь согласно политике переполнения."""
+        shard = self._shard_of(message)
+        queue = self._queues[shard]
+        policy = self._overflow_policy
+        full = queue.qsize() >= self._max_queue_size
+        if full and shard not in self._overflowing:
+            self._overflowing.add(shard)
+            self._logger.warning(
+                f"Message queue #{shard} is full ({self._max_queue_size}), applying overflow policy '{policy}'"
+            )
+        elif not full:
+            self._overflowing.discard(shard)
+
+        # Схлопывающая очередь и очередь с диском сами ограничивают память
+        if not full or policy in ("conflate", "spill"):
+            queue.put_nowait(message)
+        elif policy == "block":
+            # Цикл чтения ждет здесь, поэтому сокет не читается и биржа упирается в TCP-окно.
+            # В режиме "sharded" это останавливает и остальные очереди, пока переполненная не разгрузится
+            self._counters["blocked"] += 1
+            while True:
+                try:
+                    await asyncio.wait_for(queue.put(message), timeout=1)
+                    return
+                except TimeoutError:
+                    # Очередь заменили при переподключении — это сообщение уже не нужно
+                    if queue is not self._queues[shard] or not self._running:
+                        return
+        elif policy == "drop_oldest":
+            queue.get_nowait()
+            queue.task_done()
+            queue.put_nowait(message)
+            self._counters["dropped"] += 1
+        else:
+            self._counters["dropped"] += 1
+
+    def _shard_of(self, message: Any) -> int:
+        """Возвращает номер очереди воркера для сообщения."""
+        if len(self._queues) == 1:
+            return 0
+        key = self._shard_key(message)
+        if key is None:
+            return 0
+        # Новые ключи раздаются по кругу и закрепляются за очередью: при десятках символов
+        # это распределяет их ровнее, чем остаток от хэша
+        shard = self._shards.get(key)
+        if shard is None:
+            shard = self._shards[key] = len(self._shards) % len(self._queues)
+        return shard
+
+    async def _call_inline(self, message: Any) -> None:
+        """Вызывает callback прямо в цикле чтения и предупреждает, если он превысил бюджет времени.
+
+        Таймер на бюджет срабатывает, пока асинхронный callback ждет на `await`, а проверка
+        после вызова ловит синхронную работу, во время которой таймер выполниться не может.
+        """
+        stalled = False
+
+        def on_budget_exceeded() -> None:
+            nonlocal stalled
+            stalled = True
+            self._counters["slow_callbacks"] += 1
+            self._warn_slow_callback(
+                f"Inline callback is still running after {self._callback_budget * 1000:.1f} ms"
+            )
+
+        timer = asyncio.get_running_loop().call_later(self._callback_budget, on_budget_exceeded)
+        started = time.perf_counter()
+        try:
+            await self._callback(message)
+        except Exception as e:
+            self._logger.error(f"Error({type(e)}) while processing message: {e}")
+        finally:
+            timer.cancel()
+        elapsed = time.perf_counter() - started
+        if elapsed > self._callback_budget and not stalled:
+            self._counters["slow_callbacks"] += 1
+            self._warn_slow_callback(
+                f"Inline callback took {elapsed * 1000:.1f} ms "
+                f"(budget {self._callback_budget * 1000:.1f} ms)"
+            )
+
+    def _warn_slow_callback(self, text: str) -> None:
+        """Пишет предупреждение о медленном callback в режиме "inline"."""
+        # Не чаще раза в секунду, чтобы медленный обработчик не тормозил еще и логированием
+        now = time.monotonic()
+        if now - self._last_budget_warning < 1:
+            return
+        self._last_budget_warning = now
+        self._logger.warning(
+            f"{text}, socket reads are paused; "
+            f"slow callbacks so far: {self._counters['slow_callbacks']}. "
+            "Use dispatch='queue' for heavy handlers"
+        )
 
     async def _after_connect(self, conn: ClientConnection) -> None:
         """Вызывается после установки соединения."""
@@ -195,9 +385,13 @@ class Websocket:
         if self._no_message_reconnect_timeout:
             self._tasks.append(asyncio.create_task(self._healthcheck_task()))
 
-        # Запускаем воркеров
-        for _ in range(self._worker_count):
-            task = asyncio.create_task(self._worker())
+        # Запускаем воркеров, в режиме "inline" они не нужны
+        if self._dispatch == "inline":
+            return
+        # В режиме "sharded" у каждого воркера своя очередь, иначе все читают одну
+        worker = self._batch_worker if self._batch_size else self._worker
+        for i in range(self._worker_count):
+            task = asyncio.create_task(worker(i % len(self._queues)))
             self._tasks.append(task)
 
     async def _after_disconnect(self) -> None:
@@ -225,7 +419,37 @@ class Websocket:
         self._tasks.clear()
 
         # Очистить очередь уже безопасно, после остановки воркеров
-        self._queue = asyncio.Queue()
+        self._reset_queues()
+
+    @staticmethod
+    def _validate_overflow_policy(policy: str) -> OverflowPolicy:
+        """Проверяет название политики переполнения."""
+        if policy not in get_args(OverflowPolicy.__value__):
+            raise ValueError(f"Unknown overflow policy: {policy}")
+        return policy  # type: ignore[return-value]
+
+    def _create_queues(self) -> list[asyncio.Queue]:
+        """Создает очереди сообщений: по одной на воркера в режиме "sharded", иначе одну общую."""
+        count = self._worker_count if self._dispatch == "sharded" else 1
+        return [self._create_queue() for _ in range(max(count, 1))]
+
+    def _create_queue(self) -> asyncio.Queue:
+        """Создает очередь сообщений под политику переполнения."""
+        if self._overflow_policy == "conflate":
+            return ConflatingQueue(self._conflate_key, max_keys=self._max_queue_size)
+        if self._overflow_policy == "spill":
+            return SpillQueue(self._max_queue_size, self._spill_dir)
+        return asyncio.Queue(self._max_queue_size)
+
+    def _reset_queues(self) -> None:
+        """Заменяет очереди на новые, сохраняя накопленные ими счетчики."""
+        for queue in self._queues:
+            for name in self._QUEUE_COUNTERS:
+                self._counters[name] += getattr(queue, name, 0)
+            if isinstance(queue, SpillQueue):
+                queue.close()
+        self._queues = self._create_queues()
+        self._overflowing.clear()
 
     async def _send_subscribe_messages(self, conn: ClientConnection) -> None:
         """Отправляет сообщения с подпиской на топики, если нужно."""
@@ -233,18 +457,47 @@ class Websocket:
             await conn.send(message)
             self._logger.debug(f"Sent subscribe message: {message}")
 
-    async def _worker(self) -> None:
-        """Обрабатывает сообщения из очереди."""
+    async def _worker(self, shard: int = 0) -> None:
+        """Обрабатывает сообщения из очереди `shard`."""
         while self._running:
             try:
-                data = await self._queue.get()  # Получаем сообщение
+                queue = self._queues[shard]
+                data = await queue.get()  # Получаем сообщение
                 await self._callback(data)  # Передаем в callback
-                self._queue.task_done()
+                queue.task_done()
             except asyncio.exceptions.CancelledError:
                 break
             except Exception as e:
                 self._logger.error(f"Error({type(e)}) while processing message: {e}")
 
+    async def _batch_worker(self, shard: int = 0) -> None:
+        """Обрабатывает сообщения из очереди `shard` пачками."""
+        batch_size: int = self._batch_size  # type: ignore[assignment]
+        while self._running:
+            try:
+                queue = self._queues[shard]
+                batch = MessageBatch([await queue.get()])
+                deadline = time.monotonic() + self._batch_window
+                while len(batch) < batch_size:
+                    if not queue.empty():
+                        batch.append(queue.get_nowait())
+                        continue
+                    # Ждем следующее сообщение, пока пачка не заполнится или не истечет окно
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), remaining))
+                    except TimeoutError:
+                        break
+                await self._callback(batch)
+                for _ in batch:
+                    queue.task_done()
+            except asyncio.exceptions.CancelledError:
+                break
+            except Exception as e:
+                self._logger.error(f"Error({type(e)}) while processing batch: {e}")
+
     def _generate_ws_kwargs(self) -> dict:
         """Генерирует аргументы для запуска вебсокета."""
         ws_kwargs = {}
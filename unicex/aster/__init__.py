@@ -8,10 +8,12 @@ __all__ = [
     "WebsocketManager",
     "UniWebsocketManager",
     "ExchangeInfo",
+    "RateLimiter",
 ]
 
 from .client import Client
 from .exchange_info import ExchangeInfo
+from .rate_limiter import RateLimiter
 from .uni_client import UniClient
 from .uni_websocket_manager import UniWebsocketManager
 from .user_websocket import SpotUserWebsocket, UserWebsocket
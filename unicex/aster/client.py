@@ -1,16 +1,28 @@
 __all__ = ["Client"]
 
+import asyncio
 import json
-import time
 import urllib.parse
+from concurrent.futures import Executor
 from typing import Any, Literal, Self
 
 import aiohttp
 from eth_account import Account
-from eth_account.messages import encode_typed_data
 from eth_account.signers.local import LocalAccount
 
-from unicex._base import BaseClient
+from unicex._base import (
+    BaseClient,
+    BaseRateLimiter,
+    ClockSync,
+    Eip712Signer,
+    HedgePolicy,
+    KeepWarm,
+    ProxyPool,
+    RequestHooks,
+    ResponseCache,
+    RetryPolicy,
+    SessionPool,
+)
 from unicex.exceptions import NotAuthorized
 from unicex.types import LoggerLike, NumberLike, RequestMethod
 from unicex.utils import filter_params
@@ -26,6 +38,12 @@ class Client(BaseClient):
     _BASE_FUTURES_URL: str = "https://fapi.asterdex.com"
     """Базовый URL для REST API Aster Futures."""
 
+    _KEEP_WARM_URLS: tuple[str, ...] = (
+        "https://fapi.asterdex.com/fapi/v3/ping",
+        "https://sapi.asterdex.com/api/v3/ping",
+    )
+    """Эндпоинты для прогрева соединений (ping/время сервера)."""
+
     _BASE_SPOT_URL: str = "https://sapi.asterdex.com"
     """Базовый URL для REST API Aster Spot."""
 
@@ -35,6 +53,11 @@ class Client(BaseClient):
     _SIGN_DOMAIN_NAME: str = "AsterSignTransaction"
     """Имя EIP-712 домена для подписи запросов Aster V3."""
 
+    _RETRYABLE_CODES: frozenset[str] = frozenset(
+        {"-1001", "-1003", "-1004", "-1006", "-1007", "-1008"}
+    )
+    """Коды временных ошибок Aster: внутренняя ошибка, превышение лимита, сервер занят, таймаут бэкенда."""
+
     def __init__(
         self,
         session: aiohttp.ClientSession,
@@ -42,8 +65,17 @@ class Client(BaseClient):
         logger: LoggerLike | None = None,
         max_retries: int = 3,
         retry_delay: int | float = 0.1,
-        proxies: list[str] | None = None,
+        proxies: list[str] | ProxyPool | None = None,
         timeout: int = 10,
+        rate_limiter: BaseRateLimiter | None = None,
+        single_flight: bool = False,
+        cache: ResponseCache | None = None,
+        retry_policy: RetryPolicy | None = None,
+        hedge: HedgePolicy | None = None,
+        hooks: list[RequestHooks] | None = None,
+        clock_sync: ClockSync | None = None,
+        keep_warm: KeepWarm | None = None,
+        signing_executor: Executor | None = None,
     ) -> None:
         """Инициализация клиента.
 
@@ -55,6 +87,15 @@ class Client(BaseClient):
             retry_delay (`int | float`): Задержка между повторными попытками, сек.
             proxies (`list[str] | None`): Список HTTP(S)‑прокси для циклического использования.
             timeout (`int`): Максимальное время ожидания ответа от сервера, сек.
+            rate_limiter (`BaseRateLimiter | None`): Ограничитель частоты запросов (например, `RateLimiter.shared()` биржи). Если не передан — запросы не ограничиваются.
+            single_flight (`bool`): Объединять одновременные одинаковые GET-запросы в один сетевой вызов с общим результатом.
+            cache (`ResponseCache | None`): Кэш ответов публичных эндпоинтов (например, `ResponseCache()`). Если не передан — ответы не кэшируются.
+            retry_policy (`RetryPolicy | None`): Политика повторов (backoff, jitter, `Retry-After`, предохранитель). Если не передана — собирается из `max_retries` и `retry_delay`.
+            hedge (`HedgePolicy | None`): Политика хеджирования GET-запросов: дубль запроса после перцентиля недавних задержек. Если не передана — запросы не хеджируются.
+            hooks (`list[RequestHooks] | None`): Обработчики событий жизненного цикла запросов (например, `LatencyHistogram()`).
+            clock_sync (`ClockSync | None`): Синхронизация часов с сервером Aster для подписи запросов (например, `ClockSync.shared("aster")`). Если не передана — используется локальное время.
+            keep_warm (`KeepWarm | None`): Прогрев и поддержание открытых соединений к хостам биржи (например, `KeepWarm(connections=2)`), запускается через `warm_up()`. Если не передан — `warm_up()` использует настройки по умолчанию.
+            signing_executor (`Executor | None`): Пул для EIP-712 подписи приватных запросов вне event loop (например, `ThreadPoolExecutor(1)`). Если не передан — подпись выполняется в event loop.
         """
         super().__init__(
             session=session,
@@ -63,16 +104,38 @@ class Client(BaseClient):
             retry_delay=retry_delay,
             proxies=proxies,
             timeout=timeout,
+            rate_limiter=rate_limiter,
+            single_flight=single_flight,
+            cache=cache,
+            retry_policy=retry_policy,
+            hedge=hedge,
+            hooks=hooks,
+            clock_sync=clock_sync,
+            keep_warm=keep_warm,
         )
 
         # Кошелёк API формируется из приватного ключа. Его адрес используется как signer.
         self._wallet: LocalAccount | None = None
         self._signer: str | None = None
+        self._eip712: Eip712Signer | None = None
         if private_key is not None:
             # private_key может быть hex-строкой ("0x...") или байтами
             wallet = Account.from_key(private_key)
             self._wallet = wallet
             self._signer = wallet.address
+            # Домен и тип сообщения постоянны, поэтому их хэши считаются один раз.
+            self._eip712 = Eip712Signer(
+                wallet=wallet,
+                domain={
+                    "name": self._SIGN_DOMAIN_NAME,
+                    "version": "1",
+                    "chainId": self._SIGN_CHAIN_ID,
+                    "verifyingContract": "0x0000000000000000000000000000000000000000",
+                },
+                primary_type="Message",
+                fields=[{"name": "msg", "type": "string"}],
+            )
+        self._signing_executor = signing_executor
 
         # Последний выданный nonce (микросекунды) для гарантии строгого возрастания.
         self._last_nonce = 0
@@ -85,31 +148,58 @@ class Client(BaseClient):
         logger: LoggerLike | None = None,
         max_retries: int = 3,
         retry_delay: int | float = 0.1,
-        proxies: list[str] | None = None,
+        proxies: list[str] | ProxyPool | None = None,
         timeout: int = 10,
+        rate_limiter: BaseRateLimiter | None = None,
+        single_flight: bool = False,
+        cache: ResponseCache | None = None,
+        retry_policy: RetryPolicy | None = None,
+        hedge: HedgePolicy | None = None,
+        hooks: list[RequestHooks] | None = None,
+        clock_sync: ClockSync | None = None,
+        keep_warm: KeepWarm | None = None,
+        signing_executor: Executor | None = None,
     ) -> Self:
         """Создаёт инстанцию клиента.
 
         Параметры:
             private_key (`str | bytes | None`): Приватный ключ API-кошелька для подписи запросов.
-            session (`aiohttp.ClientSession | None`): Сессия для HTTP‑запросов (если не передана, будет создана).
+            session (`aiohttp.ClientSession | None`): Сессия для HTTP‑запросов (если не передана, будет взята общая сессия биржи из `SessionPool`).
             logger (`LoggerLike | None`): Логгер для вывода информации.
             max_retries (`int`): Максимум повторов при ошибках запроса.
             retry_delay (`int | float`): Задержка между повторами, сек.
-            proxies (`list[str] | None`): Список HTTP(S)‑прокси.
+            proxies (`list[str] | ProxyPool | None`): Список HTTP(S)‑прокси или общий `ProxyPool`.
             timeout (`int`): Таймаут ответа сервера, сек.
+            rate_limiter (`BaseRateLimiter | None`): Ограничитель частоты запросов (например, `RateLimiter.shared()` биржи). Если не передан — запросы не ограничиваются.
+            single_flight (`bool`): Объединять одновременные одинаковые GET-запросы в один сетевой вызов с общим результатом.
+            cache (`ResponseCache | None`): Кэш ответов публичных эндпоинтов (например, `ResponseCache()`). Если не передан — ответы не кэшируются.
+            retry_policy (`RetryPolicy | None`): Политика повторов (backoff, jitter, `Retry-After`, предохранитель). Если не передана — собирается из `max_retries` и `retry_delay`.
+            hedge (`HedgePolicy | None`): Политика хеджирования GET-запросов: дубль запроса после перцентиля недавних задержек. Если не передана — запросы не хеджируются.
+            hooks (`list[RequestHooks] | None`): Обработчики событий жизненного цикла запросов (например, `LatencyHistogram()`).
+            clock_sync (`ClockSync | None`): Синхронизация часов с сервером Aster для подписи запросов (например, `ClockSync.shared("aster")`). Если не передана — используется локальное время.
+            keep_warm (`KeepWarm | None`): Прогрев и поддержание открытых соединений к хостам биржи (например, `KeepWarm(connections=2)`), запускается через `warm_up()`. Если не передан — `warm_up()` использует настройки по умолчанию.
+            signing_executor (`Executor | None`): Пул для EIP-712 подписи приватных запросов вне event loop (например, `ThreadPoolExecutor(1)`). Если не передан — подпись выполняется в event loop.
 
         Возвращает:
             `Self`: Созданный экземпляр клиента.
         """
         return cls(
-            session=session or aiohttp.ClientSession(),
+            session=session or SessionPool.acquire(SessionPool.key_for(cls)),
             private_key=private_key,
             logger=logger,
             max_retries=max_retries,
             retry_delay=retry_delay,
             proxies=proxies,
             timeout=timeout,
+            rate_limiter=rate_limiter,
+            single_flight=single_flight,
+            cache=cache,
+            retry_policy=retry_policy,
+            hedge=hedge,
+            hooks=hooks,
+            clock_sync=clock_sync,
+            keep_warm=keep_warm,
+            signing_executor=signing_executor,
         )
 
     def is_authorized(self) -> bool:
@@ -141,7 +231,7 @@ class Client(BaseClient):
         Aster отклоняет повторно использованный nonce, поэтому при совпадении
         времени с предыдущим запросом значение инкрементируется.
         """
-        nonce = int(time.time() * 1_000_000)
+        nonce = int(self._server_time() * 1_000_000)
         if nonce <= self._last_nonce:
             nonce = self._last_nonce + 1
         self._last_nonce = nonce
@@ -157,32 +247,30 @@ class Client(BaseClient):
             `str`: Подпись в hex-формате с префиксом 0x.
         """
         # Структура EIP-712: домен AsterSignTransaction + тип Message с единственным полем msg.
-        typed_data = {
-            "types": {
-                "EIP712Domain": [
-                    {"name": "name", "type": "string"},
-                    {"name": "version", "type": "string"},
-                    {"name": "chainId", "type": "uint256"},
-                    {"name": "verifyingContract", "type": "address"},
-                ],
-                "Message": [{"name": "msg", "type": "string"}],
-            },
-            "primaryType": "Message",
-            "domain": {
-                "name": self._SIGN_DOMAIN_NAME,
-                "version": "1",
-                "chainId": self._SIGN_CHAIN_ID,
-                "verifyingContract": "0x0000000000000000000000000000000000000000",
-            },
-            "message": {"msg": msg},
-        }
-
-        encoded = encode_typed_data(full_message=typed_data)
-        signed = self._wallet.sign_message(encoded)  # type: ignore[union-attr]
+        # Хэши домена и типа посчитаны заранее, здесь хэшируется только само сообщение.
+        signed = self._eip712.sign({"msg": msg})  # type: ignore[union-attr]
 
         sig = signed.signature.hex()
         return sig if sig.startswith("0x") else f"0x{sig}"
 
+    def _build_sign_message(self, params: dict[str, Any]) -> str:
+        """Формирует подписываемую строку: параметры запроса вместе с signer и nonce.
+
+        Параметры:
+            params (`dict`): Бизнес-параметры запроса (уже отфильтрованные).
+
+        Возвращает:
+            `str`: Строка вида "a=1&...&signer=...&nonce=...".
+        """
+        if not self.is_authorized():
+            raise NotAuthorized("Private key is required for private endpoints.")
+
+        # signer и nonce обязательны для подписи Aster V3.
+        params = {**params, "signer": self._signer, "nonce": str(self._get_nonce())}
+
+        # Подпись формируется по той же строке, что и отправляется на сервер.
+        return urllib.parse.urlencode(params)
+
     def _build_signed_query(self, params: dict[str, Any]) -> str:
         """Формирует подписанную query string для приватных эндпоинтов V3.
 
@@ -195,18 +283,33 @@ class Client(BaseClient):
         Возвращает:
             `str`: Готовая query string вида "a=1&...&signer=...&nonce=...&signature=...".
         """
-        if not self.is_authorized():
-            raise NotAuthorized("Private key is required for private endpoints.")
+        msg = self._build_sign_message(params)
+        return f"{msg}&signature={self._sign(msg)}"
 
-        # signer и nonce обязательны для подписи Aster V3.
-        params = {**params, "signer": self._signer, "nonce": str(self._get_nonce())}
+    async def _build_signed_query_async(self, params: dict[str, Any]) -> str:
+        """Формирует подписанную query string, вынося подпись в `signing_executor`.
 
-        # Подпись формируется по той же строке, что и отправляется на сервер.
-        msg = urllib.parse.urlencode(params)
-        signature = self._sign(msg)
+        Nonce выдается в event loop, чтобы он оставался строго возрастающим,
+        а в пул уходит только вычисление подписи.
+
+        Параметры:
+            params (`dict`): Бизнес-параметры запроса (уже отфильтрованные).
+
+        Возвращает:
+            `str`: Готовая query string вида "a=1&...&signer=...&nonce=...&signature=...".
+        """
+        if self._signing_executor is None:
+            return self._build_signed_query(params)
 
+        msg = self._build_sign_message(params)
+        loop = asyncio.get_running_loop()
+        signature = await loop.run_in_executor(self._signing_executor, self._sign, msg)
         return f"{msg}&signature={signature}"
 
+    async def _fetch_server_time(self) -> int:
+        """Возвращает серверное время Aster в миллисекундах (для `ClockSync`)."""
+        return (await self.futures_server_time())["serverTime"]
+
     async def _make_request(
         self,
         method: RequestMethod,
@@ -243,8 +346,10 @@ class Client(BaseClient):
 
         # Приватный запрос: вшиваем подписанную query string прямо в URL,
         # чтобы отправляемая строка в точности совпадала с подписанной.
-        query = self._build_signed_query(params)
-        return await super()._make_request(method=method, url=f"{url}?{query}", headers=headers)
+        query = await self._build_signed_query_async(params)
+        return await super()._make_request(
+            method=method, url=f"{url}?{query}", headers=headers, signed=True
+        )
 
     async def request(
         self, method: RequestMethod, url: str, params: dict, data: dict, signed: bool
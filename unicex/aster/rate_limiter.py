@@ -0,0 +1,71 @@
+__all__ = ["RateLimiter"]
+
+from collections.abc import Mapping
+from typing import Any
+
+from unicex._base import BaseRateLimiter
+
+
+def _by_symbol(with_symbol: int, without_symbol: int):
+    """Вес эндпоинта, который дороже без параметра symbol."""
+
+    def weight(params: dict[str, Any], _: dict[str, Any]) -> int:
+        return with_symbol if params.get("symbol") else without_symbol
+
+    return weight
+
+
+def _depth_weight(params: dict[str, Any], _: dict[str, Any]) -> int:
+    """Вес стакана зависит от limit (по умолчанию 500)."""
+    limit = int(params.get("limit", 500))
+    if limit <= 50:
+        return 2
+    if limit <= 100:
+        return 5
+    if limit <= 500:
+        return 10
+    return 20
+
+
+class RateLimiter(BaseRateLimiter):
+    """Ограничитель частоты запросов Aster по весу запросов на IP.
+
+    https://docs.asterdex.com/product/aster-perpetuals/api/api-documentation
+    """
+
+    BUCKETS = {
+        "futures": (2400, 60),
+        "spot": (2400, 60),
+        "default": (1200, 60),
+    }
+
+    HOST_BUCKETS = {
+        "fapi.asterdex.com": "futures",
+        "sapi.asterdex.com": "spot",
+    }
+
+    ENDPOINT_WEIGHTS = {
+        "/fapi/v3/exchangeInfo": 1,
+        "/fapi/v3/klines": 5,
+        "/fapi/v3/depth": _depth_weight,
+        "/fapi/v3/ticker/24hr": _by_symbol(1, 40),
+        "/fapi/v3/ticker/price": _by_symbol(1, 2),
+        "/fapi/v3/ticker/bookTicker": _by_symbol(1, 2),
+        "/fapi/v3/premiumIndex": 1,
+        "/fapi/v3/batchOrders": 5,
+        "/fapi/v3/positionRisk": 5,
+        "/fapi/v3/allOrders": 5,
+        "/fapi/v3/userTrades": 5,
+        "/fapi/v3/income": 30,
+        "/api/v3/exchangeInfo": 1,
+        "/api/v3/klines": 1,
+        "/api/v3/depth": _depth_weight,
+        "/api/v3/ticker/24hr": _by_symbol(1, 40),
+        "/api/v3/ticker/price": _by_symbol(1, 2),
+        "/api/v3/ticker/bookTicker": _by_symbol(1, 2),
+    }
+
+    def _calibrate(self, host: str, path: str, headers: Mapping[str, str]) -> None:
+        used = headers.get("X-MBX-USED-WEIGHT-1M") or headers.get("X-MBX-USED-WEIGHT-1m")
+        if used is not None:
+            self._host_bucket(host).set_used(float(used))
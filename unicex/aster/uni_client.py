@@ -2,11 +2,23 @@ __all__ = ["UniClient"]
 
 
 import asyncio
-from typing import Self, overload
+from concurrent.futures import Executor
+from typing import Any, Self, overload
 
 import aiohttp
 
 from unicex._abc import IUniClient
+from unicex._base import (
+    BaseRateLimiter,
+    ClockSync,
+    HedgePolicy,
+    KeepWarm,
+    ProxyPool,
+    RequestHooks,
+    ResponseCache,
+    RetryPolicy,
+    SessionPool,
+)
 from unicex.enums import Exchange, MarginType, OrderSide, OrderType, Timeframe
 from unicex.exceptions import ResponseError
 from unicex.types import (
@@ -31,6 +43,12 @@ from .client import Client
 class UniClient(IUniClient[Client]):
     """Унифицированный клиент для работы с Aster API."""
 
+    _FUTURES_BATCH_CREATE_SIZE = 5
+    """Лимит ордеров в `/fapi/v3/batchOrders` (создание)."""
+
+    _FUTURES_BATCH_CANCEL_SIZE = 10
+    """Лимит ордеров в `/fapi/v3/batchOrders` (отмена)."""
+
     def __init__(
         self,
         session: aiohttp.ClientSession,
@@ -38,8 +56,17 @@ class UniClient(IUniClient[Client]):
         logger: LoggerLike | None = None,
         max_retries: int = 3,
         retry_delay: int | float = 0.1,
-        proxies: list[str] | None = None,
+        proxies: list[str] | ProxyPool | None = None,
         timeout: int = 10,
+        rate_limiter: BaseRateLimiter | None = None,
+        single_flight: bool = False,
+        cache: ResponseCache | None = None,
+        retry_policy: RetryPolicy | None = None,
+        hedge: HedgePolicy | None = None,
+        hooks: list[RequestHooks] | None = None,
+        clock_sync: ClockSync | None = None,
+        keep_warm: KeepWarm | None = None,
+        signing_executor: Executor | None = None,
     ) -> None:
         """Инициализация клиента.
 
@@ -51,6 +78,15 @@ class UniClient(IUniClient[Client]):
             retry_delay (`int | float`): Задержка между повторными попытками, сек.
             proxies (`list[str] | None`): Список HTTP(S)‑прокси для циклического использования.
             timeout (`int`): Максимальное время ожидания ответа от сервера, сек.
+            rate_limiter (`BaseRateLimiter | None`): Ограничитель частоты запросов (например, `RateLimiter.shared()` биржи). Если не передан — запросы не ограничиваются.
+            single_flight (`bool`): Объединять одновременные одинаковые GET-запросы в один сетевой вызов с общим результатом.
+            cache (`ResponseCache | None`): Кэш ответов публичных эндпоинтов (например, `ResponseCache()`). Если не передан — ответы не кэшируются.
+            retry_policy (`RetryPolicy | None`): Политика повторов (backoff, jitter, `Retry-After`, предохранитель). Если не передана — собирается из `max_retries` и `retry_delay`.
+            hedge (`HedgePolicy | None`): Политика хеджирования GET-запросов: дубль запроса после перцентиля недавних задержек. Если не передана — запросы не хеджируются.
+            hooks (`list[RequestHooks] | None`): Обработчики событий жизненного цикла запросов (например, `LatencyHistogram()`).
+            clock_sync (`ClockSync | None`): Синхронизация часов с сервером Aster для подписи запросов (например, `ClockSync.shared("aster")`). Если не передана — используется локальное время.
+            keep_warm (`KeepWarm | None`): Прогрев и поддержание открытых соединений к хостам биржи (например, `KeepWarm(connections=2)`), запускается через `warm_up()`. Если не передан — `warm_up()` использует настройки по умолчанию.
+            signing_executor (`Executor | None`): Пул для EIP-712 подписи приватных запросов вне event loop (например, `ThreadPoolExecutor(1)`). Если не передан — подпись выполняется в event loop.
         """
         self._client: Client = self._client_cls(
             private_key=private_key,
@@ -60,6 +96,15 @@ class UniClient(IUniClient[Client]):
             retry_delay=retry_delay,
             proxies=proxies,
             timeout=timeout,
+            rate_limiter=rate_limiter,
+            single_flight=single_flight,
+            cache=cache,
+            retry_policy=retry_policy,
+            hedge=hedge,
+            hooks=hooks,
+            clock_sync=clock_sync,
+            keep_warm=keep_warm,
+            signing_executor=signing_executor,
         )
 
     @classmethod
@@ -69,19 +114,43 @@ class UniClient(IUniClient[Client]):
         logger: LoggerLike | None = None,
         max_retries: int = 3,
         retry_delay: int | float = 0.1,
-        proxies: list[str] | None = None,
+        proxies: list[str] | ProxyPool | None = None,
         timeout: int = 10,
+        rate_limiter: BaseRateLimiter | None = None,
+        single_flight: bool = False,
+        cache: ResponseCache | None = None,
+        retry_policy: RetryPolicy | None = None,
+        hedge: HedgePolicy | None = None,
+        hooks: list[RequestHooks] | None = None,
+        clock_sync: ClockSync | None = None,
+        keep_warm: KeepWarm | None = None,
+        signing_executor: Executor | None = None,
     ) -> Self:
         return cls(
-            session=aiohttp.ClientSession(),
+            session=SessionPool.acquire(SessionPool.key_for(cls)),
             private_key=private_key,
             logger=logger,
             max_retries=max_retries,
             retry_delay=retry_delay,
             proxies=proxies,
             timeout=timeout,
+            rate_limiter=rate_limiter,
+            single_flight=single_flight,
+            cache=cache,
+            retry_policy=retry_policy,
+            hedge=hedge,
+            hooks=hooks,
+            clock_sync=clock_sync,
+            keep_warm=keep_warm,
+            signing_executor=signing_executor,
         )
 
+    _KLINES_PAGE_SIZE = 1000
+    """Лимит свечей в `/api/v3/klines`."""
+
+    _FUTURES_KLINES_PAGE_SIZE = 1500
+    """Лимит свечей в `/fapi/v3/klines`."""
+
     @property
     def _client_cls(self) -> type[Client]:
         return Client
@@ -273,21 +342,103 @@ class UniClient(IUniClient[Client]):
     ) -> OrderIdDict:
         self.ensure_authorized()
 
-        if type == OrderType.LIMIT and price is None:
-            raise ValueError("Price is required for limit order type on Aster futures.")
-
         raw_data = await self._client.futures_order_create(
-            symbol=symbol,
-            side=side.to_exchange_format(Exchange.ASTER),  # type: ignore
-            type=type.to_exchange_format(Exchange.ASTER),  # type: ignore
-            quantity=quantity,
-            price=price,
-            new_client_order_id=client_order_id,
-            reduce_only=reduce_only,
-            time_in_force="GTC" if type == OrderType.LIMIT else None,
+            **self._futures_order_kwargs(
+                symbol=symbol,
+                side=side,
+                type=type,
+                quantity=quantity,
+                price=price,
+                client_order_id=client_order_id,
+                reduce_only=reduce_only,
+            )
         )
         return Adapter.futures_order_create(raw_data)
 
+    async def futures_order_cancel(
+        self,
+        symbol: str,
+        order_id: str | None = None,
+        client_order_id: str | None = None,
+    ) -> OrderIdDict:
+        self.ensure_authorized()
+
+        raw_data = await self._client.futures_order_cancel(
+            symbol=symbol,
+            order_id=int(order_id) if order_id is not None else None,
+            orig_client_order_id=client_order_id,
+        )
+        return Adapter.futures_order_create(raw_data)  # Ответ отмены в том же формате
+
+    def _check_futures_order(self, order: dict[str, Any]) -> None:
+        self._futures_order_kwargs(**order)  # Выбрасывает ValueError для неверных параметров
+
+    async def _futures_orders_create_chunk(
+        self, orders: list[dict[str, Any]]
+    ) -> list[OrderIdDict | Exception]:
+        self.ensure_authorized()
+
+        batch_orders = []
+        for order in orders:
+            # Пакетный эндпоинт принимает те же параметры, что и создание ордера, в camelCase
+            batch_order = {}
+            for key, value in self._futures_order_kwargs(**order).items():
+                if value is None:
+                    continue
+                head, *rest = key.split("_")
+                field = head + "".join(part.capitalize() for part in rest)
+                batch_order[field] = str(value).lower() if isinstance(value, bool) else value
+            batch_orders.append(batch_order)
+
+        raw_data = await self._client.futures_batch_orders_create(batch_orders)
+        return Adapter.futures_batch_orders(raw_data)  # type: ignore[return-value]
+
+    def _futures_orders_cancel_group(self, cancel: dict[str, Any]) -> Any:
+        # В одном пакете можно передать только orderIdList или только origClientOrderIdList
+        return cancel["symbol"], cancel.get("order_id") is None
+
+    async def _futures_orders_cancel_chunk(
+        self, cancels: list[dict[str, Any]]
+    ) -> list[OrderIdDict | Exception]:
+        self.ensure_authorized()
+
+        symbol = cancels[0]["symbol"]
+        if cancels[0].get("order_id") is not None:
+            raw_data = await self._client.futures_batch_orders_cancel(
+                symbol=symbol,
+                order_id_list=[int(cancel["order_id"]) for cancel in cancels],
+            )
+        else:
+            raw_data = await self._client.futures_batch_orders_cancel(
+                symbol=symbol,
+                orig_client_order_id_list=[cancel["client_order_id"] for cancel in cancels],
+            )
+        return Adapter.futures_batch_orders(raw_data)  # type: ignore[return-value]
+
+    @staticmethod
+    def _futures_order_kwargs(
+        symbol: str,
+        side: OrderSide,
+        type: OrderType,
+        quantity: str,
+        price: str | None = None,
+        client_order_id: str | None = None,
+        reduce_only: bool | None = None,
+    ) -> dict[str, Any]:
+        if type == OrderType.LIMIT and price is None:
+            raise ValueError("Price is required for limit order type on Aster futures.")
+
+        return {
+            "symbol": symbol,
+            "side": side.to_exchange_format(Exchange.ASTER),
+            "type": type.to_exchange_format(Exchange.ASTER),
+            "quantity": quantity,
+            "price": price,
+            "new_client_order_id": client_order_id,
+            "reduce_only": reduce_only,
+            "time_in_force": "GTC" if type == OrderType.LIMIT else None,
+        }
+
     async def futures_position_info(self, symbol: str) -> PositionInfoDict:
         self.ensure_authorized()
 
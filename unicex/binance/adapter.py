@@ -4,6 +4,7 @@ import time
 
 from loguru import logger
 
+from unicex.exceptions import ResponseError
 from unicex.types import (
     BestBidAskDict,
     BestBidAskItem,
@@ -215,6 +216,20 @@ class Adapter:
             cloid=str(raw_data.get("clientOrderId", "")),
         )
 
+    @staticmethod
+    def futures_batch_orders(raw_data: list[dict]) -> list[OrderIdDict | ResponseError]:
+        return [
+            Adapter.futures_order_create(item)
+            if "orderId" in item
+            else ResponseError(
+                message=item.get("msg", ""),
+                status_code=200,
+                code=str(item.get("code", "")),
+                response_json=item,
+            )
+            for item in raw_data
+        ]
+
     @staticmethod
     def futures_position_info(raw_data: list[dict], symbol: str) -> PositionInfoDict:
         position = raw_data[0]
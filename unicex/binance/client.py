@@ -1,14 +1,13 @@
 __all__ = ["Client"]
 
 import json
-import time
 import warnings
 from typing import Any, Literal
 
 from unicex._base import BaseClient
 from unicex.exceptions import NotAuthorized
 from unicex.types import NumberLike, RequestMethod
-from unicex.utils import dict_to_query_string, filter_params, generate_hmac_sha256_signature
+from unicex.utils import dict_to_query_string, filter_params
 
 
 class Client(BaseClient):
@@ -20,9 +19,20 @@ class Client(BaseClient):
     _BASE_FUTURES_URL: str = "https://fapi.binance.com"
     """Базовый URL для REST API Binance Futures."""
 
+    _KEEP_WARM_URLS: tuple[str, ...] = (
+        "https://api.binance.com/api/v3/ping",
+        "https://fapi.binance.com/fapi/v1/ping",
+    )
+    """Эндпоинты для прогрева соединений (ping/время сервера)."""
+
     _RECV_WINDOW: int = 5000
     """Стандартный интервал времени для получения ответа от сервера."""
 
+    _RETRYABLE_CODES: frozenset[str] = frozenset(
+        {"-1001", "-1003", "-1004", "-1006", "-1007", "-1008"}
+    )
+    """Коды временных ошибок Binance: внутренняя ошибка, превышение лимита, сервер занят, таймаут бэкенда."""
+
     def _get_headers(self, method: RequestMethod) -> dict:
         """Возвращает заголовки для запросов к Binance API."""
         headers = {"Accept": "application/json"}
@@ -80,19 +90,19 @@ class Client(BaseClient):
 
         # Объединяем все параметры в payload
         payload = {**params}
-        payload["timestamp"] = int(time.time() * 1000)
+        payload["timestamp"] = self._server_timestamp()
         payload["recvWindow"] = self._RECV_WINDOW
 
         # Генерируем подпись
         query_string = dict_to_query_string(payload)
-        payload["signature"] = generate_hmac_sha256_signature(
-            self._api_secret,  # type: ignore[attr-defined]
-            query_string,
-            "hex",
-        )
+        payload["signature"] = self._hmac_signer.hexdigest(query_string)  # type: ignore[union-attr]
 
         return payload, headers
 
+    async def _fetch_server_time(self) -> int:
+        """Возвращает серверное время Binance в миллисекундах (для `ClockSync`)."""
+        return (await self.futures_server_time())["serverTime"]
+
     async def _make_request(
         self,
         method: RequestMethod,
@@ -128,6 +138,7 @@ class Client(BaseClient):
             url=url,
             params=payload,
             headers=headers,
+            signed=True,
         )
 
     async def request(self, method: RequestMethod, url: str, params: dict, signed: bool) -> dict:
@@ -0,0 +1,114 @@
+__all__ = ["RateLimiter"]
+
+from collections.abc import Mapping
+from typing import Any
+
+from unicex._base import BaseRateLimiter
+
+
+def _klines_weight(params: dict[str, Any], _: dict[str, Any]) -> int:
+    """Вес /fapi/v1/klines зависит от limit (по умолчанию 500)."""
+    limit = int(params.get("limit", 500))
+    if limit < 100:
+        return 1
+    if limit < 500:
+        return 2
+    if limit <= 1000:
+        return 5
+    return 10
+
+
+def _futures_depth_weight(params: dict[str, Any], _: dict[str, Any]) -> int:
+    """Вес /fapi/v1/depth зависит от limit (по умолчанию 500)."""
+    limit = int(params.get("limit", 500))
+    if limit <= 50:
+        return 2
+    if limit <= 100:
+        return 5
+    if limit <= 500:
+        return 10
+    return 20
+
+
+def _spot_depth_weight(params: dict[str, Any], _: dict[str, Any]) -> int:
+    """Вес /api/v3/depth зависит от limit (по умолчанию 100)."""
+    limit = int(params.get("limit", 100))
+    if limit <= 100:
+        return 5
+    if limit <= 500:
+        return 25
+    if limit <= 1000:
+        return 50
+    return 250
+
+
+def _by_symbol(with_symbol: int, without_symbol: int):
+    """Вес эндпоинта, который дороже без параметра symbol."""
+
+    def weight(params: dict[str, Any], _: dict[str, Any]) -> int:
+        return with_symbol if params.get("symbol") else without_symbol
+
+    return weight
+
+
+class RateLimiter(BaseRateLimiter):
+    """Ограничитель частоты запросов Binance по весу запросов на IP.
+
+    https://developers.binance.com/docs/derivatives/usds-margined-futures/general-info#limits
+    https://developers.binance.com/docs/binance-spot-api-docs/rest-api/limits
+    """
+
+    BUCKETS = {
+        "spot": (6000, 60),
+        "futures": (2400, 60),
+        "default": (1200, 60),
+    }
+
+    HOST_BUCKETS = {
+        "api.binance.com": "spot",
+        "fapi.binance.com": "futures",
+    }
+
+    ENDPOINT_WEIGHTS = {
+        # futures
+        "/fapi/v1/exchangeInfo": 1,
+        "/fapi/v1/klines": _klines_weight,
+        "/fapi/v1/depth": _futures_depth_weight,
+        "/fapi/v1/ticker/24hr": _by_symbol(1, 40),
+        "/fapi/v1/ticker/price": _by_symbol(1, 2),
+        "/fapi/v2/ticker/price": _by_symbol(1, 2),
+        "/fapi/v1/ticker/bookTicker": _by_symbol(2, 5),
+        "/fapi/v1/premiumIndex": _by_symbol(1, 10),
+        "/fapi/v1/openInterest": 1,
+        "/fapi/v1/fundingInfo": 1,
+        "/fapi/v1/fundingRate": 1,
+        "/fapi/v1/order": 1,
+        "/fapi/v1/batchOrders": 5,
+        "/fapi/v1/allOpenOrders": 1,
+        "/fapi/v1/openOrders": _by_symbol(1, 40),
+        "/fapi/v1/allOrders": 5,
+        "/fapi/v1/userTrades": 5,
+        "/fapi/v1/income": 30,
+        "/fapi/v3/account": 5,
+        "/fapi/v3/balance": 5,
+        "/fapi/v3/positionRisk": 5,
+        # spot
+        "/api/v3/exchangeInfo": 20,
+        "/api/v3/klines": 2,
+        "/api/v3/uiKlines": 2,
+        "/api/v3/depth": _spot_depth_weight,
+        "/api/v3/trades": 25,
+        "/api/v3/aggTrades": 4,
+        "/api/v3/ticker/24hr": _by_symbol(2, 80),
+        "/api/v3/ticker/price": _by_symbol(2, 4),
+        "/api/v3/ticker/bookTicker": _by_symbol(2, 4),
+        "/api/v3/account": 20,
+        "/api/v3/openOrders": _by_symbol(6, 80),
+        "/api/v3/allOrders": 20,
+        "/api/v3/myTrades": 20,
+    }
+
+    def _calibrate(self, host: str, path: str, headers: Mapping[str, str]) -> None:
+        used = headers.get("X-MBX-USED-WEIGHT-1M") or headers.get("X-MBX-USED-WEIGHT-1m")
+        if used is not None:
+            self._host_bucket(host).set_used(float(used))
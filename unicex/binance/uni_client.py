@@ -2,7 +2,7 @@ __all__ = ["UniClient"]
 
 
 import asyncio
-from typing import overload
+from typing import Any, overload
 
 from unicex._abc import IUniClient
 from unicex.enums import Exchange, MarginType, MarketType, OrderSide, OrderType, Timeframe
@@ -27,6 +27,18 @@ from .client import Client
 class UniClient(IUniClient[Client]):
     """Унифицированный клиент для работы с Binance API."""
 
+    _FUTURES_BATCH_CREATE_SIZE = 5
+    """Лимит ордеров в `/fapi/v1/batchOrders` (создание)."""
+
+    _FUTURES_BATCH_CANCEL_SIZE = 10
+    """Лимит ордеров в `/fapi/v1/batchOrders` (отмена)."""
+
+    _KLINES_PAGE_SIZE = 1000
+    """Лимит свечей в `/api/v3/klines`."""
+
+    _FUTURES_KLINES_PAGE_SIZE = 1500
+    """Лимит свечей в `/fapi/v1/klines`."""
+
     @property
     def _client_cls(self) -> type[Client]:
         return Client
@@ -219,21 +231,103 @@ class UniClient(IUniClient[Client]):
     ) -> OrderIdDict:
         self.ensure_authorized()
 
-        if type == OrderType.LIMIT and price is None:
-            raise ValueError("Price is required for limit order type on Binance futures.")
-
         raw_data = await self._client.futures_order_create(
-            symbol=symbol,
-            side=side.to_exchange_format(Exchange.BINANCE),
-            type=type.to_exchange_format(Exchange.BINANCE),
-            quantity=quantity,
-            price=price,
-            new_client_order_id=client_order_id,
-            reduce_only=reduce_only,
-            time_in_force="GTC" if type == OrderType.LIMIT else None,
+            **self._futures_order_kwargs(
+                symbol=symbol,
+                side=side,
+                type=type,
+                quantity=quantity,
+                price=price,
+                client_order_id=client_order_id,
+                reduce_only=reduce_only,
+            )
         )
         return Adapter.futures_order_create(raw_data)
 
+    async def futures_order_cancel(
+        self,
+        symbol: str,
+        order_id: str | None = None,
+        client_order_id: str | None = None,
+    ) -> OrderIdDict:
+        self.ensure_authorized()
+
+        raw_data = await self._client.futures_order_cancel(
+            symbol=symbol,
+            order_id=int(order_id) if order_id is not None else None,
+            orig_client_order_id=client_order_id,
+        )
+        return Adapter.futures_order_create(raw_data)  # Ответ отмены в том же формате
+
+    def _check_futures_order(self, order: dict[str, Any]) -> None:
+        self._futures_order_kwargs(**order)  # Выбрасывает ValueError для неверных параметров
+
+    async def _futures_orders_create_chunk(
+        self, orders: list[dict[str, Any]]
+    ) -> list[OrderIdDict | Exception]:
+        self.ensure_authorized()
+
+        batch_orders = []
+        for order in orders:
+            # Пакетный эндпоинт принимает те же параметры, что и создание ордера, в camelCase
+            batch_order = {}
+            for key, value in self._futures_order_kwargs(**order).items():
+                if value is None:
+                    continue
+                head, *rest = key.split("_")
+                field = head + "".join(part.capitalize() for part in rest)
+                batch_order[field] = str(value).lower() if isinstance(value, bool) else value
+            batch_orders.append(batch_order)
+
+        raw_data = await self._client.futures_batch_orders_create(batch_orders)
+        return Adapter.futures_batch_orders(raw_data)  # type: ignore[return-value]
+
+    def _futures_orders_cancel_group(self, cancel: dict[str, Any]) -> Any:
+        # В одном пакете можно передать только orderIdList или только origClientOrderIdList
+        return cancel["symbol"], cancel.get("order_id") is None
+
+    async def _futures_orders_cancel_chunk(
+        self, cancels: list[dict[str, Any]]
+    ) -> list[OrderIdDict | Exception]:
+        self.ensure_authorized()
+
+        symbol = cancels[0]["symbol"]
+        if cancels[0].get("order_id") is not None:
+            raw_data = await self._client.futures_batch_orders_cancel(
+                symbol=symbol,
+                order_id_list=[int(cancel["order_id"]) for cancel in cancels],
+            )
+        else:
+            raw_data = await self._client.futures_batch_orders_cancel(
+                symbol=symbol,
+                orig_client_order_id_list=[cancel["client_order_id"] for cancel in cancels],
+            )
+        return Adapter.futures_batch_orders(raw_data)  # type: ignore[return-value]
+
+    @staticmethod
+    def _futures_order_kwargs(
+        symbol: str,
+        side: OrderSide,
+        type: OrderType,
+        quantity: str,
+        price: str | None = None,
+        client_order_id: str | None = None,
+        reduce_only: bool | None = None,
+    ) -> dict[str, Any]:
+        if type == OrderType.LIMIT and price is None:
+            raise ValueError("Price is required for limit order type on Binance futures.")
+
+        return {
+            "symbol": symbol,
+            "side": side.to_exchange_format(Exchange.BINANCE),
+            "type": type.to_exchange_format(Exchange.BINANCE),
+            "quantity": quantity,
+            "price": price,
+            "new_client_order_id": client_order_id,
+            "reduce_only": reduce_only,
+            "time_in_force": "GTC" if type == OrderType.LIMIT else None,
+        }
+
     async def futures_position_info(self, symbol: str) -> PositionInfoDict:
         self.ensure_authorized()
 
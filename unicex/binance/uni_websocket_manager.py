@@ -126,11 +126,13 @@ class UniWebsocketManager(IUniWebsocketManager):
         symbols: Sequence[str] | None = None,
     ) -> Websocket:
         wrapper = self._make_wrapper(self._adapter.futures_best_bid_ask_message, callback)
-        return self._websocket_manager.futures_symbol_book_ticker(
+        websocket = self._websocket_manager.futures_symbol_book_ticker(
             callback=wrapper,
             symbol=symbol,
             symbols=symbols,
         )
+        websocket.set_default_overflow_policy("conflate")
+        return websocket
 
     def futures_partial_book_depth(
         self,
@@ -152,10 +154,12 @@ class UniWebsocketManager(IUniWebsocketManager):
             raise ValueError("Parameter `update_speed` must be one of: '100ms', '500ms' or None")
 
         wrapper = self._make_wrapper(self._adapter.futures_partial_book_depth_message, callback)
-        return self._websocket_manager.futures_partial_book_depth(
+        websocket = self._websocket_manager.futures_partial_book_depth(
             callback=wrapper,
             symbol=symbol,
             symbols=symbols,
             levels=str(limit),
             update_speed=update_speed,
         )
+        websocket.set_default_overflow_policy("conflate")
+        return websocket
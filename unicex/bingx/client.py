@@ -5,7 +5,7 @@ from typing import Any
 
 from unicex._base import BaseClient
 from unicex.types import RequestMethod
-from unicex.utils import filter_params, get_timestamp
+from unicex.utils import filter_params
 
 
 class Client(BaseClient):
@@ -14,6 +14,17 @@ class Client(BaseClient):
     _BASE_URL: str = "https://open-api.bingx.com"
     """Базовый URL для REST API BingX."""
 
+    _KEEP_WARM_URLS: tuple[str, ...] = ("https://open-api.bingx.com/openApi/swap/v2/server/time",)
+    """Эндпоинты для прогрева соединений (ping/время сервера)."""
+
+    _RETRYABLE_CODES: frozenset[str] = frozenset({"100410", "100500", "100503"})
+    """Коды временных ошибок BingX: превышение лимита, внутренняя ошибка, сервер занят."""
+
+    async def _fetch_server_time(self) -> int:
+        """Возвращает серверное время BingX в миллисекундах (для `ClockSync`)."""
+        response = await self._make_request("GET", "/openApi/swap/v2/server/time")
+        return response["data"]["serverTime"]
+
     async def _make_request(
         self,
         method: RequestMethod,
@@ -36,7 +47,7 @@ class Client(BaseClient):
 
         # Добавляем timestap в параметры, если он не указан
         if params and "timestamp" in params and not params["timestamp"]:
-            params["timestamp"] = get_timestamp()
+            params["timestamp"] = self._server_timestamp()
 
         # Фильтруем параметры от None значений
         params = filter_params(params) if params else {}
@@ -0,0 +1,12 @@
+__all__ = ["RateLimiter"]
+
+from unicex._base import BaseRateLimiter
+
+
+class RateLimiter(BaseRateLimiter):
+    """Ограничитель частоты запросов BingX — 100 запросов за 10 секунд на IP для рыночных данных.
+
+    https://bingx-api.github.io/docs/#/en-us/swapV2/base-info.html
+    """
+
+    BUCKETS = {"default": (100, 10)}
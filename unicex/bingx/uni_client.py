@@ -26,6 +26,12 @@ from .client import Client
 class UniClient(IUniClient[Client]):
     """Унифицированный клиент для работы с BingX API."""
 
+    _KLINES_PAGE_SIZE = 1000
+    """Лимит свечей в `/openApi/spot/v2/market/kline`."""
+
+    _FUTURES_KLINES_PAGE_SIZE = 1000
+    """Лимит свечей в `/openApi/swap/v3/quote/klines`."""
+
     @property
     def _client_cls(self) -> type[Client]:
         return Client
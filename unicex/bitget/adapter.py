@@ -1,5 +1,6 @@
 from typing import Any
 
+from unicex.exceptions import ResponseError
 from unicex.types import (
     BestBidAskDict,
     BestBidAskItem,
@@ -191,6 +192,41 @@ class Adapter:
             cloid=data["clientOid"],
         )
 
+    @staticmethod
+    def futures_batch_orders(
+        raw_data: Any, keys: list[tuple[str, str]]
+    ) -> list[OrderIdDict | ResponseError]:
+        # Bitget возвращает успешные и неуспешные ордера отдельными списками,
+        # поэтому результат сопоставляется с запросом по orderId или clientOid
+        data = raw_data["data"]
+        found: dict[tuple[str, str], OrderIdDict | ResponseError] = {}
+        for item in data.get("successList") or []:
+            result = OrderIdDict(
+                t=int(raw_data["requestTime"]),
+                id=item["orderId"],
+                cloid=item["clientOid"],
+            )
+            found[("orderId", item["orderId"])] = found[("clientOid", item["clientOid"])] = result
+        for item in data.get("failureList") or []:
+            error = ResponseError(
+                message=item.get("errorMsg", ""),
+                status_code=200,
+                code=str(item.get("errorCode", "")),
+                response_json=item,
+            )
+            for field in ("orderId", "clientOid"):
+                if item.get(field):
+                    found[(field, item[field])] = error
+        return [
+            found.get(key)
+            or ResponseError(
+                message=f"Order {key[1]} is missing in batch response",
+                status_code=200,
+                response_json=raw_data,
+            )
+            for key in keys
+        ]
+
     @staticmethod
     def futures_position_info(raw_data: Any) -> PositionInfoDict:
         positions = raw_data["data"]
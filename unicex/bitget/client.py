@@ -1,7 +1,6 @@
 __all__ = ["Client"]
 
 import json
-import time
 from typing import Any, Literal
 
 from unicex._base import BaseClient
@@ -10,7 +9,6 @@ from unicex.types import NumberLike, RequestMethod
 from unicex.utils import (
     dict_to_query_string,
     filter_params,
-    generate_hmac_sha256_signature,
     sort_params_by_alphabetical_order,
 )
 
@@ -21,6 +19,12 @@ class Client(BaseClient):
     _BASE_URL: str = "https://api.bitget.com"
     """Базовый URL для REST API Bitget."""
 
+    _KEEP_WARM_URLS: tuple[str, ...] = ("https://api.bitget.com/api/v2/public/time",)
+    """Эндпоинты для прогрева соединений (ping/время сервера)."""
+
+    _RETRYABLE_CODES: frozenset[str] = frozenset({"429", "40010", "40725"})
+    """Коды временных ошибок Bitget: превышение лимита, таймаут запроса, ошибка сервиса."""
+
     def is_authorized(self) -> bool:
         """Проверяет наличие API‑ключей у клиента.
 
@@ -61,16 +65,12 @@ class Client(BaseClient):
         if not self.is_authorized():
             raise NotAuthorized("Api key and api secret is required to private endpoints")
 
-        timestamp = str(int(time.time() * 1000))
+        timestamp = str(self._server_timestamp())
 
         path = f"{endpoint}?{dict_to_query_string(params)}" if params else endpoint
         body_str = json.dumps(body) if body else ""
         prehash = f"{timestamp}{method}{path}{body_str}"
-        signature = generate_hmac_sha256_signature(
-            self._api_secret,  # type: ignore[attr-defined]
-            prehash,
-            "base64",
-        )
+        signature = self._hmac_signer.b64digest(prehash)  # type: ignore[union-attr]
         return timestamp, signature
 
     def _get_headers(self, timestamp: str, signature: str) -> dict[str, str]:
@@ -140,6 +140,10 @@ class Client(BaseClient):
             headers = self._get_headers(timestamp, signature)
         return url, params, body, headers
 
+    async def _fetch_server_time(self) -> int:
+        """Возвращает серверное время Bitget в миллисекундах (для `ClockSync`)."""
+        return int((await self.get_server_time())["data"]["serverTime"])
+
     async def _make_request(
         self,
         method: RequestMethod,
@@ -181,10 +185,11 @@ class Client(BaseClient):
             params=params,
             data=data,
             headers=headers,
+            signed=signed,
         )
 
     def _validate_response(
-        self, status_code: int, response_text: str, response_json: dict[str, Any]
+        self, status_code: int, response_body: bytes, response_json: dict[str, Any]
     ) -> None:
         """Проверка ответа API на ошибки биржи. Переопределяется в клиентах конкретных бирж."""
         code = response_json.get("code")
@@ -193,7 +198,7 @@ class Client(BaseClient):
                 response_json.get("msg", ""),
                 code=str(code),
                 status_code=status_code,
-                response_text=response_text,
+                response_text=self._decode_body(response_body),
                 response_json=response_json,
             )
 
@@ -0,0 +1,35 @@
+__all__ = ["RateLimiter"]
+
+from unicex._base import BaseRateLimiter
+
+
+class RateLimiter(BaseRateLimiter):
+    """Ограничитель частоты запросов Bitget.
+
+    Лимиты заданы для каждого эндпоинта отдельно (запросов в секунду на IP или UID).
+
+    https://www.bitget.com/api-doc/common/intro#rate-limit
+    """
+
+    BUCKETS = {"default": (20, 1)}
+
+    ENDPOINT_LIMITS = {
+        "/api/v2/spot/market/tickers": (20, 1),
+        "/api/v2/spot/market/candles": (20, 1),
+        "/api/v2/spot/market/orderbook": (20, 1),
+        "/api/v2/spot/public/symbols": (20, 1),
+        "/api/v2/mix/market/tickers": (20, 1),
+        "/api/v2/mix/market/ticker": (20, 1),
+        "/api/v2/mix/market/candles": (20, 1),
+        "/api/v2/mix/market/merge-depth": (20, 1),
+        "/api/v2/mix/market/contracts": (20, 1),
+        "/api/v2/mix/market/open-interest": (20, 1),
+        "/api/v2/mix/market/current-fund-rate": (20, 1),
+        "/api/v2/mix/order/place-order": (10, 1),
+        "/api/v2/mix/order/batch-place-order": (5, 1),
+        "/api/v2/mix/order/cancel-order": (10, 1),
+        "/api/v2/mix/order/batch-cancel-orders": (10, 1),
+        "/api/v2/mix/position/single-position": (10, 1),
+        "/api/v2/mix/account/set-leverage": (5, 1),
+        "/api/v2/mix/account/set-margin-mode": (5, 1),
+    }
@@ -1,6 +1,7 @@
 __all__ = ["UniClient"]
 
-from typing import overload
+import uuid
+from typing import Any, overload
 
 from unicex._abc import IUniClient
 from unicex.enums import Exchange, MarginType, MarketType, OrderSide, OrderType, Timeframe
@@ -25,6 +26,18 @@ from .client import Client
 class UniClient(IUniClient[Client]):
     """Унифицированный клиент для работы с Bitget API."""
 
+    _FUTURES_BATCH_CREATE_SIZE = 50
+    """Лимит ордеров в `/api/v2/mix/order/batch-place-order`."""
+
+    _FUTURES_BATCH_CANCEL_SIZE = 50
+    """Лимит ордеров в `/api/v2/mix/order/batch-cancel-orders`."""
+
+    _KLINES_PAGE_SIZE = 1000
+    """Лимит свечей в `/api/v2/spot/market/candles`."""
+
+    _FUTURES_KLINES_PAGE_SIZE = 1000
+    """Лимит свечей в `/api/v2/mix/market/candles`."""
+
     @property
     def _client_cls(self) -> type[Client]:
         return Client
@@ -239,6 +252,85 @@ class UniClient(IUniClient[Client]):
         )
         return Adapter.futures_order_create(raw_data)
 
+    async def futures_order_cancel(
+        self,
+        symbol: str,
+        order_id: str | None = None,
+        client_order_id: str | None = None,
+    ) -> OrderIdDict:
+        self.ensure_authorized()
+
+        raw_data = await self._client.futures_cancel_order(
+            symbol=symbol,
+            product_type="USDT-FUTURES",
+            margin_coin="USDT",
+            order_id=order_id,
+            client_oid=client_order_id,
+        )
+        return Adapter.futures_order_create(raw_data)  # Ответ отмены в том же формате
+
+    def _check_futures_order(self, order: dict[str, Any]) -> None:
+        if order["type"] == OrderType.LIMIT and order.get("price") is None:
+            raise ValueError("Price is required for limit order type on Bitget futures.")
+
+    def _futures_orders_create_group(self, order: dict[str, Any]) -> Any:
+        # Тикер и режим маржи задаются на весь пакет
+        return order["symbol"], order.get("margin_type", MarginType.ISOLATED)
+
+    async def _futures_orders_create_chunk(
+        self, orders: list[dict[str, Any]]
+    ) -> list[OrderIdDict | Exception]:
+        self.ensure_authorized()
+
+        order_list = []
+        for order in orders:
+            type = order["type"]
+            item = {
+                "size": order["quantity"],
+                "price": order.get("price"),
+                "side": order["side"].to_exchange_format(Exchange.BITGET),
+                "orderType": type.to_exchange_format(Exchange.BITGET),
+                "force": "gtc" if type == OrderType.LIMIT else None,
+                # clientOid нужен, чтобы сопоставить ответ с ордером
+                "clientOid": order.get("client_order_id") or uuid.uuid4().hex,
+                "reduceOnly": {True: "YES", False: "NO", None: None}[order.get("reduce_only")],
+            }
+            order_list.append({k: v for k, v in item.items() if v is not None})
+
+        margin_type = orders[0].get("margin_type", MarginType.ISOLATED)
+        raw_data = await self._client.futures_batch_place_order(
+            symbol=orders[0]["symbol"],
+            margin_mode=margin_type.to_exchange_format(Exchange.BITGET),
+            margin_coin="USDT",
+            order_list=order_list,
+            product_type="USDT-FUTURES",
+        )
+        keys = [("clientOid", item["clientOid"]) for item in order_list]
+        return Adapter.futures_batch_orders(raw_data, keys)  # type: ignore[return-value]
+
+    async def _futures_orders_cancel_chunk(
+        self, cancels: list[dict[str, Any]]
+    ) -> list[OrderIdDict | Exception]:
+        self.ensure_authorized()
+
+        order_id_list = []
+        keys = []
+        for cancel in cancels:
+            if cancel.get("order_id") is not None:
+                order_id_list.append({"orderId": cancel["order_id"]})
+                keys.append(("orderId", cancel["order_id"]))
+            else:
+                order_id_list.append({"clientOid": cancel["client_order_id"]})
+                keys.append(("clientOid", cancel["client_order_id"]))
+
+        raw_data = await self._client.futures_batch_cancel_orders(
+            product_type="USDT-FUTURES",
+            order_id_list=order_id_list,
+            symbol=cancels[0]["symbol"],
+            margin_coin="USDT",
+        )
+        return Adapter.futures_batch_orders(raw_data, keys)  # type: ignore[return-value]
+
     async def futures_position_info(self, symbol: str) -> PositionInfoDict:
         self.ensure_authorized()
 
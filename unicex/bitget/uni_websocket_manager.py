@@ -119,13 +119,15 @@ class UniWebsocketManager(IUniWebsocketManager):
         symbols: Sequence[str] | None = None,
     ) -> Websocket:
         wrapper = self._make_wrapper(self._adapter.futures_best_bid_ask_message, callback)
-        return self._websocket_manager.depth(
+        websocket = self._websocket_manager.depth(
             callback=wrapper,
             market_type="USDT-FUTURES",
             depth_type="books1",
             symbol=symbol,
             symbols=symbols,
         )
+        websocket.set_default_overflow_policy("conflate")
+        return websocket
 
     def futures_partial_book_depth(
         self,
@@ -139,10 +141,12 @@ class UniWebsocketManager(IUniWebsocketManager):
             raise ValueError("Parameter `limit` must be one of: 1, 5, 15")
 
         wrapper = self._make_wrapper(self._adapter.futures_partial_book_depth_message, callback)
-        return self._websocket_manager.depth(
+        websocket = self._websocket_manager.depth(
             callback=wrapper,
             market_type="USDT-FUTURES",
             depth_type=depth_by_limit[limit],
             symbol=symbol,
             symbols=symbols,
         )
+        websocket.set_default_overflow_policy("conflate")
+        return websocket
@@ -5,6 +5,7 @@ from typing import Any
 
 from loguru import logger
 
+from unicex.exceptions import ResponseError
 from unicex.types import (
     BestBidAskDict,
     BestBidAskItem,
@@ -191,6 +192,26 @@ class Adapter:
             cloid=result.get("orderLinkId", "") or "",
         )
 
+    @staticmethod
+    def orders_batch(raw_data: dict) -> list[OrderIdDict | ResponseError]:
+        results = raw_data["result"]["list"]
+        statuses = raw_data["retExtInfo"]["list"]
+        return [
+            OrderIdDict(
+                t=int(result.get("createAt") or raw_data["time"]),
+                id=result["orderId"],
+                cloid=result.get("orderLinkId", "") or "",
+            )
+            if status["code"] == 0
+            else ResponseError(
+                message=status["msg"],
+                status_code=200,
+                code=str(status["code"]),
+                response_json=result,
+            )
+            for result, status in zip(results, statuses, strict=True)
+        ]
+
     @staticmethod
     def futures_position_info(raw_data: dict) -> PositionInfoDict:
         positions = raw_data["result"]["list"]
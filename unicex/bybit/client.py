@@ -1,13 +1,12 @@
 __all__ = ["Client"]
 
 import json
-import time
 from typing import Any, Literal
 
 from unicex._base import BaseClient
 from unicex.exceptions import NotAuthorized, ResponseError
 from unicex.types import RequestMethod
-from unicex.utils import dict_to_query_string, filter_params, generate_hmac_sha256_signature
+from unicex.utils import dict_to_query_string, filter_params
 
 
 class Client(BaseClient):
@@ -16,9 +15,15 @@ class Client(BaseClient):
     _BASE_URL: str = "https://api.bybit.com"
     """Базовый URL для REST API Bybit."""
 
+    _KEEP_WARM_URLS: tuple[str, ...] = ("https://api.bybit.com/v5/market/time",)
+    """Эндпоинты для прогрева соединений (ping/время сервера)."""
+
     _RECV_WINDOW: str = "5000"
     """Стандартный интервал времени для получения ответа от сервера."""
 
+    _RETRYABLE_CODES: frozenset[str] = frozenset({"10000", "10006", "10016", "10429"})
+    """Коды временных ошибок Bybit: таймаут сервера, превышение лимита, внутренняя ошибка, защита от частоты запросов."""
+
     def _get_headers(self, timestamp: str, signature: str | None = None) -> dict:
         """Возвращает заголовки для запросов к Bybit API.
 
@@ -48,12 +53,16 @@ class Client(BaseClient):
             # timestamp+api_key+recv_window+jsonBodyString
             dumped_payload = json.dumps(payload)
             prepared_query_string = timestamp + self._api_key + self._RECV_WINDOW + dumped_payload  # type: ignore[attrDefined]
-            return generate_hmac_sha256_signature(self._api_secret, prepared_query_string)  # type: ignore[attrDefined]
+            return self._hmac_signer.hexdigest(prepared_query_string)  # type: ignore[union-attr]
         else:
             # timestamp+api_key+recv_window+queryString
             query_string = dict_to_query_string(payload)
             prepared_query_string = timestamp + self._api_key + self._RECV_WINDOW + query_string  # type: ignore[attrDefined]
-            return generate_hmac_sha256_signature(self._api_secret, prepared_query_string)  # type: ignore[attrDefined]
+            return self._hmac_signer.hexdigest(prepared_query_string)  # type: ignore[union-attr]
+
+    async def _fetch_server_time(self) -> int:
+        """Возвращает серверное время Bybit в миллисекундах (для `ClockSync`)."""
+        return (await self.ping())["time"]
 
     async def _make_request(
         self,
@@ -85,7 +94,7 @@ class Client(BaseClient):
         params = filter_params(params) if params else {}
 
         # Генерируем временную метку
-        timestamp = str(int(time.time() * 1000))
+        timestamp = str(self._server_timestamp())
 
         # Проверяем нужно ли подписывать запрос
         if not signed:
@@ -112,6 +121,7 @@ class Client(BaseClient):
                 url=url,
                 data=payload,
                 headers=headers,
+                signed=True,
             )
         else:  # Иначе параметры добавляем к query string
             return await super()._make_request(
@@ -119,6 +129,7 @@ class Client(BaseClient):
                 url=url,
                 params=params,
                 headers=headers,
+                signed=True,
             )
 
     async def request(
@@ -140,7 +151,7 @@ class Client(BaseClient):
         )
 
     def _validate_response(
-        self, status_code: int, response_text: str, response_json: dict[str, Any]
+        self, status_code: int, response_body: bytes, response_json: dict[str, Any]
     ) -> None:
         """Проверка ответа API на ошибки биржи. Переопределяется в клиентах конкретных бирж."""
         ret_code = response_json.get("retCode")
@@ -149,7 +160,7 @@ class Client(BaseClient):
                 response_json.get("retMsg", ""),
                 code=str(ret_code),
                 status_code=status_code,
-                response_text=response_text,
+                response_text=self._decode_body(response_body),
                 response_json=response_json,
             )
 
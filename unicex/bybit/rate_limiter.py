@@ -0,0 +1,42 @@
+__all__ = ["RateLimiter"]
+
+from collections.abc import Mapping
+
+from unicex._base import BaseRateLimiter
+
+
+class RateLimiter(BaseRateLimiter):
+    """Ограничитель частоты запросов Bybit.
+
+    Общий лимит — 600 запросов за 5 секунд на IP. Лимиты приватных эндпоинтов
+    считаются на аккаунт и калибруются по заголовкам `X-Bapi-Limit` и `X-Bapi-Limit-Status`.
+
+    https://bybit-exchange.github.io/docs/v5/rate-limit
+    """
+
+    BUCKETS = {"default": (600, 5)}
+
+    ENDPOINT_LIMITS = {
+        "/v5/order/create": (10, 1),
+        "/v5/order/amend": (10, 1),
+        "/v5/order/cancel": (10, 1),
+        "/v5/order/cancel-all": (10, 1),
+        "/v5/order/create-batch": (10, 1),
+        "/v5/order/amend-batch": (10, 1),
+        "/v5/order/cancel-batch": (10, 1),
+        "/v5/order/realtime": (50, 1),
+        "/v5/order/history": (50, 1),
+        "/v5/position/list": (50, 1),
+        "/v5/position/set-leverage": (10, 1),
+        "/v5/position/switch-isolated": (10, 1),
+        "/v5/account/wallet-balance": (50, 1),
+    }
+
+    def _calibrate(self, host: str, path: str, headers: Mapping[str, str]) -> None:
+        limit = headers.get("X-Bapi-Limit")
+        remaining = headers.get("X-Bapi-Limit-Status")
+        if limit is None or remaining is None:
+            return
+        bucket = self._endpoint_bucket(path, (float(limit), 1))
+        if bucket is not None:
+            bucket.set_remaining(float(remaining))
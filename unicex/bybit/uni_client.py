@@ -2,7 +2,7 @@ __all__ = ["UniClient"]
 
 
 import asyncio
-from typing import overload
+from typing import Any, overload
 
 from unicex._abc import IUniClient
 from unicex.enums import Exchange, MarginType, OrderSide, OrderType, Timeframe
@@ -28,6 +28,18 @@ from .client import Client
 class UniClient(IUniClient[Client]):
     """Унифицированный клиент для работы с Bybit API."""
 
+    _FUTURES_BATCH_CREATE_SIZE = 20
+    """Лимит ордеров в `/v5/order/create-batch` для категории linear."""
+
+    _FUTURES_BATCH_CANCEL_SIZE = 20
+    """Лимит ордеров в `/v5/order/cancel-batch` для категории linear."""
+
+    _KLINES_PAGE_SIZE = 1000
+    """Лимит свечей в `/v5/market/kline` (spot)."""
+
+    _FUTURES_KLINES_PAGE_SIZE = 1000
+    """Лимит свечей в `/v5/market/kline` (linear)."""
+
     @property
     def _client_cls(self) -> type[Client]:
         return Client
@@ -232,6 +244,63 @@ class UniClient(IUniClient[Client]):
 
         return Adapter.order_create(raw_data)
 
+    async def futures_order_cancel(
+        self,
+        symbol: str,
+        order_id: str | None = None,
+        client_order_id: str | None = None,
+    ) -> OrderIdDict:
+        self.ensure_authorized()
+
+        raw_data = await self.client.cancel_order(
+            category="linear",
+            symbol=symbol,
+            order_id=order_id,
+            order_link_id=client_order_id,
+        )
+        return Adapter.order_create(raw_data)  # Ответ отмены в том же формате
+
+    async def _futures_orders_create_chunk(
+        self, orders: list[dict[str, Any]]
+    ) -> list[OrderIdDict | Exception]:
+        self.ensure_authorized()
+
+        request = []
+        for order in orders:
+            item = {
+                "symbol": order["symbol"],
+                "side": order["side"].to_exchange_format(Exchange.BYBIT),
+                "orderType": order["type"].to_exchange_format(Exchange.BYBIT),
+                "qty": order["quantity"],
+                "price": order.get("price"),
+                "orderLinkId": order.get("client_order_id"),
+                "reduceOnly": order.get("reduce_only"),
+            }
+            request.append({k: v for k, v in item.items() if v is not None})
+
+        raw_data = await self.client.create_orders_batch(category="linear", request=request)
+        return Adapter.orders_batch(raw_data)  # type: ignore[return-value]
+
+    def _futures_orders_cancel_group(self, cancel: dict[str, Any]) -> Any:
+        return None  # Bybit отменяет пакетом ордера разных тикеров
+
+    async def _futures_orders_cancel_chunk(
+        self, cancels: list[dict[str, Any]]
+    ) -> list[OrderIdDict | Exception]:
+        self.ensure_authorized()
+
+        request = []
+        for cancel in cancels:
+            item = {
+                "symbol": cancel["symbol"],
+                "orderId": cancel.get("order_id"),
+                "orderLinkId": cancel.get("client_order_id"),
+            }
+            request.append({k: v for k, v in item.items() if v is not None})
+
+        raw_data = await self.client.cancel_orders_batch(category="linear", request=request)
+        return Adapter.orders_batch(raw_data)  # type: ignore[return-value]
+
     async def futures_position_info(self, symbol: str) -> PositionInfoDict:
         self.ensure_authorized()
 
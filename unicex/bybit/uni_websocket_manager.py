@@ -132,13 +132,15 @@ class UniWebsocketManager(IUniWebsocketManager):
         symbol: str | None = None,
         symbols: Sequence[str] | None = None,
     ) -> Websocket:
-        return self._websocket_manager.orderbook(
+        websocket = self._websocket_manager.orderbook(
             callback=self._make_wrapper(self._adapter.best_bid_ask_message, callback),
             category="linear",
             depth=1,
             symbol=symbol,
             symbols=symbols,
         )
+        websocket.set_default_overflow_policy("conflate")
+        return websocket
 
     def futures_partial_book_depth(
         self,
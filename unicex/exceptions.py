@@ -39,6 +39,15 @@ class QueueOverflowError(UniCexException):
     pass
 
 
+@dataclass
+class CircuitOpenError(UniCexException):
+    """Исключение, возникающее при запросе к хосту, для которого разомкнут предохранитель."""
+
+    host: str = ""
+    retry_in: float = 0.0
+    """Через сколько секунд предохранитель пропустит пробный запрос."""
+
+
 @dataclass
 class ResponseError(UniCexException):
     """Исключение, возникающее при ошибке ответа."""
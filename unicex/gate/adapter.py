@@ -5,6 +5,7 @@ from typing import Any
 
 from loguru import logger
 
+from unicex.exceptions import ResponseError
 from unicex.types import (
     BestBidAskDict,
     BestBidAskItem,
@@ -274,6 +275,48 @@ class Adapter:
             cloid=raw_data["text"],
         )
 
+    @staticmethod
+    def futures_order_cancel(raw_data: dict) -> OrderIdDict:
+        return OrderIdDict(
+            t=int((raw_data.get("finish_time") or time.time()) * 1000),
+            id=str(raw_data["id"]),
+            cloid=raw_data.get("text", ""),
+        )
+
+    @staticmethod
+    def futures_batch_orders(raw_data: list[dict]) -> list[OrderIdDict | ResponseError]:
+        return [
+            Adapter.futures_order_create(item)
+            if item.get("succeeded", True)
+            else ResponseError(
+                message=item.get("message") or item.get("detail", ""),
+                status_code=200,
+                code=item.get("label", ""),
+                response_json=item,
+            )
+            for item in raw_data
+        ]
+
+    @staticmethod
+    def futures_batch_cancel(
+        raw_data: list[dict], order_ids: list[str]
+    ) -> list[OrderIdDict | ResponseError]:
+        by_id = {str(item["id"]): item for item in raw_data}
+        results: list[OrderIdDict | ResponseError] = []
+        for order_id in order_ids:
+            item = by_id.get(str(order_id))
+            if item is not None and item.get("succeeded"):
+                results.append(OrderIdDict(t=int(time.time() * 1000), id=str(order_id), cloid=""))
+            else:
+                results.append(
+                    ResponseError(
+                        message=(item or {}).get("message") or "Order is missing in response",
+                        status_code=200,
+                        response_json=item or {},
+                    )
+                )
+        return results
+
     @staticmethod
     def futures_position_info(raw_data: dict) -> PositionInfoDict:
         if not raw_data:
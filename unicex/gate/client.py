@@ -1,9 +1,7 @@
 __all__ = ["Client"]
 
 import hashlib
-import hmac
 import json
-import time
 from typing import Any, Literal
 
 from unicex._base import BaseClient
@@ -18,6 +16,12 @@ class Client(BaseClient):
     _BASE_URL: str = "https://api.gateio.ws"
     """Базовый URL для REST API Gate.io."""
 
+    _KEEP_WARM_URLS: tuple[str, ...] = ("https://api.gateio.ws/api/v4/spot/time",)
+    """Эндпоинты для прогрева соединений (ping/время сервера)."""
+
+    _HMAC_DIGEST = hashlib.sha512
+    """Хэш-функция HMAC-подписи запросов."""
+
     def _normalize_query_params(
         self,
         params: dict[str, Any],
@@ -49,7 +53,7 @@ class Client(BaseClient):
         data = filter_params(data) if data else None
         url = f"{self._BASE_URL}{endpoint}"
 
-        timestamp = str(int(time.time()))
+        timestamp = str(self._server_timestamp(milliseconds=False))
         headers: dict[str, str] = {
             "Accept": "application/json",
             "Content-Type": "application/json",
@@ -72,14 +76,14 @@ class Client(BaseClient):
         signature_body = (
             f"{method.upper()}\n{endpoint}\n{query_string}\n{hashed_payload}\n{timestamp}"
         )
-        signature = hmac.new(
-            self._api_secret.encode("utf-8"),  # type: ignore[attr-defined]
-            signature_body.encode("utf-8"),
-            hashlib.sha512,
-        ).hexdigest()
-        headers["SIGN"] = signature
+        headers["SIGN"] = self._hmac_signer.hexdigest(signature_body)  # type: ignore[union-attr]
         return url, params, data, headers
 
+    async def _fetch_server_time(self) -> int:
+        """Возвращает серверное время Gate.io в миллисекундах (для `ClockSync`)."""
+        response = await self._make_request("GET", "/api/v4/spot/time", signed=False)
+        return response["server_time"]
+
     async def _make_request(
         self,
         method: RequestMethod,
@@ -103,6 +107,7 @@ class Client(BaseClient):
             params=params,
             data=data,
             headers=headers,
+            signed=signed,
         )
 
     async def request(
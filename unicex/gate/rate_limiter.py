@@ -0,0 +1,26 @@
+__all__ = ["RateLimiter"]
+
+from collections.abc import Mapping
+
+from unicex._base import BaseRateLimiter
+
+
+class RateLimiter(BaseRateLimiter):
+    """Ограничитель частоты запросов Gate.io.
+
+    Публичные эндпоинты — 200 запросов за 10 секунд на эндпоинт. Остаток бюджета
+    калибруется по заголовкам `X-Gate-RateLimit-Limit` и `X-Gate-RateLimit-Requests-Remain`.
+
+    https://www.gate.com/docs/developers/apiv4/#frequency-limit-rule
+    """
+
+    BUCKETS = {"default": (200, 10)}
+
+    def _calibrate(self, host: str, path: str, headers: Mapping[str, str]) -> None:
+        limit = headers.get("X-Gate-RateLimit-Limit")
+        remaining = headers.get("X-Gate-RateLimit-Requests-Remain")
+        if limit is None or remaining is None:
+            return
+        bucket = self._endpoint_bucket(path, (float(limit), 10))
+        if bucket is not None:
+            bucket.set_remaining(float(remaining))
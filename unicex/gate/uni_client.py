@@ -3,7 +3,7 @@ __all__ = ["UniClient"]
 
 import asyncio
 from decimal import Decimal
-from typing import Literal, overload
+from typing import Any, Literal, overload
 
 from unicex._abc import IUniClient
 from unicex.enums import Exchange, MarginType, MarketType, OrderSide, OrderType, Timeframe
@@ -30,6 +30,18 @@ from .exchange_info import ExchangeInfo
 class UniClient(IUniClient[Client]):
     """Унифицированный клиент для работы с Gateio API."""
 
+    _FUTURES_BATCH_CREATE_SIZE = 10
+    """Лимит ордеров в `/futures/{settle}/batch_orders`."""
+
+    _FUTURES_BATCH_CANCEL_SIZE = 20
+    """Лимит ордеров в `/futures/{settle}/batch_cancel_orders`."""
+
+    _KLINES_PAGE_SIZE = 1000
+    """Лимит свечей в `/spot/candlesticks`."""
+
+    _FUTURES_KLINES_PAGE_SIZE = 2000
+    """Лимит свечей в `/futures/{settle}/candlesticks`."""
+
     @property
     def _client_cls(self) -> type[Client]:
         return Client
@@ -103,6 +115,23 @@ class UniClient(IUniClient[Client]):
         )
         return Adapter.futures_klines(raw_data=raw_data, symbol=symbol)  # type: ignore[reportArgumentType]
 
+    async def _klines_page(
+        self,
+        symbol: str,
+        interval: Timeframe,
+        start_time: int,
+        end_time: int,
+        futures: bool,
+    ) -> list[KlineDict]:
+        fetch = self.futures_klines if futures else self.klines
+        # Gate отклоняет limit вместе с from и to
+        return await fetch(
+            symbol=symbol,
+            interval=interval,
+            start_time=start_time,
+            end_time=end_time,
+        )
+
     @overload
     async def funding_rate(self, symbol: str) -> float: ...
 
@@ -227,6 +256,91 @@ class UniClient(IUniClient[Client]):
     ) -> OrderIdDict:
         self.ensure_authorized()
 
+        order_data = self._futures_order_data(
+            symbol=symbol,
+            side=side,
+            type=type,
+            quantity=quantity,
+            price=price,
+            client_order_id=client_order_id,
+            reduce_only=reduce_only,
+            quantity_unit=quantity_unit,
+        )
+        raw_data = await self._client.futures_create_order(
+            settle="usdt",
+            order=order_data,
+        )
+        return Adapter.futures_order_create(raw_data)
+
+    async def futures_order_cancel(
+        self,
+        symbol: str,
+        order_id: str | None = None,
+        client_order_id: str | None = None,
+    ) -> OrderIdDict:
+        self.ensure_authorized()
+
+        raw_data = await self._client.futures_cancel_order(
+            settle="usdt",
+            order_id=order_id or self._futures_order_text(client_order_id),  # type: ignore[arg-type]
+        )
+        return Adapter.futures_order_cancel(raw_data)
+
+    def _check_futures_order(self, order: dict[str, Any]) -> None:
+        self._futures_order_data(**order)  # Выбрасывает ValueError для неверных параметров
+
+    async def _futures_orders_create_chunk(
+        self, orders: list[dict[str, Any]]
+    ) -> list[OrderIdDict | Exception]:
+        self.ensure_authorized()
+
+        raw_data = await self._client.futures_create_orders_batch(
+            settle="usdt",
+            orders=[self._futures_order_data(**order) for order in orders],
+        )
+        return Adapter.futures_batch_orders(raw_data)  # type: ignore[arg-type, return-value]
+
+    def _futures_orders_cancel_group(self, cancel: dict[str, Any]) -> Any:
+        return cancel.get("order_id") is None  # Пакетная отмена принимает только ID ордеров
+
+    async def _futures_orders_cancel_chunk(
+        self, cancels: list[dict[str, Any]]
+    ) -> list[OrderIdDict | Exception]:
+        self.ensure_authorized()
+
+        if cancels[0].get("order_id") is None:
+            return list(
+                await asyncio.gather(
+                    *(self.futures_order_cancel(**cancel) for cancel in cancels),
+                    return_exceptions=True,
+                )
+            )
+
+        order_ids = [cancel["order_id"] for cancel in cancels]
+        raw_data = await self._client.futures_cancel_orders_batch(
+            settle="usdt",
+            order_ids=order_ids,
+        )
+        return Adapter.futures_batch_cancel(raw_data, order_ids)  # type: ignore[arg-type, return-value]
+
+    @staticmethod
+    def _futures_order_text(client_order_id: str | None) -> str | None:
+        if not client_order_id:
+            return None
+        return client_order_id if client_order_id.startswith("t-") else f"t-{client_order_id}"
+
+    @classmethod
+    def _futures_order_data(
+        cls,
+        symbol: str,
+        side: OrderSide,
+        type: OrderType,
+        quantity: str,
+        price: str | None = None,
+        client_order_id: str | None = None,
+        reduce_only: bool | None = None,
+        quantity_unit: Literal["contract", "currency"] = "contract",
+    ) -> dict[str, Any]:
         if type == OrderType.LIMIT and price is None:
             raise ValueError("Price is required for limit order type on Gate futures.")
 
@@ -255,23 +369,14 @@ class UniClient(IUniClient[Client]):
         else:
             raise ValueError(f"Unsupported quantity unit: {quantity_unit}.")
 
-        text = None
-        if client_order_id:
-            text = client_order_id if client_order_id.startswith("t-") else f"t-{client_order_id}"
-
-        order_data = {
+        return {
             "contract": symbol,
             "size": size,
             "price": "0" if type == OrderType.MARKET else price,
             "tif": "ioc" if type == OrderType.MARKET else "gtc",
-            "text": text,
+            "text": cls._futures_order_text(client_order_id),
             "reduce_only": reduce_only,
         }
-        raw_data = await self._client.futures_create_order(
-            settle="usdt",
-            order=order_data,
-        )
-        return Adapter.futures_order_create(raw_data)
 
     async def futures_position_info(self, symbol: str) -> PositionInfoDict:
         self.ensure_authorized()
@@ -134,7 +134,9 @@ class UniWebsocketManager(IUniWebsocketManager):
         tickers = self._normalize_symbols(symbol, symbols)
 
         wrapper = self._make_wrapper(self._adapter.futures_best_bid_ask_message, callback)
-        return self._websocket_manager.futures_book_ticker(callback=wrapper, symbols=tickers)
+        websocket = self._websocket_manager.futures_book_ticker(callback=wrapper, symbols=tickers)
+        websocket.set_default_overflow_policy("conflate")
+        return websocket
 
     def futures_partial_book_depth(
         self,
@@ -150,9 +152,11 @@ class UniWebsocketManager(IUniWebsocketManager):
         tickers = self._normalize_symbols(symbol, symbols)
 
         wrapper = self._make_wrapper(self._adapter.futures_partial_book_depth_message, callback)
-        return self._websocket_manager.futures_order_book(
+        websocket = self._websocket_manager.futures_order_book(
             callback=wrapper,
             symbols=tickers,
             limit=str(limit),  # type: ignore[arg-type]
             interval="0",
         )
+        websocket.set_default_overflow_policy("conflate")
+        return websocket
@@ -1,17 +1,32 @@
 __all__ = ["Client"]
 
+import asyncio
 import time
+from concurrent.futures import Executor
+from functools import lru_cache
 from typing import Any, Literal, Self
 
 import aiohttp
 import msgpack
 from eth_account import Account
-from eth_account.messages import encode_typed_data
 from eth_account.signers.local import LocalAccount
+from eth_keys.datatypes import PrivateKey
 from eth_utils.conversions import to_hex
 from eth_utils.crypto import keccak
 
-from unicex._base import BaseClient
+from unicex._base import (
+    BaseClient,
+    BaseRateLimiter,
+    ClockSync,
+    Eip712Signer,
+    HedgePolicy,
+    KeepWarm,
+    ProxyPool,
+    RequestHooks,
+    ResponseCache,
+    RetryPolicy,
+    SessionPool,
+)
 from unicex.exceptions import NotAuthorized
 from unicex.types import LoggerLike, NumberLike
 from unicex.utils import filter_params
@@ -19,52 +34,6 @@ from unicex.utils import filter_params
 # Authentication
 
 
-def _l1_payload(phantom_agent: dict[str, Any]) -> dict[str, Any]:
-    """Формирует EIP-712 payload для подписи "агента".
-
-    Простыми словами:
-    Это упаковка данных в формат, который кошелёк сможет подписать.
-    В Ethereum есть стандарт EIP-712 - "structured data signing".
-    Он позволяет подписывать не просто строку, а структуру (объект),
-    чтобы потом её можно было проверить.
-
-    Пример:
-        >>> phantom = {"source": "a", "connectionId": b"1234...."}
-        >>> _l1_payload(phantom)
-        {...сложный словарь...}
-
-    Параметры:
-        phantom_agent (dict): объект с полями:
-            - source (str): откуда пришёл агент ("a" для mainnet, "b" для testnet)
-            - connectionId (bytes32): уникальный ID (обычно хэш)
-
-    Возвращает:
-        dict: структура для подписи через EIP-712
-    """
-    return {
-        "domain": {
-            "chainId": 1337,
-            "name": "Exchange",
-            "verifyingContract": "0x0000000000000000000000000000000000000000",
-            "version": "1",
-        },
-        "types": {
-            "Agent": [
-                {"name": "source", "type": "string"},
-                {"name": "connectionId", "type": "bytes32"},
-            ],
-            "EIP712Domain": [
-                {"name": "name", "type": "string"},
-                {"name": "version", "type": "string"},
-                {"name": "chainId", "type": "uint256"},
-                {"name": "verifyingContract", "type": "address"},
-            ],
-        },
-        "primaryType": "Agent",
-        "message": phantom_agent,
-    }
-
-
 def _address_to_bytes(address: str) -> bytes:
     r"""Переводит Ethereum-адрес в байты.
 
@@ -149,175 +118,6 @@ def _action_hash(
     return keccak(data)
 
 
-def _sign_inner(wallet: LocalAccount, data: dict[str, Any]) -> dict[str, Any]:
-    """Подписывает данные EIP-712 через кошелёк.
-
-    Простыми словами:
-    Берём структуру (payload), кодируем её в формат EIP-712
-    и просим кошелёк подписать.
-    Возвращаем r, s, v - стандартные параметры Ethereum-подписи.
-
-    Пример:
-        >>> _sign_inner(wallet, {...})
-        {"r": "0x...", "s": "0x...", "v": 27}
-
-    Параметры:
-        wallet (LocalAccount): объект кошелька.
-        data (dict): структура для подписи (EIP-712).
-
-    Возвращает:
-        dict:
-            - r (str): часть подписи
-            - s (str): часть подписи
-            - v (int): "восстановитель" (27 или 28 обычно)
-    """
-    structured_data = encode_typed_data(full_message=data)
-    signed = wallet.sign_message(structured_data)
-    return {"r": to_hex(signed["r"]), "s": to_hex(signed["s"]), "v": signed["v"]}
-
-
-def _sign_l1_action(
-    wallet: LocalAccount,
-    action: dict[str, Any],
-    active_pool: str | None,
-    nonce: int,
-    expires_after: int | None,
-    is_mainnet: bool = True,
-) -> dict[str, Any]:
-    """Подписывает действие для L1 (основного уровня).
-
-    Простыми словами:
-    Это конечная функция, которая собирает всё:
-    - делает хэш действия
-    - строит phantom_agent
-    - формирует payload для подписи
-    - подписывает его через кошелёк
-    Возвращает r, s, v.
-
-    Пример:
-        >>> _sign_l1_action(wallet, {"type": "order"}, None, 1, None, True)
-        {"r": "0x...", "s": "0x...", "v": 27}
-
-    Параметры:
-        wallet (LocalAccount): объект кошелька.
-        action (dict): действие (например, ордер).
-        active_pool (str | None): адрес пула (если нужен).
-        nonce (int): уникальный номер действия.
-        expires_after (int | None): срок жизни действия.
-        is_mainnet (bool): True - основная сеть, False - тестовая.
-
-    Возвращает:
-        dict:
-            - r (str)
-            - s (str)
-            - v (int)
-    """
-    hash = _action_hash(action, active_pool, nonce, expires_after)
-    phantom_agent = _construct_phantom_agent(hash, is_mainnet)
-    data = _l1_payload(phantom_agent)
-    return _sign_inner(wallet, data)
-
-
-def _user_signed_payload(
-    primary_type: str,
-    payload_types: list[dict[str, str]],
-    action: dict[str, Any],
-) -> dict[str, Any]:
-    """Формирует EIP-712 payload для "user-signed" подписи.
-
-    Простыми словами:
-    Это структура для подписи действий от лица пользователя.
-    В отличие от L1-подписи (где используется phantom-агент),
-    здесь кошелёк подписывает само действие напрямую.
-
-    ChainID и домен указываются специально, чтобы предотвратить
-    повторное воспроизведение (replay) на других цепях.
-
-    Пример:
-        >>> payload = _user_signed_payload(
-        ...     primary_type="Withdraw",
-        ...     payload_types=[{"name": "amount", "type": "uint256"}],
-        ...     action={"amount": 100, "signatureChainId": "0x66eee"},
-        ... )
-        >>> payload.keys()
-        dict_keys(["domain", "types", "primaryType", "message"])
-
-    Параметры:
-        primary_type (str): Основной тип сообщения, например `"Withdraw"`, `"Transfer"`.
-        payload_types (list[dict]): Список полей EIP-712 типа, например:
-            `[{"name": "amount", "type": "uint256"}, {"name": "recipient", "type": "address"}]`
-        action (dict): Само сообщение (поля, которые будут подписаны).
-            Должно содержать `"signatureChainId"` (строку в hex).
-
-    Возвращает:
-        dict: Полностью готовая структура EIP-712 для подписи кошельком.
-    """
-    chain_id = int(action["signatureChainId"], 16)
-    return {
-        "domain": {
-            "name": "HyperliquidSignTransaction",
-            "version": "1",
-            "chainId": chain_id,
-            "verifyingContract": "0x0000000000000000000000000000000000000000",
-        },
-        "types": {
-            primary_type: payload_types,
-            "EIP712Domain": [
-                {"name": "name", "type": "string"},
-                {"name": "version", "type": "string"},
-                {"name": "chainId", "type": "uint256"},
-                {"name": "verifyingContract", "type": "address"},
-            ],
-        },
-        "primaryType": primary_type,
-        "message": action,
-    }
-
-
-def _sign_user_signed_action(
-    wallet: LocalAccount,
-    action: dict[str, Any],
-    payload_types: list[dict[str, str]],
-    primary_type: str,
-    is_mainnet: bool,
-) -> dict[str, Any]:
-    """Подписывает действие "user-signed" формата (EIP-712).
-
-    Простыми словами:
-    Это альтернатива L1-подписи. Здесь сам пользователь (его кошелёк)
-    подписывает объект `action`, который будет исполнен Hyperliquid.
-    Отличие от L1: используется другой `chainId` (0x66eee) и поле `"hyperliquidChain"`,
-    чтобы действие нельзя было воспроизвести в другой сети.
-
-    Пример:
-        >>> action = {"amount": 100}
-        >>> payload_types = [{"name": "amount", "type": "uint256"}]
-        >>> sig = _sign_user_signed_action(wallet, action, payload_types, "Withdraw", True)
-        >>> sig.keys()
-        dict_keys(["r", "s", "v"])
-
-    Параметры:
-        wallet (LocalAccount): Объект кошелька, созданный через `Account.from_key(...)`.
-        action (dict): Содержимое действия, которое нужно подписать.
-        payload_types (list[dict[str, str]]): Описание полей типа для EIP-712.
-        primary_type (str): Основное имя типа, например `"Withdraw"`, `"Transfer"`.
-        is_mainnet (bool): True - подпись для основной сети, False - для тестовой.
-
-    Возвращает:
-        dict:
-            - r (str): первая часть подписи
-            - s (str): вторая часть подписи
-            - v (int): "восстановитель" подписи (27 или 28)
-    """
-    # signatureChainId - цепочка, через которую кошелёк делает подпись (не Hyperliquid chain)
-    action["signatureChainId"] = "0x66eee"
-    # hyperliquidChain - фактическая среда исполнения
-    action["hyperliquidChain"] = "Mainnet" if is_mainnet else "Testnet"
-
-    data = _user_signed_payload(primary_type, payload_types, action)
-    return _sign_inner(wallet, data)
-
-
 USD_SEND_SIGN_TYPES = [
     {"name": "hyperliquidChain", "type": "string"},
     {"name": "destination", "type": "string"},
@@ -386,6 +186,175 @@ APPROVE_BUILDER_FEE_SIGN_TYPES = [
     {"name": "nonce", "type": "uint64"},
 ]
 
+_ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+_AGENT_DOMAIN = {
+    "name": "Exchange",
+    "version": "1",
+    "chainId": 1337,
+    "verifyingContract": _ZERO_ADDRESS,
+}
+"""EIP-712 домен L1-подписи (phantom agent)."""
+
+_AGENT_TYPES = [
+    {"name": "source", "type": "string"},
+    {"name": "connectionId", "type": "bytes32"},
+]
+"""Поля EIP-712 типа Agent."""
+
+
+@lru_cache(maxsize=8)
+def _private_key(key: bytes) -> PrivateKey:
+    """Возвращает объект ключа. Кэшируется, так как вывод публичного ключа дорогой."""
+    return PrivateKey(key)
+
+
+def _sign_digest(key: bytes, digest: bytes) -> tuple[dict[str, Any], float]:
+    """Подписывает готовый EIP-712 хэш. Выполняется в пуле потоков или процессов.
+
+    Параметры:
+        key (`bytes`): Приватный ключ.
+        digest (`bytes`): 32-байтовый хэш для подписи.
+
+    Возвращает:
+        `tuple[dict, float]`: Подпись {"r", "s", "v"} и время подписи, сек.
+    """
+    started = time.perf_counter()
+    signature = _private_key(key).sign_msg_hash(digest)
+    return (
+        {"r": to_hex(signature.r), "s": to_hex(signature.s), "v": signature.v + 27},
+        time.perf_counter() - started,
+    )
+
+
+class _ActionSigner:
+    """Подписчик действий Hyperliquid с выносом ECDSA в пул.
+
+    Хэш действия (msgpack + keccak) и EIP-712 хэш считаются в event loop: это десятки
+    микросекунд. Домены и хэши типов посчитаны заранее (`Eip712Signer`) для L1-подписи и
+    для каждого типа user-signed действий. В пул уходит только подпись готового хэша —
+    она занимает миллисекунды CPU. С `ProcessPoolExecutor` одновременные order/cancel/modify
+    подписываются параллельно, с `ThreadPoolExecutor` подпись хотя бы не блокирует loop.
+
+    Задержки собираются по стадиям: hash (хэширование в loop), queue (ожидание в пуле),
+    sign (ECDSA), total.
+    """
+
+    _STAGES = ("hash", "queue", "sign", "total")
+    """Стадии подписи, по которым собирается статистика."""
+
+    def __init__(self, wallet: LocalAccount, executor: Executor | None = None) -> None:
+        """Инициализирует подписчика.
+
+        Параметры:
+            wallet (`LocalAccount`): Кошелёк для подписи.
+            executor (`Executor | None`): Пул для подписи хэшей. Если не передан — подпись в event loop.
+        """
+        self._wallet = wallet
+        self._key = bytes(wallet.key)
+        self._executor = executor
+        self._agent = Eip712Signer(wallet, _AGENT_DOMAIN, "Agent", _AGENT_TYPES)
+        self._user_signed: dict[str, Eip712Signer] = {}
+        # stage -> [count, total, max]
+        self._stats: dict[str, list[float]] = {stage: [0, 0.0, 0.0] for stage in self._STAGES}
+
+    async def sign_l1_action(
+        self,
+        action: dict[str, Any],
+        vault_address: str | None,
+        nonce: int,
+        expires_after: int | None,
+        is_mainnet: bool = True,
+    ) -> dict[str, Any]:
+        """Подписывает L1-действие (EIP-712 тип Agent с phantom agent).
+
+        Параметры:
+            action (`dict`): Действие (например, ордер).
+            vault_address (`str | None`): Адрес хранилища, если есть.
+            nonce (`int`): Уникальный номер действия.
+            expires_after (`int | None`): Срок жизни действия.
+            is_mainnet (`bool`): True - основная сеть, False - тестовая.
+
+        Возвращает:
+            `dict`: Подпись {"r", "s", "v"}.
+        """
+        started = time.perf_counter()
+        action_hash = _action_hash(action, vault_address, nonce, expires_after)
+        digest = self._agent.hash_message(_construct_phantom_agent(action_hash, is_mainnet))
+        return await self._sign(digest, started)
+
+    async def sign_user_signed_action(
+        self,
+        action: dict[str, Any],
+        payload_types: list[dict[str, str]],
+        primary_type: str,
+        is_mainnet: bool,
+    ) -> dict[str, Any]:
+        """Подписывает user-signed действие (EIP-712 домен HyperliquidSignTransaction).
+
+        Параметры:
+            action (`dict`): Содержимое действия. Дополняется полями signatureChainId и hyperliquidChain.
+            payload_types (`list[dict[str, str]]`): Описание полей типа для EIP-712.
+            primary_type (`str`): Основное имя типа, например `"HyperliquidTransaction:UsdSend"`.
+            is_mainnet (`bool`): True - основная сеть, False - тестовая.
+
+        Возвращает:
+            `dict`: Подпись {"r", "s", "v"}.
+        """
+        started = time.perf_counter()
+        action["signatureChainId"] = "0x66eee"
+        action["hyperliquidChain"] = "Mainnet" if is_mainnet else "Testnet"
+        signer = self._user_signed.get(primary_type)
+        if signer is None:
+            domain = {
+                "name": "HyperliquidSignTransaction",
+                "version": "1",
+                "chainId": int(action["signatureChainId"], 16),
+                "verifyingContract": _ZERO_ADDRESS,
+            }
+            signer = Eip712Signer(self._wallet, domain, primary_type, payload_types)
+            self._user_signed[primary_type] = signer
+        return await self._sign(signer.hash_message(action), started)
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """Возвращает задержки по стадиям подписи.
+
+        Возвращает:
+            `dict`: {stage: {"count", "avg_ms", "max_ms"}} для стадий hash, queue, sign, total.
+        """
+        return {
+            stage: {
+                "count": count,
+                "avg_ms": total / count * 1000 if count else 0.0,
+                "max_ms": peak * 1000,
+            }
+            for stage, (count, total, peak) in self._stats.items()
+        }
+
+    async def _sign(self, digest: bytes, started: float) -> dict[str, Any]:
+        """Подписывает хэш в пуле (или в loop) и записывает задержки стадий."""
+        hashed = time.perf_counter()
+        if self._executor is None:
+            signature, sign_time = _sign_digest(self._key, digest)
+        else:
+            loop = asyncio.get_running_loop()
+            signature, sign_time = await loop.run_in_executor(
+                self._executor, _sign_digest, self._key, digest
+            )
+        finished = time.perf_counter()
+        self._record("hash", hashed - started)
+        self._record("queue", max(finished - hashed - sign_time, 0.0))
+        self._record("sign", sign_time)
+        self._record("total", finished - started)
+        return signature
+
+    def _record(self, stage: str, elapsed: float) -> None:
+        """Добавляет замер стадии."""
+        stats = self._stats[stage]
+        stats[0] += 1
+        stats[1] += elapsed
+        stats[2] = max(stats[2], elapsed)
+
 
 class Client(BaseClient):
     """Клиент для работы с Hyperliquid API."""
@@ -405,8 +374,17 @@ class Client(BaseClient):
         logger: LoggerLike | None = None,
         max_retries: int = 3,
         retry_delay: int | float = 0.1,
-        proxies: list[str] | None = None,
+        proxies: list[str] | ProxyPool | None = None,
         timeout: int = 10,
+        rate_limiter: BaseRateLimiter | None = None,
+        single_flight: bool = False,
+        cache: ResponseCache | None = None,
+        retry_policy: RetryPolicy | None = None,
+        hedge: HedgePolicy | None = None,
+        hooks: list[RequestHooks] | None = None,
+        clock_sync: ClockSync | None = None,
+        keep_warm: KeepWarm | None = None,
+        signing_executor: Executor | None = None,
     ) -> None:
         """Инициализация клиента.
 
@@ -420,24 +398,40 @@ class Client(BaseClient):
             retry_delay (`int | float`): Задержка между повторными попытками, сек.
             proxies (`list[str] | None`): Список HTTP(S)‑прокси для циклического использования.
             timeout (`int`): Максимальное время ожидания ответа от сервера, сек.
+            rate_limiter (`BaseRateLimiter | None`): Ограничитель частоты запросов (например, `RateLimiter.shared()` биржи). Если не передан — запросы не ограничиваются.
+            single_flight (`bool`): Объединять одновременные одинаковые GET-запросы в один сетевой вызов с общим результатом.
+            cache (`ResponseCache | None`): Кэш ответов публичных эндпоинтов (например, `ResponseCache()`). Если не передан — ответы не кэшируются.
+            retry_policy (`RetryPolicy | None`): Политика повторов (backoff, jitter, `Retry-After`, предохранитель). Если не передана — собирается из `max_retries` и `retry_delay`.
+            hedge (`HedgePolicy | None`): Политика хеджирования GET-запросов: дубль запроса после перцентиля недавних задержек. Если не передана — запросы не хеджируются.
+            hooks (`list[RequestHooks] | None`): Обработчики событий жизненного цикла запросов (например, `LatencyHistogram()`).
+            clock_sync (`ClockSync | None`): Синхронизация часов с сервером Hyperliquid для подписи действий (например, `ClockSync.shared("hyperliquid")`). Если не передана — используется локальное время.
+            keep_warm (`KeepWarm | None`): Прогрев и поддержание открытых соединений к хостам биржи (например, `KeepWarm(connections=2)`), запускается через `warm_up()`. Если не передан — `warm_up()` использует настройки по умолчанию.
+            signing_executor (`Executor | None`): Пул для подписи действий вне event loop (например, `ProcessPoolExecutor()` для параллельной подписи). Если не передан — подпись выполняется в event loop.
         """
         super().__init__(
-            session,
-            None,
-            None,
-            None,
-            logger,
-            max_retries,
-            retry_delay,
-            proxies,
-            timeout,
+            session=session,
+            logger=logger,
+            max_retries=max_retries,
+            retry_delay=retry_delay,
+            proxies=proxies,
+            timeout=timeout,
+            rate_limiter=rate_limiter,
+            single_flight=single_flight,
+            cache=cache,
+            retry_policy=retry_policy,
+            hedge=hedge,
+            hooks=hooks,
+            clock_sync=clock_sync,
+            keep_warm=keep_warm,
         )
         self._vault_address = vault_address
         self._wallet_address = wallet_address
         self._wallet: LocalAccount | None = None
+        self._action_signer: _ActionSigner | None = None
         if private_key is not None:
             # private_key может быть в hex-строке ("0x...") или в байтах
             self._wallet = Account.from_key(private_key)
+            self._action_signer = _ActionSigner(self._wallet, signing_executor)
 
     @classmethod
     async def create(
@@ -449,8 +443,17 @@ class Client(BaseClient):
         logger: LoggerLike | None = None,
         max_retries: int = 3,
         retry_delay: int | float = 0.1,
-        proxies: list[str] | None = None,
+        proxies: list[str] | ProxyPool | None = None,
         timeout: int = 10,
+        rate_limiter: BaseRateLimiter | None = None,
+        single_flight: bool = False,
+        cache: ResponseCache | None = None,
+        retry_policy: RetryPolicy | None = None,
+        hedge: HedgePolicy | None = None,
+        hooks: list[RequestHooks] | None = None,
+        clock_sync: ClockSync | None = None,
+        keep_warm: KeepWarm | None = None,
+        signing_executor: Executor | None = None,
     ) -> Self:
         """Создаёт инстанцию клиента.
 
@@ -458,12 +461,21 @@ class Client(BaseClient):
             private_key (`str | bytes | None`): Приватный ключ для подписи запросов.
             wallet_address (`str | None`): Адрес кошелька для подписи запросов.
             vault_address (`str | None`): Адрес валита для подписи запросов.
-            session (`aiohttp.ClientSession | None`): Сессия для HTTP‑запросов (если не передана, будет создана).
+            session (`aiohttp.ClientSession | None`): Сессия для HTTP‑запросов (если не передана, будет взята общая сессия биржи из `SessionPool`).
             logger (`LoggerLike | None`): Логгер для вывода информации.
             max_retries (`int`): Максимум повторов при ошибках запроса.
             retry_delay (`int | float`): Задержка между повторами, сек.
-            proxies (`list[str] | None`): Список HTTP(S)‑прокси.
+            proxies (`list[str] | ProxyPool | None`): Список HTTP(S)‑прокси или общий `ProxyPool`.
             timeout (`int`): Таймаут ответа сервера, сек.
+            rate_limiter (`BaseRateLimiter | None`): Ограничитель частоты запросов (например, `RateLimiter.shared()` биржи). Если не передан — запросы не ограничиваются.
+            single_flight (`bool`): Объединять одновременные одинаковые GET-запросы в один сетевой вызов с общим результатом.
+            cache (`ResponseCache | None`): Кэш ответов публичных эндпоинтов (например, `ResponseCache()`). Если не передан — ответы не кэшируются.
+            retry_policy (`RetryPolicy | None`): Политика повторов (backoff, jitter, `Retry-After`, предохранитель). Если не передана — собирается из `max_retries` и `retry_delay`.
+            hedge (`HedgePolicy | None`): Политика хеджирования GET-запросов: дубль запроса после перцентиля недавних задержек. Если не передана — запросы не хеджируются.
+            hooks (`list[RequestHooks] | None`): Обработчики событий жизненного цикла запросов (например, `LatencyHistogram()`).
+            clock_sync (`ClockSync | None`): Синхронизация часов с сервером Hyperliquid для подписи действий (например, `ClockSync.shared("hyperliquid")`). Если не передана — используется локальное время.
+            keep_warm (`KeepWarm | None`): Прогрев и поддержание открытых соединений к хостам биржи (например, `KeepWarm(connections=2)`), запускается через `warm_up()`. Если не передан — `warm_up()` использует настройки по умолчанию.
+            signing_executor (`Executor | None`): Пул для подписи действий вне event loop (например, `ProcessPoolExecutor()` для параллельной подписи). Если не передан — подпись выполняется в event loop.
 
         Возвращает:
             `Self`: Созданный экземпляр клиента.
@@ -472,14 +484,33 @@ class Client(BaseClient):
             private_key=private_key,
             wallet_address=wallet_address,
             vault_address=vault_address,
-            session=session or aiohttp.ClientSession(),
+            session=session or SessionPool.acquire(SessionPool.key_for(cls)),
             logger=logger,
             max_retries=max_retries,
             retry_delay=retry_delay,
             proxies=proxies,
             timeout=timeout,
+            rate_limiter=rate_limiter,
+            single_flight=single_flight,
+            cache=cache,
+            retry_policy=retry_policy,
+            hedge=hedge,
+            hooks=hooks,
+            clock_sync=clock_sync,
+            keep_warm=keep_warm,
+            signing_executor=signing_executor,
         )
 
+    def signing_stats(self) -> dict[str, dict[str, float]]:
+        """Возвращает задержки подписи действий по стадиям.
+
+        Возвращает:
+            `dict`: {stage: {"count", "avg_ms", "max_ms"}} для стадий hash, queue, sign, total.
+        """
+        if self._action_signer is None:
+            raise NotAuthorized("Private key is required for private endpoints.")
+        return self._action_signer.stats()
+
     def _resolve_user(self, user: str | None) -> str:
         """Возвращает адрес пользователя: переданный явно или из wallet_address.
 
@@ -523,6 +554,13 @@ class Client(BaseClient):
         """Создание POST-запроса к Hyperliquid API."""
         return await self._make_request("POST", endpoint, data=data)
 
+    async def _fetch_server_time(self) -> int:
+        """Возвращает серверное время Hyperliquid в миллисекундах (для `ClockSync`).
+
+        Отдельного эндпоинта времени нет, поэтому берется метка `time` стакана BTC.
+        """
+        return int((await self.l2_book("BTC"))["time"])
+
     async def request(
         self,
         endpoint: str,
@@ -1378,9 +1416,8 @@ class Client(BaseClient):
             action["builder"] = {"b": builder_address, "f": builder_fee}
 
         effective_vault = vault_address or self._vault_address
-        action_nonce = nonce if nonce is not None else int(time.time() * 1000)
-        signature = _sign_l1_action(
-            self._wallet,
+        action_nonce = nonce if nonce is not None else self._server_timestamp()
+        signature = await self._action_signer.sign_l1_action(  # type: ignore[union-attr]
             action,
             effective_vault,
             action_nonce,
@@ -1450,9 +1487,8 @@ class Client(BaseClient):
         action = {"type": "cancel", "cancels": normalized}
 
         effective_vault = vault_address or self._vault_address
-        action_nonce = nonce if nonce is not None else int(time.time() * 1000)
-        signature = _sign_l1_action(
-            self._wallet,
+        action_nonce = nonce if nonce is not None else self._server_timestamp()
+        signature = await self._action_signer.sign_l1_action(  # type: ignore[union-attr]
             action,
             effective_vault,
             action_nonce,
@@ -1522,9 +1558,8 @@ class Client(BaseClient):
         action = {"type": "cancelByCloid", "cancels": normalized}
 
         effective_vault = vault_address or self._vault_address
-        action_nonce = nonce if nonce is not None else int(time.time() * 1000)
-        signature = _sign_l1_action(
-            self._wallet,
+        action_nonce = nonce if nonce is not None else self._server_timestamp()
+        signature = await self._action_signer.sign_l1_action(  # type: ignore[union-attr]
             action,
             effective_vault,
             action_nonce,
@@ -1562,9 +1597,8 @@ class Client(BaseClient):
             action["time"] = time_ms
 
         effective_vault = vault_address or self._vault_address
-        action_nonce = nonce if nonce is not None else int(time.time() * 1000)
-        signature = _sign_l1_action(
-            self._wallet,
+        action_nonce = nonce if nonce is not None else self._server_timestamp()
+        signature = await self._action_signer.sign_l1_action(  # type: ignore[union-attr]
             action,
             effective_vault,
             action_nonce,
@@ -1662,9 +1696,8 @@ class Client(BaseClient):
         action = {"type": "batchModify", "modifies": normalized}
 
         effective_vault = vault_address or self._vault_address
-        action_nonce = nonce if nonce is not None else int(time.time() * 1000)
-        signature = _sign_l1_action(
-            self._wallet,
+        action_nonce = nonce if nonce is not None else self._server_timestamp()
+        signature = await self._action_signer.sign_l1_action(  # type: ignore[union-attr]
             action,
             effective_vault,
             action_nonce,
@@ -1707,9 +1740,8 @@ class Client(BaseClient):
         }
 
         effective_vault = vault_address or self._vault_address
-        action_nonce = nonce if nonce is not None else int(time.time() * 1000)
-        signature = _sign_l1_action(
-            self._wallet,
+        action_nonce = nonce if nonce is not None else self._server_timestamp()
+        signature = await self._action_signer.sign_l1_action(  # type: ignore[union-attr]
             action,
             effective_vault,
             action_nonce,
@@ -1752,9 +1784,8 @@ class Client(BaseClient):
         }
 
         effective_vault = vault_address or self._vault_address
-        action_nonce = nonce if nonce is not None else int(time.time() * 1000)
-        signature = _sign_l1_action(
-            self._wallet,
+        action_nonce = nonce if nonce is not None else self._server_timestamp()
+        signature = await self._action_signer.sign_l1_action(  # type: ignore[union-attr]
             action,
             effective_vault,
             action_nonce,
@@ -1796,8 +1827,7 @@ class Client(BaseClient):
         }
         action_nonce = nonce if nonce is not None else time_ms
         is_mainnet = hyperliquid_chain == "Mainnet"
-        signature = _sign_user_signed_action(
-            self._wallet,
+        signature = await self._action_signer.sign_user_signed_action(  # type: ignore[union-attr]
             action,
             USD_SEND_SIGN_TYPES,
             "HyperliquidTransaction:UsdSend",
@@ -1837,8 +1867,7 @@ class Client(BaseClient):
         }
         action_nonce = nonce if nonce is not None else time_ms
         is_mainnet = hyperliquid_chain == "Mainnet"
-        signature = _sign_user_signed_action(
-            self._wallet,
+        signature = await self._action_signer.sign_user_signed_action(  # type: ignore[union-attr]
             action,
             SPOT_TRANSFER_SIGN_TYPES,
             "HyperliquidTransaction:SpotSend",
@@ -1876,8 +1905,7 @@ class Client(BaseClient):
         }
         action_nonce = nonce if nonce is not None else time_ms
         is_mainnet = hyperliquid_chain == "Mainnet"
-        signature = _sign_user_signed_action(
-            self._wallet,
+        signature = await self._action_signer.sign_user_signed_action(  # type: ignore[union-attr]
             action,
             WITHDRAW_SIGN_TYPES,
             "HyperliquidTransaction:Withdraw",
@@ -1909,7 +1937,7 @@ class Client(BaseClient):
         # Формат amount_field: при субаккаунте добавляется суффикс "subaccount:<addr>"
         amount_field = f"{amount} subaccount:{subaccount}" if subaccount is not None else str(amount)
 
-        nonce = int(time.time() * 1000)
+        nonce = self._server_timestamp()
 
         action = {
             "type": "usdClassTransfer",
@@ -1918,8 +1946,7 @@ class Client(BaseClient):
             "nonce": nonce,
         }
         is_mainnet = hyperliquid_chain == "Mainnet"
-        signature = _sign_user_signed_action(
-            self._wallet,
+        signature = await self._action_signer.sign_user_signed_action(  # type: ignore[union-attr]
             action,
             USD_CLASS_TRANSFER_SIGN_TYPES,
             "HyperliquidTransaction:UsdClassTransfer",
@@ -1965,8 +1992,7 @@ class Client(BaseClient):
         }
         action_nonce = nonce if nonce is not None else nonce_value
         is_mainnet = hyperliquid_chain == "Mainnet"
-        signature = _sign_user_signed_action(
-            self._wallet,
+        signature = await self._action_signer.sign_user_signed_action(  # type: ignore[union-attr]
             action,
             SEND_ASSET_SIGN_TYPES,
             "HyperliquidTransaction:SendAsset",
@@ -2002,8 +2028,7 @@ class Client(BaseClient):
         }
         action_nonce = nonce if nonce is not None else nonce_value
         is_mainnet = hyperliquid_chain == "Mainnet"
-        signature = _sign_user_signed_action(
-            self._wallet,
+        signature = await self._action_signer.sign_user_signed_action(  # type: ignore[union-attr]
             action,
             STAKING_SIGN_TYPES,
             "HyperliquidTransaction:CDeposit",
@@ -2039,8 +2064,7 @@ class Client(BaseClient):
         }
         action_nonce = nonce if nonce is not None else nonce_value
         is_mainnet = hyperliquid_chain == "Mainnet"
-        signature = _sign_user_signed_action(
-            self._wallet,
+        signature = await self._action_signer.sign_user_signed_action(  # type: ignore[union-attr]
             action,
             STAKING_SIGN_TYPES,
             "HyperliquidTransaction:CWithdraw",
@@ -2080,8 +2104,7 @@ class Client(BaseClient):
         }
         action_nonce = nonce if nonce is not None else nonce_value
         is_mainnet = hyperliquid_chain == "Mainnet"
-        signature = _sign_user_signed_action(
-            self._wallet,
+        signature = await self._action_signer.sign_user_signed_action(  # type: ignore[union-attr]
             action,
             TOKEN_DELEGATE_TYPES,
             "HyperliquidTransaction:TokenDelegate",
@@ -2120,9 +2143,8 @@ class Client(BaseClient):
         }
 
         effective_vault = signing_vault_address or self._vault_address
-        action_nonce = nonce if nonce is not None else int(time.time() * 1000)
-        signature = _sign_l1_action(
-            self._wallet,
+        action_nonce = nonce if nonce is not None else self._server_timestamp()
+        signature = await self._action_signer.sign_l1_action(  # type: ignore[union-attr]
             action,
             effective_vault,
             action_nonce,
@@ -2167,8 +2189,7 @@ class Client(BaseClient):
             action["agentName"] = ""
         action_nonce = nonce if nonce is not None else nonce_value
         is_mainnet = hyperliquid_chain == "Mainnet"
-        signature = _sign_user_signed_action(
-            self._wallet,
+        signature = await self._action_signer.sign_user_signed_action(  # type: ignore[union-attr]
             action,
             APPROVE_AGENT_SIGN_TYPES,
             "HyperliquidTransaction:ApproveAgent",
@@ -2206,8 +2227,7 @@ class Client(BaseClient):
         }
         action_nonce = nonce if nonce is not None else nonce_value
         is_mainnet = hyperliquid_chain == "Mainnet"
-        signature = _sign_user_signed_action(
-            self._wallet,
+        signature = await self._action_signer.sign_user_signed_action(  # type: ignore[union-attr]
             action,
             APPROVE_BUILDER_FEE_SIGN_TYPES,
             "HyperliquidTransaction:ApproveBuilderFee",
@@ -2254,9 +2274,8 @@ class Client(BaseClient):
         }
 
         effective_vault = vault_address or self._vault_address
-        action_nonce = nonce if nonce is not None else int(time.time() * 1000)
-        signature = _sign_l1_action(
-            self._wallet,
+        action_nonce = nonce if nonce is not None else self._server_timestamp()
+        signature = await self._action_signer.sign_l1_action(  # type: ignore[union-attr]
             action,
             effective_vault,
             action_nonce,
@@ -2297,9 +2316,8 @@ class Client(BaseClient):
         }
 
         effective_vault = vault_address or self._vault_address
-        action_nonce = nonce if nonce is not None else int(time.time() * 1000)
-        signature = _sign_l1_action(
-            self._wallet,
+        action_nonce = nonce if nonce is not None else self._server_timestamp()
+        signature = await self._action_signer.sign_l1_action(  # type: ignore[union-attr]
             action,
             effective_vault,
             action_nonce,
@@ -2335,9 +2353,8 @@ class Client(BaseClient):
         action = {"type": "reserveRequestWeight", "weight": weight}
 
         effective_vault = vault_address or self._vault_address
-        action_nonce = nonce if nonce is not None else int(time.time() * 1000)
-        signature = _sign_l1_action(
-            self._wallet,
+        action_nonce = nonce if nonce is not None else self._server_timestamp()
+        signature = await self._action_signer.sign_l1_action(  # type: ignore[union-attr]
             action,
             effective_vault,
             action_nonce,
@@ -2372,9 +2389,8 @@ class Client(BaseClient):
         action = {"type": "noop"}
 
         effective_vault = vault_address or self._vault_address
-        action_nonce = nonce if nonce is not None else int(time.time() * 1000)
-        signature = _sign_l1_action(
-            self._wallet,
+        action_nonce = nonce if nonce is not None else self._server_timestamp()
+        signature = await self._action_signer.sign_l1_action(  # type: ignore[union-attr]
             action,
             effective_vault,
             action_nonce,
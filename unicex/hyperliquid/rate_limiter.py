@@ -0,0 +1,46 @@
+__all__ = ["RateLimiter"]
+
+from typing import Any
+
+from unicex._base import BaseRateLimiter
+
+_LIGHT_INFO_TYPES = {
+    "l2Book",
+    "allMids",
+    "clearinghouseState",
+    "orderStatus",
+    "spotClearinghouseState",
+    "exchangeStatus",
+}
+"""Типы /info запросов с весом 2."""
+
+
+def _info_weight(_: dict[str, Any], data: dict[str, Any]) -> int:
+    """Вес /info зависит от типа запроса."""
+    request_type = data.get("type")
+    if request_type in _LIGHT_INFO_TYPES:
+        return 2
+    if request_type == "userRole":
+        return 60
+    return 20
+
+
+def _exchange_weight(_: dict[str, Any], data: dict[str, Any]) -> int:
+    """Вес /exchange: 1 + floor(batch_length / 40)."""
+    action = data.get("action") or {}
+    batch = action.get("orders") or action.get("cancels") or action.get("modifies") or []
+    return 1 + len(batch) // 40
+
+
+class RateLimiter(BaseRateLimiter):
+    """Ограничитель частоты запросов Hyperliquid — 1200 единиц веса в минуту на IP.
+
+    https://hyperliquid.gitbook.io/hyperliquid-docs/for-developers/api/rate-limits-and-user-limits
+    """
+
+    BUCKETS = {"default": (1200, 60)}
+
+    ENDPOINT_WEIGHTS = {
+        "/info": _info_weight,
+        "/exchange": _exchange_weight,
+    }
@@ -1,10 +1,22 @@
 __all__ = ["UniClient"]
 
+from concurrent.futures import Executor
 from typing import Self, overload
 
 import aiohttp
 
 from unicex._abc import IUniClient
+from unicex._base import (
+    BaseRateLimiter,
+    ClockSync,
+    HedgePolicy,
+    KeepWarm,
+    ProxyPool,
+    RequestHooks,
+    ResponseCache,
+    RetryPolicy,
+    SessionPool,
+)
 from unicex.enums import Exchange, MarginType, MarketType, OrderSide, OrderType, Timeframe
 from unicex.types import (
     BestBidAskDict,
@@ -38,8 +50,17 @@ class UniClient(IUniClient[Client]):
         logger: LoggerLike | None = None,
         max_retries: int = 3,
         retry_delay: int | float = 0.1,
-        proxies: list[str] | None = None,
+        proxies: list[str] | ProxyPool | None = None,
         timeout: int = 10,
+        rate_limiter: BaseRateLimiter | None = None,
+        single_flight: bool = False,
+        cache: ResponseCache | None = None,
+        retry_policy: RetryPolicy | None = None,
+        hedge: HedgePolicy | None = None,
+        hooks: list[RequestHooks] | None = None,
+        clock_sync: ClockSync | None = None,
+        keep_warm: KeepWarm | None = None,
+        signing_executor: Executor | None = None,
     ) -> None:
         """Инициализация клиента.
 
@@ -53,6 +74,15 @@ class UniClient(IUniClient[Client]):
             retry_delay (`int | float`): Задержка между повторными попытками, сек.
             proxies (`list[str] | None`): Список HTTP(S)‑прокси для циклического использования.
             timeout (`int`): Максимальное время ожидания ответа от сервера, сек.
+            rate_limiter (`BaseRateLimiter | None`): Ограничитель частоты запросов (например, `RateLimiter.shared()` биржи). Если не передан — запросы не ограничиваются.
+            single_flight (`bool`): Объединять одновременные одинаковые GET-запросы в один сетевой вызов с общим результатом.
+            cache (`ResponseCache | None`): Кэш ответов публичных эндпоинтов (например, `ResponseCache()`). Если не передан — ответы не кэшируются.
+            retry_policy (`RetryPolicy | None`): Политика повторов (backoff, jitter, `Retry-After`, предохранитель). Если не передана — собирается из `max_retries` и `retry_delay`.
+            hedge (`HedgePolicy | None`): Политика хеджирования GET-запросов: дубль запроса после перцентиля недавних задержек. Если не передана — запросы не хеджируются.
+            hooks (`list[RequestHooks] | None`): Обработчики событий жизненного цикла запросов (например, `LatencyHistogram()`).
+            clock_sync (`ClockSync | None`): Синхронизация часов с сервером Hyperliquid для подписи действий (например, `ClockSync.shared("hyperliquid")`). Если не передана — используется локальное время.
+            keep_warm (`KeepWarm | None`): Прогрев и поддержание открытых соединений к хостам биржи (например, `KeepWarm(connections=2)`), запускается через `warm_up()`. Если не передан — `warm_up()` использует настройки по умолчанию.
+            signing_executor (`Executor | None`): Пул для подписи действий вне event loop (например, `ProcessPoolExecutor()` для параллельной подписи). Если не передан — подпись выполняется в event loop.
         """
         self._client: Client = self._client_cls(
             private_key=private_key,
@@ -64,6 +94,15 @@ class UniClient(IUniClient[Client]):
             retry_delay=retry_delay,
             proxies=proxies,
             timeout=timeout,
+            rate_limiter=rate_limiter,
+            single_flight=single_flight,
+            cache=cache,
+            retry_policy=retry_policy,
+            hedge=hedge,
+            hooks=hooks,
+            clock_sync=clock_sync,
+            keep_warm=keep_warm,
+            signing_executor=signing_executor,
         )
 
     @classmethod
@@ -75,11 +114,20 @@ class UniClient(IUniClient[Client]):
         logger: LoggerLike | None = None,
         max_retries: int = 3,
         retry_delay: int | float = 0.1,
-        proxies: list[str] | None = None,
+        proxies: list[str] | ProxyPool | None = None,
         timeout: int = 10,
+        rate_limiter: BaseRateLimiter | None = None,
+        single_flight: bool = False,
+        cache: ResponseCache | None = None,
+        retry_policy: RetryPolicy | None = None,
+        hedge: HedgePolicy | None = None,
+        hooks: list[RequestHooks] | None = None,
+        clock_sync: ClockSync | None = None,
+        keep_warm: KeepWarm | None = None,
+        signing_executor: Executor | None = None,
     ) -> Self:
         return cls(
-            session=aiohttp.ClientSession(),
+            session=SessionPool.acquire(SessionPool.key_for(cls)),
             private_key=private_key,
             wallet_address=wallet_address,
             vault_address=vault_address,
@@ -88,8 +136,23 @@ class UniClient(IUniClient[Client]):
             retry_delay=retry_delay,
             proxies=proxies,
             timeout=timeout,
+            rate_limiter=rate_limiter,
+            single_flight=single_flight,
+            cache=cache,
+            retry_policy=retry_policy,
+            hedge=hedge,
+            hooks=hooks,
+            clock_sync=clock_sync,
+            keep_warm=keep_warm,
+            signing_executor=signing_executor,
         )
 
+    _KLINES_PAGE_SIZE = 5000
+    """Лимит свечей в `candleSnapshot`."""
+
+    _FUTURES_KLINES_PAGE_SIZE = 5000
+    """Лимит свечей в `candleSnapshot`."""
+
     @property
     def _client_cls(self) -> type[Client]:
         return Client
@@ -187,6 +250,23 @@ class UniClient(IUniClient[Client]):
         adapted_klines = Adapter.futures_klines(raw_data)
         return adapted_klines[-limit:] if limit else adapted_klines
 
+    async def _klines_page(
+        self,
+        symbol: str,
+        interval: Timeframe,
+        start_time: int,
+        end_time: int,
+        futures: bool,
+    ) -> list[KlineDict]:
+        fetch = self.futures_klines if futures else self.klines
+        # limit не передаем: он перезаписывает start_time и end_time
+        return await fetch(
+            symbol=symbol,
+            interval=interval,
+            start_time=start_time,
+            end_time=end_time,
+        )
+
     @overload
     async def funding_rate(self, symbol: str) -> float: ...
 
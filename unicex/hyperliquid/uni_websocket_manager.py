@@ -144,11 +144,13 @@ class UniWebsocketManager(IUniWebsocketManager):
             ),
             callback,
         )
-        return self._websocket_manager.bbo(
+        websocket = self._websocket_manager.bbo(
             callback=wrapper,
             coin=symbol,
             coins=list(symbols) if symbols else None,
         )
+        websocket.set_default_overflow_policy("conflate")
+        return websocket
 
     def futures_partial_book_depth(
         self,
@@ -170,8 +172,10 @@ class UniWebsocketManager(IUniWebsocketManager):
             ),
             callback,
         )
-        return self._websocket_manager.l2_book(
+        websocket = self._websocket_manager.l2_book(
             callback=wrapper,
             coin=symbol,
             coins=list(symbols) if symbols else None,
         )
+        websocket.set_default_overflow_policy("conflate")
+        return websocket
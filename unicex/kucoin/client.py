@@ -14,6 +14,12 @@ class Client(BaseClient):
     _BASE_URL: str = "https://api.kucoin.com"
     """Базовый URL для запросов."""
 
+    _KEEP_WARM_URLS: tuple[str, ...] = ("https://api.kucoin.com/api/v1/timestamp",)
+    """Эндпоинты для прогрева соединений (ping/время сервера)."""
+
+    _RETRYABLE_CODES: frozenset[str] = frozenset({"429000", "500000"})
+    """Коды временных ошибок Kucoin: превышение лимита, внутренняя ошибка."""
+
     async def _make_request(
         self,
         method: RequestMethod,
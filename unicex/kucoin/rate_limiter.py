@@ -0,0 +1,30 @@
+__all__ = ["RateLimiter"]
+
+from collections.abc import Mapping
+
+from unicex._base import BaseRateLimiter
+
+
+class RateLimiter(BaseRateLimiter):
+    """Ограничитель частоты запросов Kucoin — публичный пул 2000 единиц веса за 30 секунд.
+
+    Остаток калибруется по заголовку `gw-ratelimit-remaining`.
+
+    https://www.kucoin.com/docs-new/rate-limit
+    """
+
+    BUCKETS = {"default": (2000, 30)}
+
+    ENDPOINT_WEIGHTS = {
+        "/api/ua/v1/market/instrument": 4,
+        "/api/ua/v1/market/ticker": 15,
+        "/api/ua/v1/market/kline": 3,
+        "/api/ua/v1/market/open-interest": 5,
+        "/api/ua/v1/market/funding-rate": 5,
+        "/api/ua/v1/market/funding-rate-history": 5,
+    }
+
+    def _calibrate(self, host: str, path: str, headers: Mapping[str, str]) -> None:
+        remaining = headers.get("gw-ratelimit-remaining")
+        if remaining is not None:
+            self._host_bucket(host).set_remaining(float(remaining))
@@ -26,6 +26,12 @@ from .client import Client
 class UniClient(IUniClient[Client]):
     """Унифицированный клиент для работы с Kucoin API."""
 
+    _KLINES_PAGE_SIZE = 500
+    """Лимит свечей в `/api/ua/v1/market/kline`."""
+
+    _FUTURES_KLINES_PAGE_SIZE = 500
+    """Лимит свечей в `/api/ua/v1/market/kline`."""
+
     @property
     def _client_cls(self) -> type[Client]:
         return Client
@@ -116,6 +122,23 @@ class UniClient(IUniClient[Client]):
         )
         return Adapter.klines(raw_data=raw_data, symbol=symbol)
 
+    async def _klines_page(
+        self,
+        symbol: str,
+        interval: Timeframe,
+        start_time: int,
+        end_time: int,
+        futures: bool,
+    ) -> list[KlineDict]:
+        fetch = self.futures_klines if futures else self.klines
+        # limit не передаем: он перезаписывает start_time и end_time
+        return await fetch(
+            symbol=symbol,
+            interval=interval,
+            start_time=start_time,
+            end_time=end_time,
+        )
+
     async def funding_rate(self, symbol: str | None = None) -> dict[str, float] | float:
         if not symbol:
             raise ValueError("Symbol is required to fetch Kucoin funding rate")
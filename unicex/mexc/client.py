@@ -1,13 +1,12 @@
 __all__ = ["Client"]
 
 
-import time
 from typing import Any
 
 from unicex._base import BaseClient
 from unicex.exceptions import NotAuthorized
 from unicex.types import NumberLike, RequestMethod
-from unicex.utils import dict_to_query_string, filter_params, generate_hmac_sha256_signature
+from unicex.utils import dict_to_query_string, filter_params
 
 
 class Client(BaseClient):
@@ -19,9 +18,18 @@ class Client(BaseClient):
     _BASE_FUTURES_URL: str = "https://contract.mexc.com"
     """Базовый URL для фьючерсного REST API MEXC."""
 
+    _KEEP_WARM_URLS: tuple[str, ...] = (
+        "https://api.mexc.com/api/v3/ping",
+        "https://contract.mexc.com/api/v1/contract/ping",
+    )
+    """Эндпоинты для прогрева соединений (ping/время сервера)."""
+
     _RECV_WINDOW: str = "5000"
     """Стандартный интервал времени для получения ответа от сервера."""
 
+    _RETRYABLE_CODES: frozenset[str] = frozenset({"510", "9999"})
+    """Коды временных ошибок MEXC: слишком частые запросы, общая внутренняя ошибка."""
+
     def _get_headers(self, signed: bool = False) -> dict:
         """Формирует заголовки запроса."""
         headers = {"Content-Type": "application/json"}
@@ -37,11 +45,11 @@ class Client(BaseClient):
             raise NotAuthorized("Api key and api secret is required to private endpoints")
 
         query_string = dict_to_query_string(payload)
-        return generate_hmac_sha256_signature(
-            self._api_secret,  # type: ignore[attr-defined]
-            query_string,
-            "hex",
-        )
+        return self._hmac_signer.hexdigest(query_string)  # type: ignore[union-attr]
+
+    async def _fetch_server_time(self) -> int:
+        """Возвращает серверное время MEXC в миллисекундах (для `ClockSync`)."""
+        return (await self.server_time())["serverTime"]
 
     async def _make_request(
         self,
@@ -74,7 +82,7 @@ class Client(BaseClient):
         # Генериуем подпись, если запрос авторизованый
         if signed:
             # Генерируем подпись
-            payload["timestamp"] = int(time.time() * 1000)
+            payload["timestamp"] = self._server_timestamp()
             payload["recvWindow"] = self._RECV_WINDOW
             payload["signature"] = self._generate_signature(payload)
 
@@ -86,6 +94,7 @@ class Client(BaseClient):
             url=url,
             params=payload,
             headers=headers,
+            signed=signed,
         )
 
     async def request(self, method: RequestMethod, url: str, params: dict, signed: bool) -> dict:
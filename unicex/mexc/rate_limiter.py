@@ -0,0 +1,33 @@
+__all__ = ["RateLimiter"]
+
+from unicex._base import BaseRateLimiter
+
+
+class RateLimiter(BaseRateLimiter):
+    """Ограничитель частоты запросов Mexc.
+
+    Спот — 500 единиц веса за 10 секунд на IP, фьючерсы — 20 запросов за 2 секунды.
+
+    https://mexcdevelop.github.io/apidocs/spot_v3_en/#limits
+    https://mexcdevelop.github.io/apidocs/contract_v1_en/#access-restriction-rules
+    """
+
+    BUCKETS = {
+        "spot": (500, 10),
+        "futures": (20, 2),
+        "default": (20, 2),
+    }
+
+    HOST_BUCKETS = {
+        "api.mexc.com": "spot",
+        "contract.mexc.com": "futures",
+    }
+
+    ENDPOINT_WEIGHTS = {
+        "/api/v3/exchangeInfo": 10,
+        "/api/v3/depth": 5,
+        "/api/v3/ticker/24hr": 40,
+        "/api/v3/ticker/price": 2,
+        "/api/v3/ticker/bookTicker": 2,
+        "/api/v3/account": 10,
+    }
@@ -27,6 +27,12 @@ from .client import Client
 class UniClient(IUniClient[Client]):
     """Унифицированный клиент для работы с Mexc API."""
 
+    _KLINES_PAGE_SIZE = 1000
+    """Лимит свечей в `/api/v3/klines`."""
+
+    _FUTURES_KLINES_PAGE_SIZE = 2000
+    """Лимит свечей в `/api/v1/contract/kline`."""
+
     @property
     def _client_cls(self) -> type[Client]:
         return Client
@@ -102,11 +108,29 @@ class UniClient(IUniClient[Client]):
         raw_data = await self._client.futures_kline(
             symbol=symbol,
             interval=interval,
-            start=start_time,
-            end=end_time,
+            start=self.to_seconds(start_time),
+            end=self.to_seconds(end_time),
         )
         return Adapter.futures_klines(raw_data=raw_data, symbol=symbol)
 
+    async def _klines_page(
+        self,
+        symbol: str,
+        interval: Timeframe,
+        start_time: int,
+        end_time: int,
+        futures: bool,
+    ) -> list[KlineDict]:
+        if not futures:
+            return await super()._klines_page(symbol, interval, start_time, end_time, futures)
+        # limit не передаем: он перезаписывает start_time и end_time
+        return await self.futures_klines(
+            symbol=symbol,
+            interval=interval,
+            start_time=start_time,
+            end_time=end_time,
+        )
+
     @overload
     async def funding_rate(self, symbol: str) -> float: ...
 
@@ -0,0 +1,133 @@
+"""Модуль, который предоставляет клиент для одновременных запросов к нескольким биржам."""
+
+__all__ = ["MultiExchangeClient", "MultiExchangeResult"]
+
+import asyncio
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any, Self
+
+from ._abc import IUniClient
+from .enums import Exchange
+from .mapper import get_uni_client
+
+
+@dataclass
+class MultiExchangeResult[T]:
+    """Результат одного унифицированного вызова на нескольких биржах."""
+
+    results: dict[Exchange, T] = field(default_factory=dict)
+    """Ответы бирж, успевших до дедлайна."""
+
+    errors: dict[Exchange, Exception] = field(default_factory=dict)
+    """Ошибки бирж, включая `TimeoutError` для не успевших до дедлайна."""
+
+    timings: dict[Exchange, float] = field(default_factory=dict)
+    """Время вызова на каждой бирже, сек. Для не успевших — время до дедлайна."""
+
+    timed_out: list[Exchange] = field(default_factory=list)
+    """Биржи, не успевшие до дедлайна."""
+
+
+class MultiExchangeClient:
+    """Клиент для одновременного вызова унифицированного метода на нескольких биржах.
+
+    Все биржи опрашиваются одновременно, поэтому медленная биржа не задерживает остальные:
+    по истечении дедлайна возвращается все, что успело прийти, а незавершенные вызовы
+    отменяются. Клиенты, созданные через `create`, используют общие сессии `SessionPool`.
+    """
+
+    def __init__(self, clients: dict[Exchange, IUniClient]) -> None:
+        """Инициализирует клиент.
+
+        Параметры:
+            clients (`dict[Exchange, IUniClient]`): Унифицированные клиенты бирж.
+        """
+        self._clients = clients
+
+    @classmethod
+    async def create(cls, exchanges: Iterable[Exchange] | None = None, **kwargs: Any) -> Self:
+        """Создает унифицированные клиенты бирж через `get_uni_client`.
+
+        Параметры:
+            exchanges (`Iterable[Exchange] | None`): Биржи. По умолчанию — все поддерживаемые.
+            **kwargs: Аргументы `IUniClient.create`, общие для всех бирж (например, `timeout`, `hooks`).
+
+        Возвращает:
+            `MultiExchangeClient`: Созданный клиент.
+        """
+        exchanges = list(Exchange) if exchanges is None else list(exchanges)
+        clients = await asyncio.gather(
+            *(get_uni_client(exchange).create(**kwargs) for exchange in exchanges)
+        )
+        return cls(dict(zip(exchanges, clients, strict=True)))
+
+    @property
+    def clients(self) -> dict[Exchange, IUniClient]:
+        """Возвращает унифицированные клиенты бирж."""
+        return self._clients
+
+    async def call(
+        self,
+        method: str,
+        *args: Any,
+        deadline: float | None = None,
+        exchanges: Iterable[Exchange] | None = None,
+        **kwargs: Any,
+    ) -> MultiExchangeResult[Any]:
+        """Вызывает унифицированный метод на всех биржах одновременно.
+
+        Параметры:
+            method (`str`): Имя метода `IUniClient`, например "funding_info" или "open_interest".
+            *args: Позиционные аргументы метода.
+            deadline (`float | None`): Общий дедлайн, сек. None — ждать все биржи.
+            exchanges (`Iterable[Exchange] | None`): Подмножество бирж. По умолчанию — все клиенты.
+            **kwargs: Именованные аргументы метода.
+
+        Возвращает:
+            `MultiExchangeResult`: Ответы, ошибки и время вызова по каждой бирже.
+        """
+        selected = self._clients if exchanges is None else {e: self._clients[e] for e in exchanges}
+        result: MultiExchangeResult[Any] = MultiExchangeResult()
+
+        async def timed(exchange: Exchange, client: IUniClient) -> Any:
+            started = time.perf_counter()
+            try:
+                return await getattr(client, method)(*args, **kwargs)
+            finally:
+                result.timings[exchange] = time.perf_counter() - started
+
+        tasks = {
+            asyncio.create_task(timed(exchange, client)): exchange
+            for exchange, client in selected.items()
+        }
+        if not tasks:
+            return result
+
+        done, pending = await asyncio.wait(tasks, timeout=deadline)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        for task, exchange in tasks.items():
+            if task in pending:
+                result.timed_out.append(exchange)
+                result.errors[exchange] = TimeoutError(f"Deadline {deadline}s exceeded")
+            elif (error := task.exception()) is not None:
+                result.errors[exchange] = error  # type: ignore[assignment]
+            else:
+                result.results[exchange] = task.result()
+        return result
+
+    async def close_connection(self) -> None:
+        """Закрывает сессии всех клиентов."""
+        await asyncio.gather(*(client.close_connection() for client in self._clients.values()))
+
+    async def __aenter__(self) -> Self:
+        """Вход в асинхронный контекст."""
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        """Выход из асинхронного контекста."""
+        await self.close_connection()
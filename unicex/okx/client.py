@@ -7,7 +7,7 @@ from typing import Any, Literal
 from unicex._base import BaseClient
 from unicex.exceptions import NotAuthorized
 from unicex.types import NumberLike, RequestMethod
-from unicex.utils import filter_params, generate_hmac_sha256_signature
+from unicex.utils import filter_params
 
 
 class Client(BaseClient):
@@ -16,6 +16,12 @@ class Client(BaseClient):
     _BASE_URL: str = "https://www.okx.com"
     """Базовый URL для REST API OKX."""
 
+    _KEEP_WARM_URLS: tuple[str, ...] = ("https://www.okx.com/api/v5/public/time",)
+    """Эндпоинты для прогрева соединений (ping/время сервера)."""
+
+    _RETRYABLE_CODES: frozenset[str] = frozenset({"50001", "50004", "50011", "50013", "50026"})
+    """Коды временных ошибок OKX: сервис недоступен, таймаут, превышение лимита, система занята, системная ошибка."""
+
     def is_authorized(self) -> bool:
         """Проверяет наличие API‑ключей у клиента.
 
@@ -34,7 +40,9 @@ class Client(BaseClient):
         Возвращает:
             `str`: Временная метка в формате ISO с миллисекундами и суффиксом Z.
         """
-        now = datetime.datetime.now(tz=datetime.UTC).replace(tzinfo=None)
+        now = datetime.datetime.fromtimestamp(self._server_time(), tz=datetime.UTC).replace(
+            tzinfo=None
+        )
         timestamp = now.isoformat("T", "milliseconds")
         return timestamp + "Z"
 
@@ -81,11 +89,7 @@ class Client(BaseClient):
 
         # Создаем строку для подписи: timestamp + method + requestPath + body
         prehash = f"{timestamp}{method}{endpoint}{query_string}{body_str}"
-        signature = generate_hmac_sha256_signature(
-            self._api_secret,  # type: ignore[arg-type]
-            prehash,
-            "base64",
-        )
+        signature = self._hmac_signer.b64digest(prehash)  # type: ignore[union-attr]
         return timestamp, signature
 
     def _get_headers(self, timestamp: str, signature: str) -> dict[str, str]:
@@ -154,6 +158,10 @@ class Client(BaseClient):
             headers = self._get_headers(timestamp, signature)
         return url, params, body, headers
 
+    async def _fetch_server_time(self) -> int:
+        """Возвращает серверное время OKX в миллисекундах (для `ClockSync`)."""
+        return int((await self.get_system_time())["data"][0]["ts"])
+
     async def _make_request(
         self,
         method: RequestMethod,
@@ -195,6 +203,7 @@ class Client(BaseClient):
             params=params,
             data=data,
             headers=headers,
+            signed=signed,
         )
 
     async def request(
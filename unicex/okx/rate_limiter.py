@@ -0,0 +1,38 @@
+__all__ = ["RateLimiter"]
+
+from unicex._base import BaseRateLimiter
+
+
+class RateLimiter(BaseRateLimiter):
+    """Ограничитель частоты запросов OKX.
+
+    OKX задает лимиты для каждого эндпоинта отдельно (обычно N запросов за 2 секунды)
+    и не возвращает заголовков с остатком бюджета.
+
+    https://www.okx.com/docs-v5/en/#overview-rate-limits
+    """
+
+    BUCKETS = {"default": (50, 1)}
+
+    ENDPOINT_LIMITS = {
+        "/api/v5/public/instruments": (20, 2),
+        "/api/v5/public/open-interest": (20, 2),
+        "/api/v5/public/funding-rate": (20, 2),
+        "/api/v5/public/mark-price": (10, 2),
+        "/api/v5/public/time": (10, 2),
+        "/api/v5/market/tickers": (20, 2),
+        "/api/v5/market/ticker": (20, 2),
+        "/api/v5/market/books": (40, 2),
+        "/api/v5/market/candles": (40, 2),
+        "/api/v5/market/history-candles": (20, 2),
+        "/api/v5/market/trades": (100, 2),
+        "/api/v5/trade/order": (60, 2),
+        "/api/v5/trade/batch-orders": (300, 2),
+        "/api/v5/trade/cancel-order": (60, 2),
+        "/api/v5/trade/cancel-batch-orders": (300, 2),
+        "/api/v5/trade/amend-order": (60, 2),
+        "/api/v5/trade/orders-pending": (60, 2),
+        "/api/v5/account/balance": (10, 2),
+        "/api/v5/account/positions": (10, 2),
+        "/api/v5/account/set-leverage": (20, 2),
+    }
@@ -27,6 +27,12 @@ from .client import Client
 class UniClient(IUniClient[Client]):
     """Унифицированный клиент для работы с Okx API."""
 
+    _KLINES_PAGE_SIZE = 100
+    """Лимит свечей в `/api/v5/market/history-candles`."""
+
+    _FUTURES_KLINES_PAGE_SIZE = 100
+    """Лимит свечей в `/api/v5/market/history-candles`."""
+
     @property
     def _client_cls(self) -> type[Client]:
         return Client
@@ -99,6 +105,25 @@ class UniClient(IUniClient[Client]):
         )
         return Adapter.klines(raw_data=raw_data, symbol=symbol)
 
+    async def _klines_page(
+        self,
+        symbol: str,
+        interval: Timeframe,
+        start_time: int,
+        end_time: int,
+        futures: bool,
+    ) -> list[KlineDict]:
+        # /market/candles хранит только последние 1440 свечей, поэтому история берется
+        # из /market/history-candles. after — свечи старше метки, before — новее.
+        raw_data = await self._client.get_candlesticks_history(
+            inst_id=symbol,
+            bar=interval.to_exchange_format(Exchange.OKX),
+            after=end_time + 1,
+            before=start_time - 1,
+            limit=self._KLINES_PAGE_SIZE,
+        )
+        return Adapter.klines(raw_data=raw_data, symbol=symbol)
+
     @overload
     async def funding_rate(self, symbol: str) -> float: ...
 
@@ -130,11 +130,13 @@ class UniWebsocketManager(IUniWebsocketManager):
     ) -> Websocket:
         inst_id = self._normalize_symbol(symbol, symbols)
         wrapper = self._make_wrapper(self._adapter.futures_best_bid_ask_message, callback)
-        return self._websocket_manager.order_book(
+        websocket = self._websocket_manager.order_book(
             callback=wrapper,
             channel="bbo-tbt",
             inst_id=inst_id,
         )
+        websocket.set_default_overflow_policy("conflate")
+        return websocket
 
     def futures_partial_book_depth(
         self,
@@ -154,8 +156,12 @@ class UniWebsocketManager(IUniWebsocketManager):
 
         inst_id = self._normalize_symbol(symbol, symbols)
         wrapper = self._make_wrapper(self._adapter.futures_partial_book_depth_message, callback)
-        return self._websocket_manager.order_book(
+        websocket = self._websocket_manager.order_book(
             callback=wrapper,
             channel=channel_by_limit[limit],  # type: ignore[arg-type]
             inst_id=inst_id,
         )
+        # Каналы books50-l2-tbt и books-l2-tbt присылают дельты, их схлопывать нельзя
+        if limit in (1, 5):
+            websocket.set_default_overflow_policy("conflate")
+        return websocket
@@ -6,6 +6,8 @@ __all__ = [
     "KlineDict",
     "TradeDict",
     "RequestMethod",
+    "OverflowPolicy",
+    "DispatchMode",
     "LoggerLike",
     "NumberLike",
     "OpenInterestDict",
@@ -33,6 +35,12 @@ type LoggerLike = LoggingLogger | loguru.Logger
 type RequestMethod = Literal["GET", "POST", "PUT", "DELETE", "PATCH"]
 """Типы методов HTTP запросов."""
 
+type OverflowPolicy = Literal["block", "drop_oldest", "drop_newest", "conflate", "spill"]
+"""Политика переполнения очереди сообщений вебсокета."""
+
+type DispatchMode = Literal["queue", "sharded", "inline"]
+"""Способ передачи сообщений вебсокета в callback: через общую очередь, через очереди воркеров по ключу или прямо из цикла чтения."""
+
 type NumberLike = str | int | float
 """
 Числовое значение для аргументов API-клиентов.
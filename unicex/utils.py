@@ -19,11 +19,12 @@ import base64
 import hashlib
 import hmac
 import json
+import re
 import time
 from collections.abc import Callable, Iterable, Sequence
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Any, Literal
-from urllib.parse import urlencode
+from urllib.parse import quote_plus, urlencode
 
 from unicex.enums import Exchange, MarketType
 from unicex.exceptions import AdapterError
@@ -66,23 +67,46 @@ def sort_params_by_alphabetical_order(params: dict) -> dict:
     return dict(sorted(params.items()))
 
 
+_is_url_safe = re.compile(r"[A-Za-z0-9_.\-~]*").fullmatch
+"""Проверяет, что строка состоит только из символов, которые не кодируются в URL."""
+
+
+@lru_cache(maxsize=1024)
+def _quote_key(key: Any) -> str:
+    """Кодирует ключ query string. Набор ключей ограничен, поэтому результат кэшируется."""
+    return quote_plus(str(key))
+
+
 def dict_to_query_string(params: dict) -> str:
     """Преобразует словарь параметров в query string для URL.
 
     - Списки и словари автоматически сериализуются в JSON.
     - Используется стандартная urlencode кодировка.
 
+    Строка собирается за один проход: целые числа и строки без спецсимволов не проходят
+    через `quote_plus`. Результат совпадает с `urlencode(..., doseq=True)`.
+
     Параметры:
         params (`dict`): Словарь параметров запроса.
 
     Возвращает:
         `str`: Строка параметров, готовая для использования в URL.
     """
-    processed = {
-        k: json.dumps(v, separators=(",", ":")) if isinstance(v, list | dict) else v
-        for k, v in params.items()
-    }
-    return urlencode(processed, doseq=True)
+    parts = []
+    for key, value in params.items():
+        if isinstance(value, int) and not isinstance(value, bool):
+            encoded = str(value)
+        elif isinstance(value, str | float):
+            # У float бывает экспонента со знаком: 1e+20 кодируется как 1e%2B20
+            text = str(value)
+            encoded = text if _is_url_safe(text) else quote_plus(text)
+        elif isinstance(value, list | dict):
+            encoded = quote_plus(json.dumps(value, separators=(",", ":")))
+        else:
+            parts.append(urlencode({key: value}, doseq=True))
+            continue
+        parts.append(f"{_quote_key(key)}={encoded}")
+    return "&".join(parts)
 
 
 def generate_hmac_sha256_signature(